@@ -24,6 +24,9 @@ def _deepcopy_tuple(obj, memo, _id):
     _append = ans.append
     unchanged = True
     for item in obj:
+        if item.__class__ in _atomic_types:
+            _append(item)
+            continue
         new_item = fast_deepcopy(item, memo)
         _append(new_item)
         if new_item is not item:
@@ -378,7 +381,14 @@ class AutoSlots(type):
 
             memo_size = len(memo)
             try:
-                new_state = [fast_deepcopy(field, memo) for field in state]
+                new_state = [
+                    (
+                        field
+                        if field.__class__ in _atomic_types
+                        else fast_deepcopy(field, memo)
+                    )
+                    for field in state
+                ]
             except:
                 # We hit an error deepcopying the state.  Attempt to
                 # reset things and try again, but in a more cautious
@@ -12,6 +12,8 @@
 
 from typing import Tuple, Dict, Any, List, Sequence, Optional, Mapping, NoReturn
 import io
+from itertools import islice
+from operator import truediv
 
 from pyomo.core.base.constraint import ConstraintData
 from pyomo.core.base.var import VarData
@@ -62,16 +64,11 @@ class SolSolutionLoader(SolutionLoaderBase):
         if self._sol_data is None:
             assert len(self._nl_info.variables) == 0
         else:
+            primals = self._sol_data.primals
             if self._nl_info.scaling:
-                for var, val, scale in zip(
-                    self._nl_info.variables,
-                    self._sol_data.primals,
-                    self._nl_info.scaling.variables,
-                ):
-                    var.set_value(val / scale, skip_validation=True)
-            else:
-                for var, val in zip(self._nl_info.variables, self._sol_data.primals):
-                    var.set_value(val, skip_validation=True)
+                primals = map(truediv, primals, self._nl_info.scaling.variables)
+            for var, val in zip(self._nl_info.variables, primals):
+                var.set_value(val, skip_validation=True)
 
         for var, v_expr in self._nl_info.eliminated_vars:
             var.value = value(v_expr)
@@ -90,14 +87,10 @@ class SolSolutionLoader(SolutionLoaderBase):
         if self._sol_data is None:
             assert len(self._nl_info.variables) == 0
         else:
-            if self._nl_info.scaling is None:
-                scale_list = [1] * len(self._nl_info.variables)
-            else:
-                scale_list = self._nl_info.scaling.variables
-            for var, val, scale in zip(
-                self._nl_info.variables, self._sol_data.primals, scale_list
-            ):
-                val_map[id(var)] = val / scale
+            primals = self._sol_data.primals
+            if self._nl_info.scaling is not None:
+                primals = map(truediv, primals, self._nl_info.scaling.variables)
+            val_map.update(zip(map(id, self._nl_info.variables), primals))
 
         for var, v_expr in self._nl_info.eliminated_vars:
             val = replace_expressions(v_expr, substitution_map=val_map)
@@ -151,6 +144,24 @@ class SolSolutionLoader(SolutionLoaderBase):
         return res
 
 
+def _read_lines(sol_file, n):
+    """Read the next ``n`` lines from ``sol_file`` as a single block
+
+    Pulling the block out of the file at once (rather than through
+    ``n`` calls to ``readline()``) lets the callers convert the values
+    in bulk, which is significantly faster for the large value blocks
+    in a .sol file.
+
+    """
+    lines = list(islice(sol_file, n))
+    if len(lines) != n:
+        raise PyomoException(
+            f"ERROR READING `sol` FILE. Expected {n} lines of values; "
+            f"file ended after {len(lines)}."
+        )
+    return lines
+
+
 def parse_sol_file(
     sol_file: io.TextIOBase, nl_info: NLWriterInfo, result: Results
 ) -> Tuple[Results, SolFileData]:
@@ -203,8 +214,10 @@ def parse_sol_file(
     assert number_of_cons == len(nl_info.constraints)
     assert number_of_vars == len(nl_info.variables)
 
-    duals = [float(sol_file.readline()) for i in range(number_of_cons)]
-    variable_vals = [float(sol_file.readline()) for i in range(number_of_vars)]
+    # The dual and primal blocks are one value per line: parse each
+    # block in bulk instead of line-by-line
+    duals = list(map(float, _read_lines(sol_file, number_of_cons)))
+    variable_vals = list(map(float, _read_lines(sol_file, number_of_vars)))
 
     # Parse the exit code line and capture it
     exit_code = [0, 0]
@@ -297,37 +310,23 @@ def parse_sol_file(
             # Add any arbitrary string lines to the "other" list
             for line in range(number_of_string_lines):
                 sol_data.other.append(sol_file.readline())
-            if data_type == 0:  # Var
-                sol_data.var_suffixes[suffix_name] = {}
-                for cnt in range(number_of_entries):
-                    suf_line = sol_file.readline().split()
-                    var_ndx = int(suf_line[0])
-                    sol_data.var_suffixes[suffix_name][var_ndx] = convert_function(
-                        suf_line[1]
-                    )
-            elif data_type == 1:  # Con
-                sol_data.con_suffixes[suffix_name] = {}
-                for cnt in range(number_of_entries):
-                    suf_line = sol_file.readline().split()
-                    con_ndx = int(suf_line[0])
-                    sol_data.con_suffixes[suffix_name][con_ndx] = convert_function(
-                        suf_line[1]
-                    )
-            elif data_type == 2:  # Obj
-                sol_data.obj_suffixes[suffix_name] = {}
-                for cnt in range(number_of_entries):
-                    suf_line = sol_file.readline().split()
-                    obj_ndx = int(suf_line[0])
-                    sol_data.obj_suffixes[suffix_name][obj_ndx] = convert_function(
-                        suf_line[1]
-                    )
-            elif data_type == 3:  # Prob
-                sol_data.problem_suffixes[suffix_name] = []
-                for cnt in range(number_of_entries):
-                    suf_line = sol_file.readline().split()
-                    sol_data.problem_suffixes[suffix_name].append(
-                        convert_function(suf_line[1])
-                    )
+            # Each entry is an "index value" pair: split the whole
+            # block at once and convert the two columns in bulk
+            entries = ''.join(_read_lines(sol_file, number_of_entries)).split()
+            if data_type == 3:  # Prob
+                sol_data.problem_suffixes[suffix_name] = list(
+                    map(convert_function, entries[1::2])
+                )
+            else:
+                suffix = dict(
+                    zip(map(int, entries[0::2]), map(convert_function, entries[1::2]))
+                )
+                if data_type == 0:  # Var
+                    sol_data.var_suffixes[suffix_name] = suffix
+                elif data_type == 1:  # Con
+                    sol_data.con_suffixes[suffix_name] = suffix
+                else:  # Obj
+                    sol_data.obj_suffixes[suffix_name] = suffix
             line = sol_file.readline()
 
     return result, sol_data
@@ -9,12 +9,24 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import io
+import os
+
+import pyomo.environ as pyo
 from pyomo.common import unittest
+from pyomo.common.errors import PyomoException
 from pyomo.common.fileutils import this_file_dir
 from pyomo.common.tempfiles import TempfileManager
-from pyomo.contrib.solver.solvers.sol_reader import SolFileData
+from pyomo.contrib.solver.common.results import Results, SolutionStatus
+from pyomo.contrib.solver.solvers.sol_reader import (
+    SolFileData,
+    SolSolutionLoader,
+    parse_sol_file,
+)
+from pyomo.repn.plugins.nl_writer import NLWriter
 
 currdir = this_file_dir()
+sol_files = os.path.join(os.path.dirname(currdir), 'unit', 'sol_files')
 
 
 class TestSolFileData(unittest.TestCase):
@@ -49,3 +61,55 @@ class TestSolParser(unittest.TestCase):
 
     def test_infeasible2(self):
         pass
+
+    def _make_model(self, scale=False):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var()
+        m.c = pyo.Constraint(expr=m.x >= 1)
+        m.o = pyo.Objective(expr=m.x)
+        if scale:
+            m.scaling_factor = pyo.Suffix(direction=pyo.Suffix.EXPORT)
+            m.scaling_factor[m.x] = 4
+            m.scaling_factor[m.c] = 2
+        nl_info = NLWriter().write(
+            m, io.StringIO(), scale_model=scale, linear_presolve=False
+        )
+        return m, nl_info
+
+    def test_parse_values_and_suffixes(self):
+        m, nl_info = self._make_model()
+        with open(os.path.join(sol_files, 'conopt_optimal.sol')) as FILE:
+            result, sol_data = parse_sol_file(FILE, nl_info, Results())
+        self.assertEqual(result.solution_status, SolutionStatus.optimal)
+        self.assertEqual(sol_data.duals, [1.0])
+        self.assertEqual(sol_data.primals, [1.0])
+        self.assertEqual(sol_data.var_suffixes, {'sstatus': {0: 1}})
+        self.assertEqual(sol_data.con_suffixes, {'sstatus': {0: 3}})
+        self.assertIs(type(sol_data.var_suffixes['sstatus'][0]), int)
+
+        SolSolutionLoader(sol_data, nl_info).load_vars()
+        self.assertEqual(m.x.value, 1)
+
+    def test_load_scaled_values(self):
+        m, nl_info = self._make_model(scale=True)
+        sol = (
+            "\nOptions\n3\n1\n1\n0\n1\n1\n1\n1\n0.5\n8\nobjno 0 0\n"
+            "suffix 4 1 3 0 0\nzL\n0 1.5\n"
+            "suffix 3 1 6 0 0\nflag\n0 7\n"
+        )
+        result, sol_data = parse_sol_file(io.StringIO(sol), nl_info, Results())
+        self.assertEqual(sol_data.var_suffixes, {'zL': {0: 1.5}})
+        self.assertEqual(sol_data.problem_suffixes, {'flag': [7]})
+        loader = SolSolutionLoader(sol_data, nl_info)
+        self.assertEqual(loader.get_primals()[m.x], 2)
+        self.assertEqual(loader.get_duals(), {m.c: 1})
+        loader.load_vars()
+        self.assertEqual(m.x.value, 2)
+
+    def test_truncated_values(self):
+        m, nl_info = self._make_model()
+        sol = "\nOptions\n3\n1\n1\n0\n1\n1\n1\n1\n0.5\n"
+        with self.assertRaisesRegex(
+            PyomoException, "Expected 1 lines of values; file ended after 0"
+        ):
+            parse_sol_file(io.StringIO(sol), nl_info, Results())
@@ -38,6 +38,7 @@ from pyomo.core.base.component import (
     ComponentData,
     ActiveComponentData,
     ModelComponentFactory,
+    ModelGeneration,
 )
 from pyomo.core.base.enums import SortComponents, TraversalStrategy
 from pyomo.core.base.global_set import UnindexedComponent_index
@@ -240,6 +241,64 @@ class _DeduplicateInfo(object):
                 return filterfalse(has_been_seen, items)
 
 
+class _RecordingDeduplicateInfo(_DeduplicateInfo):
+    """A :py:class:`_DeduplicateInfo` that records the components it visits
+
+    Cached traversal results are discarded whenever the model structure
+    changes (see :py:meth:`ModelGeneration.bump`).  As component data
+    can be added to (sparse) indexed components without that, this
+    records the number of component data in each component visited by
+    the traversal so that the cached result can be validated.
+    Traversals that visit References are not cached.
+
+    """
+
+    __slots__ = ('sizes', 'cacheable')
+
+    def __init__(self, sizes):
+        super().__init__()
+        self.sizes = sizes
+        self.cacheable = True
+
+    def unique(self, comp, items, are_values):
+        if comp.is_reference():
+            self.cacheable = False
+        else:
+            _data = getattr(comp, '_data', None)
+            if _data is not None:
+                self.sizes.append((comp, len(_data)))
+        return super().unique(comp, items, are_values)
+
+
+# The maximum number of traversals cached on a (root) block
+_TRAVERSAL_CACHE_SIZE = 8
+
+
+def _traversal_key(kind, ctype, active, sort, descend_into, descent_order):
+    """Return the normalized traversal arguments and the cache key
+
+    The ctype and descend_into arguments are normalized to hashable
+    values.  The returned key is None if the traversal cannot be cached.
+
+    """
+    key = kind
+    if not (ctype is None or isclass(ctype)):
+        if ctype.__class__ is SubclassOf:
+            key = None
+        else:
+            ctype = frozenset(ctype)
+    if not (
+        descend_into is None or descend_into.__class__ is bool or isclass(descend_into)
+    ):
+        if descend_into.__class__ is SubclassOf:
+            key = None
+        else:
+            descend_into = frozenset(descend_into)
+    if key is not None:
+        key = (kind, ctype, active, sort, descend_into, descent_order)
+    return ctype, descend_into, key
+
+
 def _isNotNone(val):
     return val is not None
 
@@ -499,6 +558,8 @@ class BlockData(ActiveComponentData):
     # If a writer cached a repn on this block, remove it when cloning
     #  TODO: remove repn caching from the model
     __autoslot_mappers = {'_repn': AutoSlots.encode_as_none}
+    # Do not copy (or pickle) the cached block traversals
+    __autoslot_mappers__ = {'_traversal_cache': AutoSlots.encode_as_none}
 
     def __init__(self, component):
         #
@@ -543,6 +604,8 @@ class BlockData(ActiveComponentData):
         super(BlockData, self).__setattr__('_decl', {})
         super(BlockData, self).__setattr__('_decl_order', [])
         self._private_data = None
+        # Cached block traversals: (generation, {key: (result, sizes)})
+        self._traversal_cache = None
 
     def __getattr__(self, val) -> Union[Component, IndexedComponent, Any]:
         if val in ModelComponentFactory:
@@ -1040,6 +1103,14 @@ component, use the block del_component() and add_component() methods.
             idx_info[2] += 1
         else:
             self._ctypes[_type] = [_new_idx, _new_idx, 1]
+        ModelGeneration.bump(self)
+        if isinstance(val, Block):
+            # Blocks only cache traversals when they are the root of
+            # their model: discard any cache from before they were added
+            for _data in val._data.values():
+                if _data._traversal_cache is not None:
+                    ModelGeneration.cached_roots.pop(id(_data), None)
+                    _data._traversal_cache = None
         #
         # Error, for disabled support implicit rule names
         #
@@ -1172,6 +1243,7 @@ component, use the block del_component() and add_component() methods.
         ctype_info[2] -= 1
         if ctype_info[2] == 0:
             del self._ctypes[obj.ctype]
+        ModelGeneration.bump(self)
 
         # Clear the _parent attribute
         obj._parent = None
@@ -1238,6 +1310,7 @@ component, use the block del_component() and add_component() methods.
                 ctype_info[1] = prev
 
         obj._ctype = new_ctype
+        ModelGeneration.bump(self)
 
         # Insert into the new ctype list
         if new_ctype not in self._ctypes:
@@ -1264,7 +1337,7 @@ component, use the block del_component() and add_component() methods.
             self._decl_order[prev] = (self._decl_order[prev][0], idx)
             self._decl_order[idx] = (obj, tmp)
 
-    def clone(self, memo=None):
+    def clone(self, memo=None, share_structure=False):
         """Make a copy of this block (and all components contained in it).
 
         Pyomo models use :py:class:`Block` components to define a
@@ -1292,6 +1365,21 @@ component, use the block del_component() and add_component() methods.
             updated by :py:meth:`clone` and :py:func:`copy.deepcopy`.
             See :py:meth:`object.__deepcopy__` for more information.
 
+        share_structure : bool
+            If True, expression nodes that do not reference any
+            component in this block scope (for example, subexpressions
+            that only involve constants or out-of-scope Vars and
+            Params) are shared by the original and the new block
+            instead of being duplicated.  As expression trees are
+            immutable, this is safe, and for blocks that refer to
+            large amounts of common (out-of-scope) structure -- e.g.,
+            scenario blocks that refer to the first-stage variables in
+            a parent block -- it reduces both the time and memory
+            needed to clone the block.  All component state (values,
+            bounds, domains, fixed flags, mutable Param values,
+            activation status, etc.) is always duplicated.
+            (default: False)
+
         Examples
         --------
         Given the following model:
@@ -1366,6 +1454,8 @@ component, use the block del_component() and add_component() methods.
             memo = {}
         memo['__block_scope__'] = {id(self): True, id(None): False}
         memo[id(parent)] = parent
+        if share_structure:
+            memo['__share_structure__'] = True
 
         with PauseGC():
             new_block = copy.deepcopy(self, memo)
@@ -1607,8 +1697,29 @@ component, use the block del_component() and add_component() methods.
         component objects in a block.  By default, the
         generator recursively descends into sub-blocks.
         """
-        for _block in self.block_data_objects(
-            active, sort, descend_into, descent_order
+        ans = None
+        if self.parent_block() is None:
+            ctype, descend_into, key = _traversal_key(
+                'component', ctype, active, sort, descend_into, descent_order
+            )
+            ans = self._get_cached_traversal(key)
+            if ans.__class__ is list:
+                yield from ans
+                return
+        if ans:
+            sizes = []
+            block_dedup = _RecordingDeduplicateInfo(sizes)
+            walker = (
+                comp
+                for _block in self._tree_iterator(
+                    active, sort, descend_into, descent_order, block_dedup
+                )
+                for comp in _block.component_map(ctype, active, sort).values()
+            )
+            yield from self._caching_iterator(key, walker, sizes, block_dedup)
+            return
+        for _block in self._tree_iterator(
+            active, sort, descend_into, descent_order, _DeduplicateInfo()
         ):
             yield from _block.component_map(ctype, active, sort).values()
 
@@ -1620,13 +1731,97 @@ component, use the block del_component() and add_component() methods.
         component data objects for all components in a
         block.  By default, this generator recursively
         descends into sub-blocks.
+
+        Traversals that are repeated from the root block of a model
+        are cached on that block until the structure of the model
+        changes (see :py:meth:`ModelGeneration.bump`), so repeated
+        traversals (e.g., by the writers) only iterate over the cached
+        list.
         """
+        ans = None
+        if self.parent_block() is None:
+            ctype, descend_into, key = _traversal_key(
+                'data', ctype, active, sort, descend_into, descent_order
+            )
+            ans = self._get_cached_traversal(key)
+            if ans.__class__ is list:
+                yield from ans
+                return
+        if ans:
+            sizes = []
+            block_dedup = _RecordingDeduplicateInfo(sizes)
+            dedup = _RecordingDeduplicateInfo(sizes)
+            walker = (
+                data
+                for _block in self._tree_iterator(
+                    active, sort, descend_into, descent_order, block_dedup
+                )
+                for data in _block._component_data_itervalues(
+                    ctype, active, sort, dedup
+                )
+            )
+            yield from self._caching_iterator(key, walker, sizes, block_dedup, dedup)
+            return
         dedup = _DeduplicateInfo()
-        for _block in self.block_data_objects(
-            active, sort, descend_into, descent_order
+        for _block in self._tree_iterator(
+            active, sort, descend_into, descent_order, _DeduplicateInfo()
         ):
             yield from _block._component_data_itervalues(ctype, active, sort, dedup)
 
+    def _get_cached_traversal(self, key):
+        """Look up a block traversal in the (LRU) traversal cache
+
+        Returns the cached list of objects, True if the traversal
+        should be recorded, or None.  Traversals are only recorded the
+        second time they are requested (since the model last changed)
+        so that single-use traversals do not pay for the recording.
+
+        """
+        if key is None:
+            return None
+        cache = self._traversal_cache
+        if cache is None:
+            cache = self._new_traversal_cache()
+        try:
+            if key not in cache:
+                cache[key] = None
+                self._trim_traversal_cache()
+                return None
+        except TypeError:
+            # unhashable arguments
+            return None
+        # Move the entry to the end of the LRU order
+        entry = cache[key] = cache.pop(key)
+        if entry is not None:
+            for comp, n in entry[1]:
+                if len(comp._data) != n:
+                    break
+            else:
+                return entry[0]
+            cache[key] = None
+        return True
+
+    def _set_cached_traversal(self, key, generation, result, sizes):
+        """Cache the result of a (complete) block traversal"""
+        if ModelGeneration.value != generation:
+            # The model changed while we were iterating
+            return
+        cache = self._traversal_cache
+        if cache is None:
+            cache = self._new_traversal_cache()
+        cache[key] = (result, sizes)
+        self._trim_traversal_cache()
+
+    def _new_traversal_cache(self):
+        ModelGeneration.cached_roots[id(self)] = self
+        cache = self._traversal_cache = {}
+        return cache
+
+    def _trim_traversal_cache(self):
+        cache = self._traversal_cache
+        while len(cache) > _TRAVERSAL_CACHE_SIZE:
+            del cache[next(iter(cache))]
+
     @deprecated(
         "The component_data_iterindex method is deprecated.  "
         "Components now know their index, so it is more efficient to use the "
@@ -1715,6 +1910,45 @@ component, use the block del_component() and add_component() methods.
         # not change it, but because of block_data_objects() use in
         # component_data_objects, it might be desirable to always return
         # self.
+        if active is not None and self.active != active:
+            return ()
+        if not descend_into:
+            return (self,)
+        if self.parent_block() is None:
+            _, descend_into, key = _traversal_key(
+                'block', None, active, sort, descend_into, descent_order
+            )
+            ans = self._get_cached_traversal(key)
+            if ans.__class__ is list:
+                return iter(ans)
+            if ans:
+                sizes = []
+                dedup = _RecordingDeduplicateInfo(sizes)
+                walker = self._tree_iterator(
+                    active, sort, descend_into, descent_order, dedup
+                )
+                return self._caching_iterator(key, walker, sizes, dedup)
+        return self._tree_iterator(
+            active, sort, descend_into, descent_order, _DeduplicateInfo()
+        )
+
+    def _caching_iterator(self, key, walker, sizes, *dedups):
+        """Iterate over `walker`, caching the result if it is exhausted"""
+        generation = ModelGeneration.value
+        ans = []
+        for obj in walker:
+            ans.append(obj)
+            yield obj
+        if all(dedup.cacheable for dedup in dedups):
+            self._set_cached_traversal(key, generation, ans, sizes)
+
+    def _tree_iterator(self, active, sort, descend_into, descent_order, dedup):
+        """Return the iterator over the (matching) blocks in this block tree
+
+        This centralizes the argument processing for the block
+        traversals (see :py:meth:`block_data_objects`).
+
+        """
         if active is not None and self.active != active:
             return ()
         if not descend_into:
@@ -1726,7 +1960,6 @@ component, use the block del_component() and add_component() methods.
             ctype = (descend_into,)
         else:
             ctype = descend_into
-        dedup = _DeduplicateInfo()
 
         if (
             descent_order is None
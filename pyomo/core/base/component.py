@@ -13,7 +13,7 @@ import logging
 import sys
 from copy import deepcopy
 from pickle import PickleError
-from weakref import ref as weakref_ref
+from weakref import ref as weakref_ref, WeakValueDictionary
 
 import pyomo.common
 from pyomo.common import DeveloperError
@@ -43,6 +43,55 @@ relocated_module_attribute(
 _ref_types = {type(None), weakref_ref}
 
 
+class ModelGeneration(object):
+    """Counter of the changes to the structure of Pyomo models
+
+    The counter (:py:attr:`value`) is incremented (by :py:meth:`bump`)
+    whenever a component is added to (or removed from) a block, a
+    component data is removed from an indexed component (or the
+    component is cleared), or a component (or component data) is
+    activated or deactivated.  Caches derived from the model structure
+    (e.g., the Reference lookup indexes) record the generation when
+    they are created and are only valid as long as the generation has
+    not changed.
+
+    Note that the counter is global (shared by all models): this keeps
+    the bookkeeping trivial (and correct in the presence of References
+    across models) at the cost of occasionally invalidating caches on
+    unrelated models.  Caches stored on a model (e.g., the block
+    traversal cache used by
+    :py:meth:`BlockData.component_data_objects()`) are instead
+    registered in :py:attr:`cached_roots` and discarded by
+    :py:meth:`bump` when that model changes.
+
+    """
+
+    __slots__ = ()
+
+    value = 0
+
+    # Map of id(root block) -> root block for the (root) blocks that
+    # currently hold a traversal cache
+    cached_roots = WeakValueDictionary()
+
+    @staticmethod
+    def bump(obj):
+        """Record a change to the structure of the model containing `obj`"""
+        ModelGeneration.value += 1
+        if not ModelGeneration.cached_roots:
+            # Only pay for finding the model when there is a cache to
+            # discard
+            return
+        try:
+            root = obj.model()
+        except AttributeError:
+            # obj is still being initialized (e.g., a block adding
+            # components in its __init__): there is nothing to discard
+            return
+        if ModelGeneration.cached_roots.pop(id(root), None) is not None:
+            root._traversal_cache = None
+
+
 class ModelComponentFactoryClass(Factory):
     def register(self, doc=None):
         def fn(cls):
@@ -727,10 +776,12 @@ class ActiveComponent(Component):
     def activate(self):
         """Set the active attribute to True"""
         self._active = True
+        ModelGeneration.bump(self)
 
     def deactivate(self):
         """Set the active attribute to False"""
         self._active = False
+        ModelGeneration.bump(self)
 
 
 class ComponentData(ComponentBase):
@@ -1006,7 +1057,9 @@ class ActiveComponentData(ComponentData):
     def activate(self):
         """Set the active attribute to True"""
         self._active = self.parent_component()._active = True
+        ModelGeneration.bump(self)
 
     def deactivate(self):
         """Set the active attribute to False"""
         self._active = False
+        ModelGeneration.bump(self)
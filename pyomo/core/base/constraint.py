@@ -17,7 +17,11 @@ from pyomo.common.pyomo_typing import overload
 from typing import Union, Type
 
 from pyomo.common.deprecation import RenamedClass, deprecated
-from pyomo.common.errors import DeveloperError, TemplateExpressionError
+from pyomo.common.errors import (
+    DeveloperError,
+    PyomoException,
+    TemplateExpressionError,
+)
 from pyomo.common.formatting import tabular_writer
 from pyomo.common.log import is_debug_set
 from pyomo.common.modeling import NOTSET
@@ -565,9 +569,24 @@ class TemplateDataMixin(object):
         return self.set_value(expr)
 
     def to_bounded_expression(self, evaluate_bounds=False):
+        # Accessing the bounded expression (or any of the body / bounds
+        # properties that rely on it) generates the actual expression
+        # (converting this instance to the original Data type)
+        self.expr
+        return self.to_bounded_expression(evaluate_bounds)
+
+    def template_bounded_expression(self):
+        """Return the (lb, body, ub) tuple for the template expression
+
+        This is the :meth:`to_bounded_expression` of the (shared)
+        template expression, and may contain :class:`IndexTemplate`
+        objects.  Unlike :meth:`to_bounded_expression`, this does not
+        generate the expression for this index.
+
+        """
         tmp, self._expr = self._expr, self._expr[0]
         try:
-            return super().to_bounded_expression(evaluate_bounds)
+            return super().to_bounded_expression()
         finally:
             self._expr = tmp
 
@@ -602,6 +621,15 @@ class Constraint(ActiveIndexedComponent):
             A name for this component
         doc
             A text string describing this component
+        templatize
+            If True, call the rule once to generate a template
+            expression (see :py:mod:`pyomo.core.expr.template_expr`)
+            instead of calling it for every index.  The expressions for
+            the individual constraints are only generated when they are
+            accessed, and writers that support templates (e.g., the LP
+            writer) never generate them.  Rules that cannot be
+            templatized fall back on normal construction.  Defaults to
+            the module-level ``TEMPLATIZE_CONSTRAINTS`` flag.
 
     Public class attributes:
         doc
@@ -658,7 +686,9 @@ class Constraint(ActiveIndexedComponent):
             return super().__new__(IndexedConstraint)
 
     @overload
-    def __init__(self, *indexes, expr=None, rule=None, name=None, doc=None): ...
+    def __init__(
+        self, *indexes, expr=None, rule=None, name=None, doc=None, templatize=None
+    ): ...
 
     def __init__(self, *args, **kwargs):
         _init = self._pop_from_kwargs('Constraint', kwargs, ('rule', 'expr'), None)
@@ -667,6 +697,7 @@ class Constraint(ActiveIndexedComponent):
             self._rule = Initializer(_init, treat_sequences_as_mappings=False)
         else:
             self._rule = Initializer(_init)
+        self._templatize = kwargs.pop('templatize', None)
 
         kwargs.setdefault('ctype', Constraint)
         ActiveIndexedComponent.__init__(self, *args, **kwargs)
@@ -716,9 +747,40 @@ class Constraint(ActiveIndexedComponent):
                 # indices to be created at a later time).
                 pass
             else:
-                if TEMPLATIZE_CONSTRAINTS:
+                templatize = self._templatize
+                if templatize is None:
+                    templatize = TEMPLATIZE_CONSTRAINTS
+                if templatize:
                     try:
                         template_info = templatize_constraint(self)
+                    except (
+                        TemplateExpressionError,
+                        PyomoException,
+                        KeyError,
+                        IndexError,
+                        TypeError,
+                    ) as err:
+                        # Not all rules can be templatized: rules that
+                        # iterate over Sets (TemplateExpressionError),
+                        # branch on the index (converting the template
+                        # to bool raises a PyomoException), or use the
+                        # index to look up values in Python containers
+                        # or as an argument to Python functions
+                        # (KeyError / IndexError / TypeError).  Revert
+                        # to generating the expression for every index
+                        # (genuine errors in the rule will be raised
+                        # below).  Any other error propagates.
+                        if (
+                            isinstance(err, PyomoException)
+                            and err.__class__ is not PyomoException
+                        ):
+                            raise
+                        if is_debug_set(logger):
+                            logger.debug(
+                                "Constraint %s: rule could not be "
+                                "templatized:\n%s" % (self.name, err)
+                            )
+                    else:
                         if self.is_indexed():
                             comp = weakref_ref(self)
                             self._data = {
@@ -731,8 +793,6 @@ class Constraint(ActiveIndexedComponent):
                             self._expr = template_info
                             self._data = {None: self}
                         return
-                    except TemplateExpressionError:
-                        pass
 
                 # Bypass the index validation and create the member directly
                 for index in self.index_set():
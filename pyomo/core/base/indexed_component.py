@@ -18,7 +18,12 @@ import pyomo.core.expr as EXPR
 import pyomo.core.base as BASE
 from pyomo.core.base.indexed_component_slice import IndexedComponent_slice
 from pyomo.core.base.initializer import Initializer
-from pyomo.core.base.component import Component, ActiveComponent, ComponentData
+from pyomo.core.base.component import (
+    Component,
+    ActiveComponent,
+    ComponentData,
+    ModelGeneration,
+)
 from pyomo.core.base.config import PyomoOptions
 from pyomo.core.base.enums import SortComponents
 from pyomo.core.base.global_set import UnindexedComponent_set
@@ -379,6 +384,7 @@ class IndexedComponent(Component):
         """Clear the data in this component"""
         if self.is_indexed():
             self._data = {}
+            ModelGeneration.bump(self)
         else:
             raise DeveloperError(
                 "Derived scalar component %s failed to define clear()."
@@ -747,6 +753,7 @@ You can silence this warning by one of three ways:
                 # Remove reference to this object
                 self._data[index]._component = None
             del self._data[index]
+            ModelGeneration.bump(self)
 
     def _construct_from_rule_using_setitem(self):
         if self._rule is None:
@@ -17,10 +17,15 @@ from typing import Union, Type
 from weakref import ref as weakref_ref
 
 from pyomo.common.autoslots import AutoSlots
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.common.deprecation import deprecation_warning, RenamedClass
 from pyomo.common.log import is_debug_set
 from pyomo.common.modeling import NOTSET
-from pyomo.common.numeric_types import native_types, value as expr_value
+from pyomo.common.numeric_types import (
+    native_numeric_types,
+    native_types,
+    value as expr_value,
+)
 from pyomo.common.pyomo_typing import overload
 from pyomo.common.timing import ConstructionTimer
 from pyomo.core.expr.expr_common import _type_check_exception_arg
@@ -34,7 +39,7 @@ from pyomo.core.base.indexed_component import (
 )
 from pyomo.core.base.initializer import Initializer, PartialInitializer
 from pyomo.core.base.misc import apply_indexed_rule, apply_parameterized_indexed_rule
-from pyomo.core.base.set import Reals, _AnySet, SetInitializer
+from pyomo.core.base.set import Reals, _AnySet, SetInitializer, array_in_domain
 from pyomo.core.base.units_container import units
 from pyomo.core.expr import GetItemExpression
 
@@ -519,7 +524,14 @@ class Param(IndexedComponent, IndexedComponent_NDArrayMixin):
 
     def store_values(self, new_values, check=True):
         """
-        A utility to update a Param with a dictionary or scalar.
+        A utility to update a Param with a dictionary, array, or scalar.
+
+        ``new_values`` may be a dictionary (or dict-like object, e.g., a
+        pandas Series) mapping indices to values, a 1-D NumPy array
+        aligned with the ordering of :meth:`index_set`, or a single
+        value to store for every index.  Dictionaries and arrays are
+        processed in bulk: the values are checked against the domain
+        (vectorized where possible) and then stored in a single pass.
 
         If check=True, then both the index and value
         are checked through the __getitem__ method.  Using check=False
@@ -529,15 +541,34 @@ class Param(IndexedComponent, IndexedComponent_NDArrayMixin):
             _raise_modifying_immutable_error(self, '*')
         #
         _srcType = type(new_values)
+        _isArray = numpy_available and isinstance(new_values, np.ndarray)
         _isDict = _srcType is dict or (
             hasattr(_srcType, '__getitem__')
             and not isinstance(new_values, NumericValue)
         )
+        if _isArray:
+            if new_values.shape != (len(self._index_set),):
+                raise ValueError(
+                    "Cannot store an array with shape %s in Param '%s': "
+                    "expected a 1-D array with %s entries (ordered as the "
+                    "index_set())" % (new_values.shape, self.name, len(self._index_set))
+                )
+            if not self.is_indexed():
+                new_values = {None: new_values.item()}
+            else:
+                _isDict = False
         #
         if check:
-            if _isDict:
-                for index, new_value in new_values.items():
-                    self[index] = new_value
+            if _isArray and self.is_indexed():
+                self._store_bulk(
+                    self._index_set,
+                    new_values.tolist(),
+                    array_in_domain(self.domain, new_values),
+                )
+            elif _isDict:
+                if not (self.is_indexed() and self._store_bulk_dict(new_values)):
+                    for index, new_value in new_values.items():
+                        self[index] = new_value
             else:
                 for index in self._index_set:
                     self[index] = new_values
@@ -547,7 +578,14 @@ class Param(IndexedComponent, IndexedComponent_NDArrayMixin):
         # Param logic for ensuring data integrity.
         #
         if self.is_indexed():
-            if _isDict:
+            if _isArray:
+                data = self._data
+                for index, new_value in zip(self._index_set, new_values.tolist()):
+                    if index not in data:
+                        data[index] = ParamData(self)
+                        data[index]._index = index
+                    data[index]._value = new_value
+            elif _isDict:
                 # It is possible that the Param is sparse and that the
                 # index is not already in the _data dict.  As these
                 # cases are rare, we will recover from the exception
@@ -585,6 +623,48 @@ class Param(IndexedComponent, IndexedComponent_NDArrayMixin):
             # scalars have to be handled differently
             self[None] = new_values
 
+    def _store_bulk_dict(self, new_values):
+        """Store (and validate) a dict of values in bulk
+
+        Returns False (without storing anything) if the values cannot be
+        checked in bulk: numpy is not available, or the values are not
+        all native numbers.
+
+        """
+        if not numpy_available:
+            return False
+        items = list(new_values.items())
+        values = [val for index, val in items]
+        if not all(val.__class__ in native_numeric_types for val in values):
+            return False
+        try:
+            valid = array_in_domain(self.domain, values)
+        except (TypeError, ValueError):
+            return False
+        self._store_bulk([index for index, val in items], values, valid)
+        return True
+
+    def _store_bulk(self, indices, values, valid):
+        """Store (and validate) values for an indexed mutable Param
+
+        ``valid`` is a boolean mask of the values already known to be in
+        the domain.  Those values are stored directly into existing
+        ParamData; everything else (values outside the (vectorized)
+        domain check, non-native values, new indices, or Params with a
+        validation rule) is processed through :meth:`__setitem__`.
+
+        """
+        if self._validate:
+            valid[:] = False
+        data = self._data
+        for index, val, ok in zip(indices, values, valid.tolist()):
+            if ok and val.__class__ in native_types:
+                obj = data.get(index, None)
+                if obj is not None:
+                    obj._value = val
+                    continue
+            self[index] = val
+
     def set_default(self, val):
         """
         Perform error checks and then set the default value for this parameter.
@@ -19,7 +19,7 @@ from pyomo.common.collections import (
 )
 from pyomo.common.modeling import NOTSET
 from pyomo.core.base.set import DeclareGlobalSet, Set, SetOf, OrderedSetOf, SetData
-from pyomo.core.base.component import Component, ComponentData
+from pyomo.core.base.component import Component, ComponentData, ModelGeneration
 from pyomo.core.base.global_set import UnindexedComponent_set
 from pyomo.core.base.enums import SortComponents
 from pyomo.core.base.indexed_component import IndexedComponent, normalize_index
@@ -188,6 +188,45 @@ class SliceEllipsisLookupError(LookupError):
     pass
 
 
+class _record_slice_components(object):
+    """An "advance_iter" that records the components walked by a slice
+
+    This advances the passed :py:class:`_slice_generator
+    <pyomo.core.base.indexed_component_slice._slice_generator>` (just
+    like the default advance_iter) and records the number of data
+    objects in each sliced component.  The recorded sizes allow
+    :py:class:`_ReferenceDict` to detect new data added to any
+    component that contributed to a cached iteration.
+
+    """
+
+    __slots__ = ('sizes', 'cacheable')
+
+    def __init__(self):
+        self.sizes = {}
+        self.cacheable = True
+
+    def __call__(self, _slice):
+        comp = _slice.component
+        if id(comp) not in self.sizes:
+            if comp._data.__class__ is dict:
+                self.sizes[id(comp)] = (comp, len(comp._data))
+            else:
+                # Slices through other References are not cached (the
+                # length of a _ReferenceDict is not a cheap operation)
+                self.cacheable = False
+        return next(_slice)
+
+    def check_complete(self):
+        pass
+
+
+def _is_slicing_index(idx):
+    if idx.__class__ is tuple:
+        return any(i is Ellipsis or i.__class__ is slice for i in idx)
+    return idx is Ellipsis or idx.__class__ is slice
+
+
 class _ReferenceDict(MutableMapping):
     """A dict-like object whose values are defined by a slice.
 
@@ -197,6 +236,18 @@ class _ReferenceDict(MutableMapping):
     :py:class:`dict` in :py:class:`IndexedComponent` containers to
     create "reference" components.
 
+    Resolving an element through the slice requires walking the slice
+    call stack, and iterating over the slice may require scanning the
+    entire underlying component(s).  For slices that only index into
+    components and retrieve component attributes, this object maintains
+    a hash index mapping the wildcard keys to the component data found
+    through previous lookups or complete iterations, along with the
+    (complete) iteration results.  The index is discarded whenever the
+    :py:class:`ModelGeneration` changes (e.g., when a component or
+    component data is removed).  Cached iterations are additionally
+    validated against the number of data objects in the sliced
+    components, so that new (sparse) component data is not missed.
+
     Parameters
     ----------
     component_slice : :py:class:`IndexedComponent_slice`
@@ -205,8 +256,98 @@ class _ReferenceDict(MutableMapping):
 
     def __init__(self, component_slice):
         self._slice = component_slice
+        # Only slices whose members can only be changed by
+        # (generation-changing) structural model changes can be indexed
+        # (e.g., not slices that call methods).  Iterations can only be
+        # cached if every level of the slice is either a sliced
+        # component or an attribute (i.e., no explicit indices into
+        # potentially sparse components).
+        self._indexable = self._iter_cacheable = True
+        for call in component_slice._call_stack[: component_slice._len]:
+            if call[0] == IndexedComponent_slice.get_item:
+                if not _is_slicing_index(call[1]):
+                    self._iter_cacheable = False
+            elif call[0] not in (
+                IndexedComponent_slice.slice_info,
+                IndexedComponent_slice.get_attribute,
+            ):
+                self._indexable = self._iter_cacheable = False
+                break
+        self._generation = None
+        self._index = None
+        self._iterations = None
+
+    def __getstate__(self):
+        # The lookup index is not copied (or pickled)
+        return {'_slice': self._slice}
+
+    def __setstate__(self, state):
+        self.__init__(state['_slice'])
+
+    def _get_index(self):
+        """Return the (current) lookup index, or None if not indexable"""
+        if not self._indexable:
+            return None
+        if self._generation != ModelGeneration.value:
+            self._generation = ModelGeneration.value
+            self._index = {}
+            self._iterations = {}
+        return self._index
+
+    def _cached_items(self, sort):
+        """Return the cached list of (key, value) items (or None)"""
+        if not self._iter_cacheable or self._get_index() is None:
+            return None
+        cache = self._iterations.get(sort, None)
+        if cache is None:
+            return None
+        items, sizes = cache
+        for comp, size in sizes:
+            if len(comp._data) != size:
+                del self._iterations[sort]
+                return None
+        return items
+
+    def _caching_items(self, sort):
+        """Iterate over the slice items, caching complete iterations"""
+        generation = ModelGeneration.value
+        record = _record_slice_components()
+        _iter = _IndexedComponent_slice_iter(self._slice, record, sort=sort)
+        items = []
+        for val in _iter:
+            key = _iter.get_last_index_wildcards()
+            if record.cacheable:
+                if isinstance(val, (ComponentData, Component)):
+                    items.append((key, val))
+                else:
+                    record.cacheable = False
+            yield key, val
+        if not record.cacheable or generation != ModelGeneration.value:
+            return
+        sizes = tuple(record.sizes.values())
+        for comp, size in sizes:
+            if len(comp._data) != size:
+                # The model was modified while we were iterating
+                return
+        self._get_index().update(items)
+        self._iterations[sort] = items, sizes
+
+    def _items(self, sort):
+        if not self._iter_cacheable:
+            return self._slice.wildcard_items(sort)
+        items = self._cached_items(sort)
+        if items is None:
+            return self._caching_items(sort)
+        return iter(items)
 
     def __contains__(self, key):
+        index = self._get_index()
+        if index is not None:
+            try:
+                if key in index:
+                    return True
+            except TypeError:
+                pass
         try:
             next(self._get_iter(self._slice, key))
             # This calls IC_slice_iter.__next__, which calls
@@ -238,6 +379,20 @@ class _ReferenceDict(MutableMapping):
                 return False
 
     def __getitem__(self, key):
+        index = self._get_index()
+        if index is not None:
+            try:
+                return index[key]
+            except KeyError:
+                pass
+            except TypeError:
+                index = None
+        ans = self._lookup(key)
+        if index is not None and isinstance(ans, (ComponentData, Component)):
+            index[key] = ans
+        return ans
+
+    def _lookup(self, key):
         try:
             # This calls IC_slice_iter.__next__, which calls
             # _fill_in_known_wildcards.
@@ -255,6 +410,8 @@ class _ReferenceDict(MutableMapping):
             raise KeyError("KeyError: %s" % (key,))
 
     def __setitem__(self, key, val):
+        # Setting an item may replace the underlying component data
+        self._generation = None
         tmp = self._slice.duplicate()
         op = tmp._call_stack[-1][0]
         # Replace the end of the duplicated slice's call stack (deepest
@@ -287,6 +444,7 @@ class _ReferenceDict(MutableMapping):
             pass
 
     def __delitem__(self, key):
+        self._generation = None
         tmp = self._slice.duplicate()
         op = tmp._call_stack[-1][0]
         if op == IndexedComponent_slice.get_item:
@@ -318,15 +476,20 @@ class _ReferenceDict(MutableMapping):
             pass
 
     def __iter__(self):
-        return self._slice.wildcard_keys(SortComponents.UNSORTED)
+        return self.keys()
 
     def __len__(self):
         # Note that unlike for regular dicts, len() of a _ReferenceDict
-        # is very slow (linear time).
-        return sum(1 for i in self._slice)
+        # is very slow (linear time) unless the iteration was cached.
+        items = self._cached_items(SortComponents.UNSORTED)
+        if items is not None:
+            return len(items)
+        return sum(1 for i in self._items(SortComponents.UNSORTED))
 
     def keys(self, sort=SortComponents.UNSORTED):
-        return self._slice.wildcard_keys(sort)
+        if not self._iter_cacheable:
+            return self._slice.wildcard_keys(sort)
+        return (key for key, _ in self._items(sort))
 
     def items(self, sort=SortComponents.UNSORTED):
         """Return the wildcard, value tuples for this ReferenceDict
@@ -341,7 +504,7 @@ class _ReferenceDict(MutableMapping):
         still be linear and not quadratic time.
 
         """
-        return self._slice.wildcard_items(sort)
+        return self._items(sort)
 
     def values(self, sort=SortComponents.UNSORTED):
         """Return the values for this ReferenceDict
@@ -356,7 +519,9 @@ class _ReferenceDict(MutableMapping):
         still be linear and not quadratic time.
 
         """
-        return self._slice.wildcard_values(sort)
+        if not self._iter_cacheable:
+            return self._slice.wildcard_values(sort)
+        return (val for _, val in self._items(sort))
 
     @deprecated('The iteritems method is deprecated. Use dict.items().', version='6.0')
     def iteritems(self):
@@ -17,12 +17,14 @@ import math
 import sys
 import weakref
 
+from bisect import bisect_left
 from collections.abc import Iterator
 from functools import partial
 from typing import Union, Type, Any as typingAny
 
 from pyomo.common.autoslots import AutoSlots
 from pyomo.common.collections import ComponentSet
+from pyomo.common.dependencies import numpy as np
 from pyomo.common.deprecation import deprecated, deprecation_warning, RenamedClass
 from pyomo.common.errors import DeveloperError, PyomoException
 from pyomo.common.log import is_debug_set
@@ -246,6 +248,83 @@ def process_setarg(arg):
     return ans, _anonymous
 
 
+def array_in_domain(domain, values):
+    """Return a mask of the entries of a NumPy array known to be in ``domain``
+
+    The membership test is vectorized for ``Any`` and for domains that
+    are a single continuous or integer range (e.g., ``Reals``,
+    ``NonNegativeReals``, ``Binary``, ``Integers``).  Entries that
+    cannot be verified this way (including all entries for any other
+    domain or non-numeric arrays) are reported as False: callers should
+    fall back on testing those entries individually (``val in domain``).
+
+    """
+    try:
+        values = np.asarray(values)
+    except (TypeError, ValueError):
+        # e.g., sequences of inhomogeneous tuples
+        return np.zeros(len(values), dtype=bool)
+    if values.dtype.kind not in 'biuf':
+        return np.zeros(values.shape, dtype=bool)
+    if values.dtype.kind == 'b':
+        values = values.astype(float)
+    mask = ~np.isnan(values)
+    if isinstance(domain, _AnySet):
+        return mask
+    interval = domain.get_interval()
+    if interval is None or interval[2] not in (0, 1):
+        return np.zeros(values.shape, dtype=bool)
+    lb, ub, step = interval
+    if step:
+        if any(b is not None and int(b) != b for b in (lb, ub)):
+            return np.zeros(values.shape, dtype=bool)
+        mask &= np.isfinite(values)
+        mask[mask] = values[mask] == np.floor(values[mask])
+    if lb is not None:
+        mask &= values >= lb
+    if ub is not None:
+        mask &= values <= ub
+    return mask
+
+
+def _array_in_set(domain, values):
+    """Return a mask of the entries of a 1-D NumPy array that are in ``domain``
+
+    Unlike :py:func:`array_in_domain`, the result is exact: entries that
+    cannot be tested vectorized are tested individually.
+
+    """
+    if values.dtype.kind == 'O':
+        # Recover the numeric type of object arrays of native numbers
+        types = set(map(type, values.tolist()))
+        if types and types.issubset((int, float)):
+            values = values.astype(float if float in types else 'int64')
+    if values.dtype.kind in 'iuf':
+        interval = domain.get_interval()
+        if isinstance(domain, _AnySet) or (
+            interval is not None
+            and (
+                interval[2] == 0
+                or (
+                    interval[2] == 1
+                    and all(b is None or int(b) == b for b in interval[:2])
+                )
+            )
+        ):
+            # array_in_domain() is exact for single continuous or
+            # integer ranges
+            return array_in_domain(domain, values)
+        if domain.isfinite():
+            members = [v for v in domain if v.__class__ in native_numeric_types]
+            return np.isin(values, np.array(members, dtype=float))
+    elif values.dtype.kind in 'US' and domain.isfinite():
+        members = [v for v in domain if v.__class__ is str]
+        return np.isin(values, np.array(members, dtype=values.dtype.kind))
+    return np.fromiter(
+        (v in domain for v in values.tolist()), dtype=bool, count=len(values)
+    )
+
+
 @deprecated(
     'The set_options decorator is deprecated; create Sets from '
     'functions explicitly by passing the function to the Set '
@@ -1808,17 +1887,30 @@ class OrderedSetData(_OrderedSetMixin, FiniteSetData):
         return reversed(self._values)
 
     def _update_impl(self, values):
+        _values = self._values
         for val in values:
-            # Note that we reset _ordered_values within the loop because
-            # of an old example where the initializer rule makes
+            # Note that we look up _ordered_values within the loop
+            # because of an old example where the initializer rule makes
             # reference to values previously inserted into the Set
             # (which triggered the creation of the _ordered_values)
-            self._ordered_values = None
-            self._values[val] = None
+            _ordered = self._ordered_values
+            if _ordered is None:
+                _values[val] = None
+            elif val not in _values:
+                # Maintain the ordered values (and positions) in place
+                _values[val] = len(_ordered)
+                _ordered.append(val)
 
     def remove(self, val):
-        self._values.pop(val)
-        self._ordered_values = None
+        pos = self._values.pop(val)
+        _ordered = self._ordered_values
+        if _ordered is not None:
+            if pos == len(_ordered) - 1:
+                # Removing the last value (e.g., pop()) does not change
+                # the positions of the remaining values
+                _ordered.pop()
+            else:
+                self._ordered_values = None
 
     def discard(self, val):
         try:
@@ -1964,7 +2056,18 @@ class SortedSetData(_SortedSetMixin, OrderedSetData):
     Public Class Attributes:
     """
 
-    __slots__ = ()
+    # _valid_positions is the number of leading entries in
+    # _ordered_values whose positions (stored in _values) are current.
+    # Sets that are sorted using sorted_robust() and whose values are
+    # natively comparable are updated in place (using bisection), so
+    # adding or removing values only invalidates the positions of the
+    # values that follow.  For all other sets it is None, and any
+    # update triggers a full re-sort.
+    __slots__ = ('_valid_positions',)
+
+    def __init__(self, component):
+        self._valid_positions = None
+        super().__init__(component)
 
     def _iter_impl(self):
         """
@@ -1980,24 +2083,102 @@ class SortedSetData(_SortedSetMixin, OrderedSetData):
         return reversed(self._ordered_values)
 
     def _update_impl(self, values):
+        _values = self._values
         for val in values:
-            # Note that we reset _ordered_values within the loop because
-            # of an old example where the initializer rule makes
+            # Note that we look up _ordered_values within the loop
+            # because of an old example where the initializer rule makes
             # reference to values previously inserted into the Set
             # (which triggered the creation of the _ordered_values)
+            _ordered = self._ordered_values
+            if _ordered is None:
+                _values[val] = None
+                continue
+            if val in _values:
+                continue
+            _values[val] = None
+            n = self._valid_positions
+            if n is None:
+                self._ordered_values = None
+                continue
+            try:
+                if not _ordered or _ordered[-1] < val:
+                    i = len(_ordered)
+                else:
+                    i = bisect_left(_ordered, val)
+            except TypeError:
+                # val is not comparable to the current set members
+                self._ordered_values = None
+                continue
+            if i == len(_ordered):
+                if n == i:
+                    _values[val] = i
+                    self._valid_positions = i + 1
+                _ordered.append(val)
+            else:
+                _ordered.insert(i, val)
+                if i < n:
+                    self._valid_positions = i
+
+    def remove(self, val):
+        pos = self._values.pop(val)
+        _ordered = self._ordered_values
+        if _ordered is None:
+            return
+        n = self._valid_positions
+        if n is None:
             self._ordered_values = None
-            self._values[val] = None
+            return
+        if pos is None or pos >= n:
+            pos = bisect_left(_ordered, val)
+        del _ordered[pos]
+        if pos < n:
+            self._valid_positions = pos
+
+    def ord(self, item):
+        """
+        Return the position index of the input value.
+
+        Note that Pyomo Set objects have positions starting at 1 (not 0).
 
-    # Note: removing data does not affect the sorted flag
-    # def remove(self, val):
-    # def discard(self, val):
+        If the search item is not in the Set, then an IndexError is raised.
+        """
+        if self._ordered_values is None:
+            self._rebuild_ordered_values()
+        n = self._valid_positions
+        if n is None:
+            return super().ord(item)
+        try:
+            pos = self._values[item]
+        except KeyError:
+            if item.__class__ is not tuple or len(item) != 1:
+                raise ValueError("%s.ord(x): x not in %s" % (self.name, self.name))
+            item = item[0]
+            try:
+                pos = self._values[item]
+            except KeyError:
+                raise ValueError("%s.ord(x): x not in %s" % (self.name, self.name))
+        if pos is None or pos >= n:
+            # The stored position is out of date: locate the value in
+            # the (sorted) ordered values
+            pos = bisect_left(self._ordered_values, item)
+        return pos + 1
 
     def sorted_data(self):
         return self.data()
 
     def _rebuild_ordered_values(self):
         _set = self._values
-        self._ordered_values = list(self.parent_component()._sort_fcn(_set))
+        _sort_fcn = self.parent_component()._sort_fcn
+        self._valid_positions = None
+        if _sort_fcn is sorted_robust:
+            try:
+                self._ordered_values = sorted(_set)
+                self._valid_positions = len(_set)
+            except TypeError:
+                # Fall back on the (robust) sort key
+                pass
+        if self._valid_positions is None:
+            self._ordered_values = list(_sort_fcn(_set))
         for i, v in enumerate(self._ordered_values):
             _set[v] = i
 
@@ -3993,10 +4174,15 @@ class SetSymmetricDifference_OrderedSet(
 
 
 class SetProduct(SetOperator):
-    __slots__ = tuple()
+    __slots__ = ('_factors',)
 
     _operator = "*"
 
+    def __init__(self, *args, **kwds):
+        # Cache of the (flattened) factor sets (see _flat_factors())
+        self._factors = None
+        super().__init__(*args, **kwds)
+
     def __new__(cls, *args):
         if cls != SetProduct:
             return super(SetProduct, cls).__new__(cls)
@@ -4036,6 +4222,31 @@ class SetProduct(SetOperator):
                 ans += s_dim
         return UnknownSetDimen if _unknown else ans
 
+    def _flat_factors(self):
+        """Return the (flattened) factor sets of this product
+
+        This returns a tuple of ``(set, start, end)`` tuples (one for
+        each non-product factor set, in order), where ``start:end`` is
+        the slice of a (flattened) member of this product that belongs
+        to that factor.  This returns None if product members are not
+        being flattened or if the dimension of any factor is not
+        (yet) known.
+
+        """
+        if not (FLATTEN_CROSS_PRODUCT and normalize_index.flatten):
+            return None
+        if self._factors is None:
+            factors = []
+            start = 0
+            for s in self.subsets(False):
+                dimen = s.dimen
+                if dimen is None or dimen is UnknownSetDimen:
+                    return None
+                factors.append((s, start, start + dimen))
+                start += dimen
+            self._factors = tuple(factors)
+        return self._factors
+
     def _flatten_product(self, val):
         """Flatten any nested set product terms (due to nested products)
 
@@ -4053,7 +4264,67 @@ class SetProduct(SetOperator):
 class SetProduct_InfiniteSet(SetProduct):
     __slots__ = tuple()
 
+    def isin(self, values):
+        """Test the membership of a batch of indices in this SetProduct
+
+        ``values`` is a 2-D array-like (e.g., a NumPy array or list of
+        tuples) with one (flattened) index per row.  Membership is
+        tested column by column against the corresponding factor set,
+        using vectorized NumPy operations for numeric or string columns
+        where possible.  The product is never materialized.
+
+        Returns
+        -------
+        numpy.ndarray
+            A boolean array with one entry for each row of ``values``
+
+        """
+        factors = self._flat_factors()
+        if factors is None:
+            raise ValueError(
+                "Set %s: isin() requires factor sets with known "
+                "dimensions" % (self.name,)
+            )
+        dimen = factors[-1][2] if factors else 0
+        if values.__class__ is not np.ndarray:
+            values = list(values)
+            if values:
+                values = np.array(values, dtype=object)
+            else:
+                values = np.empty((0, dimen), dtype=object)
+        if dimen == 1 and values.ndim == 1:
+            values = values.reshape(-1, 1)
+        if values.ndim != 2 or values.shape[1] != dimen:
+            raise ValueError(
+                "Set %s: isin() expects a 2-D array with %s columns (one "
+                "row per index)" % (self.name, dimen)
+            )
+        mask = np.ones(values.shape[0], dtype=bool)
+        for s, i, j in factors:
+            rows = np.flatnonzero(mask)
+            if not len(rows):
+                break
+            if j == i + 1:
+                mask[rows] = _array_in_set(s, values[rows, i])
+            else:
+                mask[rows] = [tuple(v) in s for v in values[rows, i:j].tolist()]
+        return mask
+
     def get(self, val, default=None):
+        if val.__class__ is tuple:
+            # Fast path: decompose the (flattened) value across the
+            # factor sets
+            factors = self._flat_factors()
+            if factors and len(val) == factors[-1][2]:
+                for s, i, j in factors:
+                    if (val[i] if j == i + 1 else val[i:j]) not in s:
+                        break
+                else:
+                    return val
+                if all(v.__class__ in native_types for v in val):
+                    # The value is already flat: there is no other
+                    # way to split it across the factor sets
+                    return default
         # return self._find_val(val) is not None
         v = self._find_val(val)
         if v is None:
@@ -4215,14 +4486,16 @@ class SetProduct_FiniteSet(_FiniteSetMixin, SetProduct_InfiniteSet):
     __slots__ = tuple()
 
     def _iter_impl(self):
-        _iter = itertools.product(*self._sets)
-        # Note: if all the member sets are simple 1-d sets, then there
-        # is no need to call flatten_product.
-        if (
-            FLATTEN_CROSS_PRODUCT
-            and normalize_index.flatten
-            and self.dimen != len(self._sets)
-        ):
+        if not (FLATTEN_CROSS_PRODUCT and normalize_index.flatten):
+            return itertools.product(*self._sets)
+        # Iterate over the product of the (flattened) factor sets
+        # directly, so that nested products do not generate (and
+        # flatten) intermediate tuples.  Note: if all the factor sets
+        # are simple 1-d sets, then there is no need to call
+        # flatten_product.
+        factors = list(self.subsets(False))
+        _iter = itertools.product(*factors)
+        if any(s.dimen != 1 for s in factors):
             return (self._flatten_product(_) for _ in _iter)
         return _iter
 
@@ -4243,6 +4516,22 @@ class SetProduct_OrderedSet(
 
     def at(self, index):
         _idx = self._to_0_based_index(index)
+        factors = self._flat_factors()
+        if factors is not None:
+            ans = []
+            for s, i, j in reversed(factors):
+                n = len(s)
+                if not n:
+                    raise IndexError(f"{self.name} index out of range")
+                _idx, pos = divmod(_idx, n)
+                if j == i + 1:
+                    ans.append(s.at(pos + 1))
+                else:
+                    ans.extend(reversed(s.at(pos + 1)))
+            if _idx:
+                raise IndexError(f"{self.name} index out of range")
+            ans.reverse()
+            return tuple(ans)
         _ord = list(len(_) for _ in self._sets)
         i = len(_ord)
         while i:
@@ -4263,6 +4552,20 @@ class SetProduct_OrderedSet(
 
         If the search item is not in the Set, then an IndexError is raised.
         """
+        factors = self._flat_factors()
+        if factors is not None:
+            val = self.get(item)
+            if val is None:
+                raise IndexError(
+                    "Cannot identify position of %s in Set %s: item not in Set"
+                    % (item, self.name)
+                )
+            if val.__class__ is not tuple:
+                val = (val,)
+            ans = 0
+            for s, i, j in factors:
+                ans = ans * len(s) + s.ord(val[i] if j == i + 1 else val[i:j]) - 1
+            return ans + 1
         found = self._find_val(item)
         if found is None:
             raise IndexError(
@@ -4272,7 +4575,12 @@ class SetProduct_OrderedSet(
         val, cutPoints = found
         if cutPoints is not None:
             val = tuple(
-                val[cutPoints[i] : cutPoints[i + 1]] for i in range(len(self._sets))
+                (
+                    val[cutPoints[i]]
+                    if cutPoints[i + 1] == cutPoints[i] + 1
+                    else val[cutPoints[i] : cutPoints[i + 1]]
+                )
+                for i in range(len(self._sets))
             )
         _idx = tuple(s.ord(val[i]) - 1 for i, s in enumerate(self._sets))
         _len = list(len(_) for _ in self._sets)
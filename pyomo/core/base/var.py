@@ -16,6 +16,7 @@ from pyomo.common.pyomo_typing import overload
 from weakref import ref as weakref_ref
 from typing import Union, Type
 
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.common.deprecation import RenamedClass
 from pyomo.common.log import is_debug_set
 from pyomo.common.modeling import NOTSET
@@ -663,9 +664,23 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
         """
         Set the values of a dictionary.
 
+        ``new_values`` may be a dictionary (or dict-like object, e.g., a
+        pandas Series) mapping indices to values, or a 1-D NumPy array
+        aligned with the ordering of :meth:`index_set`.
+
         The default behavior is to validate the values in the
         dictionary.
         """
+        if numpy_available and isinstance(new_values, np.ndarray):
+            index_set = self.index_set()
+            if new_values.shape != (len(index_set),):
+                raise ValueError(
+                    "Cannot set values from an array with shape %s for "
+                    "Var '%s': expected a 1-D array with %s entries (ordered "
+                    "as the index_set())"
+                    % (new_values.shape, self.name, len(index_set))
+                )
+            new_values = dict(zip(index_set, new_values.tolist()))
         for index, new_value in new_values.items():
             self[index].set_value(new_value, skip_validation)
 
@@ -9,6 +9,9 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+from operator import is_not
+
+from pyomo.common.autoslots import fast_deepcopy, _atomic_types
 from pyomo.common.dependencies import attempt_import
 from pyomo.common.numeric_types import native_types
 from pyomo.common.modeling import NOTSET
@@ -41,6 +44,47 @@ class ExpressionBase(PyomoObject):
     """
     ASSOCIATIVITY = OperatorAssociativity.LEFT_TO_RIGHT
 
+    def __deepcopy__(self, memo):
+        if '__share_structure__' not in memo:
+            return super().__deepcopy__(memo)
+        # This is a Block.clone(share_structure=True): expression nodes
+        # are immutable, so any node whose state is not changed by the
+        # deepcopy (that is, it does not reference any component in the
+        # clone scope) can be shared by the original and the new block.
+        memo_size = len(memo)
+        state = self.__getstate__()
+        try:
+            new_state = []
+            _append = new_state.append
+            unchanged = True
+            for field in state:
+                if field.__class__ in _atomic_types:
+                    _append(field)
+                    continue
+                if field.__class__ is list:
+                    # (e.g., SumExpression._args_).  Note that we do not
+                    # register the list in the memo, as the list is
+                    # never shared with another (distinct) node.
+                    new_field = [fast_deepcopy(arg, memo) for arg in field]
+                    if unchanged and any(map(is_not, new_field, field)):
+                        unchanged = False
+                else:
+                    new_field = fast_deepcopy(field, memo)
+                    if new_field is not field:
+                        unchanged = False
+                _append(new_field)
+        except:
+            # Remove anything added to the memo and fall back on the
+            # more cautious (standard) deepcopy
+            for _ in range(len(memo) - memo_size):
+                memo.popitem()
+            return super().__deepcopy__(memo)
+        if unchanged:
+            return self
+        ans = self.__class__.__new__(self.__class__)
+        ans.__setstate__(new_state)
+        return ans
+
     def nargs(self):
         """Returns the number of child nodes.
 
@@ -0,0 +1,731 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""Reverse-mode automatic differentiation on a recorded tape
+
+:py:func:`pyomo.core.expr.calculus.diff_with_pyomo.reverse_ad` walks the
+expression tree (building dictionaries of node values and derivatives)
+every time it is called, for a single expression.  This module instead
+reuses the instruction tape recorded by
+:py:mod:`pyomo.core.expr.compiler` for a list of expressions, and
+replays the tape with NumPy arrays to compute:
+
+- the sparse Jacobian of all expressions (a reverse sweep for every
+  expression, all performed simultaneously), either at a single point
+  or at a batch of points,
+- the gradient of a weighted sum of the expressions (a single reverse
+  sweep), and
+- Hessian-vector products of a weighted sum of the expressions
+  (forward-over-reverse: a forward tangent sweep followed by a reverse
+  sweep of the value and tangent adjoints).
+
+This module requires NumPy.  The tape instructions are scheduled by
+their depth ("level") in the expression graph: all instructions of the same type on the same level
+(and all the partial derivatives of the same type) are evaluated by a
+single NumPy operation.  The cost of replaying the tape therefore
+depends on the depth and variety of the expressions, and not on the
+number of expressions.
+
+Example
+-------
+
+.. code::
+
+   >>> d = compile_derivatives([m.c[i].body for i in m.I])
+   >>> rows, cols = d.jacobian_structure()   # cols index d.variables
+   >>> d.jacobian()                  # at the current variable values
+   >>> d.jacobian([1, 2, 3])         # at x = [1, 2, 3]
+   >>> d.jacobian_batch(points)      # points: (n_points, len(d.variables))
+   >>> d.hessian_vector_product(v, weights=duals)
+
+"""
+
+import logging
+import math
+
+import pyomo.repn.util as repn_util
+
+from pyomo.common.dependencies import numpy as np
+from pyomo.common.errors import DeveloperError, InvalidValueError
+from pyomo.core.expr.compiler import (
+    CompiledExpressions,
+    _leaf_opcodes,
+    _numpy_functions,
+    _vectorize_node,
+)
+
+logger = logging.getLogger(__name__)
+
+_LN10 = math.log(10)
+
+# First and second derivatives of the unary functions, in terms of the
+# argument (a) and the function value (r)
+_unary_derivatives = {
+    'log': (lambda a, r: 1 / a, lambda a, r: -1 / a**2),
+    'log10': (lambda a, r: 1 / (a * _LN10), lambda a, r: -1 / (a**2 * _LN10)),
+    'sin': (lambda a, r: np.cos(a), lambda a, r: -np.sin(a)),
+    'cos': (lambda a, r: -np.sin(a), lambda a, r: -np.cos(a)),
+    'tan': (lambda a, r: 1 + r**2, lambda a, r: 2 * r * (1 + r**2)),
+    'sinh': (lambda a, r: np.cosh(a), lambda a, r: np.sinh(a)),
+    'cosh': (lambda a, r: np.sinh(a), lambda a, r: np.cosh(a)),
+    'tanh': (lambda a, r: 1 - r**2, lambda a, r: -2 * r * (1 - r**2)),
+    'asin': (lambda a, r: 1 / np.sqrt(1 - a**2), lambda a, r: a / (1 - a**2) ** 1.5),
+    'acos': (lambda a, r: -1 / np.sqrt(1 - a**2), lambda a, r: -a / (1 - a**2) ** 1.5),
+    'atan': (lambda a, r: 1 / (1 + a**2), lambda a, r: -2 * a / (1 + a**2) ** 2),
+    'exp': (lambda a, r: r, lambda a, r: r),
+    'sqrt': (lambda a, r: 0.5 / r, lambda a, r: -0.25 / r**3),
+    'asinh': (lambda a, r: 1 / np.sqrt(a**2 + 1), lambda a, r: -a / (a**2 + 1) ** 1.5),
+    'acosh': (lambda a, r: 1 / np.sqrt(a**2 - 1), lambda a, r: -a / (a**2 - 1) ** 1.5),
+    'atanh': (lambda a, r: 1 / (1 - a**2), lambda a, r: 2 * a / (1 - a**2) ** 2),
+}
+
+# Piecewise constant functions (with zero derivatives)
+_constant_derivative_functions = {'ceil', 'floor'}
+
+# Operations that do not propagate derivatives
+_inactive_opcodes = {'ineq', 'eq', 'ranged'}
+
+# Operations with any number of arguments (evaluated with ufunc.reduceat)
+_reduce_opcodes = {'sum': np.add, 'max': np.maximum, 'min': np.minimum}
+
+
+def _ranged(data, a):
+    lb = a[0] < a[1] if data[0] else a[0] <= a[1]
+    ub = a[1] < a[2] if data[1] else a[1] <= a[2]
+    return lb & ub
+
+
+# Evaluate an operation on the (NumPy arrays of) argument values `a`
+_forward_ops = {
+    'neg': lambda data, a: -a[0],
+    'mul': lambda data, a: a[0] * a[1],
+    'div': lambda data, a: a[0] / a[1],
+    'pow': lambda data, a: a[0] ** a[1],
+    'abs': lambda data, a: np.abs(a[0]),
+    'unary': lambda data, a: data(a[0]),
+    'expr_if': lambda data, a: np.where(a[0] != 0, a[1], a[2]),
+    'ineq': lambda data, a: a[0] < a[1] if data else a[0] <= a[1],
+    'eq': lambda data, a: a[0] == a[1],
+    'ranged': _ranged,
+    'node': lambda data, a: data(*a),
+}
+
+
+def _pow_cross(a):
+    # d/da (a ** b * log(a)) == d/db (b * a ** (b - 1))
+    return a[0] ** (a[1] - 1) * (1 + a[1] * np.log(a[0]))
+
+
+def _partial(op, j, data, a, r):
+    """Return the partial derivative of the operation `op` with respect
+    to its `j`-th argument (`a` are the argument values and `r` the
+    result)"""
+    if op == 'mul':
+        return a[1 - j]
+    elif op == 'div':
+        return 1 / a[1] if j == 0 else -r / a[1]
+    elif op == 'pow':
+        if j == 0:
+            return a[1] * a[0] ** (a[1] - 1)
+        return r * np.log(a[0])
+    elif op == 'abs':
+        return np.sign(a[0])
+    elif op in ('max', 'min'):
+        # Derivatives flow to the first argument that attains the max / min
+        ans = a[j] == r
+        for m in range(j):
+            ans &= a[m] != r
+        return ans
+    elif op == 'unary':
+        return _unary_derivatives[data][0](a[0], r)
+    elif op == 'expr_if':
+        return a[0] != 0 if j == 1 else a[0] == 0
+    raise DeveloperError("no partial derivative for opcode '%s'" % (op,))
+
+
+def _partial_tangent(op, j, data, a, r, d):
+    """Return the directional derivative of :py:func:`_partial` along
+    the forward tangents `d` of the arguments (`data` is True if the
+    other argument of a 'pow' is active)"""
+    if op == 'mul':
+        return d[1 - j]
+    elif op == 'div':
+        if j == 0:
+            return -d[1] / a[1] ** 2
+        return (2 * r * d[1] - d[0]) / a[1] ** 2
+    elif op == 'pow':
+        base, exponent = a
+        if j == 0:
+            coef = exponent * (exponent - 1)
+            # Avoid 0 * inf (e.g., for x ** 1 at x == 0)
+            ans = d[0] * np.where(coef == 0, 0.0, coef * base ** (exponent - 2))
+            if data:
+                ans = ans + d[1] * _pow_cross(a)
+            return ans
+        ans = d[1] * r * np.log(base) ** 2
+        if data:
+            ans = ans + d[0] * _pow_cross(a)
+        return ans
+    elif op == 'unary':
+        return d[0] * _unary_derivatives[data][1](a[0], r)
+    raise DeveloperError("no partial derivative for opcode '%s'" % (op,))
+
+
+# Operations whose partial derivatives are constant (and whose partial
+# tangents are zero)
+_constant_partials = {'sum': 1.0, 'neg': -1.0}
+
+# Operations whose partial derivatives are piecewise constant (zero
+# partial tangents)
+_piecewise_constant_partials = {'abs', 'max', 'min', 'expr_if'}
+
+
+def _float(val):
+    try:
+        return float(val)
+    except (TypeError, ValueError):
+        # Non-numeric constants (e.g., string arguments to external
+        # functions) are only used by generic nodes
+        return math.nan
+
+
+class _TapeSweeps(object):
+    """Level-scheduled forward and reverse sweeps over a recorded tape
+
+    All sweeps operate on 2-D arrays with one row per tape instruction
+    (or, for the Jacobian, per instruction and expression) and one
+    column per point.
+
+    """
+
+    def __init__(self, compiled):
+        tape = compiled.tape
+        n = len(tape)
+        level = [0] * n
+        active = [False] * n
+        leaves = {op: ([], []) for op in _leaf_opcodes}
+        # map (level, opcode, data) -> list of (instruction, args)
+        forward = {}
+        # The "edges" of the expression graph along which the
+        # derivatives propagate (the parent and argument instructions),
+        # grouped by the type of their partial derivative
+        edge_parents = []
+        edge_args = []
+        groups = {}
+        for k, (op, args, data) in enumerate(tape):
+            if not args:
+                if op in _leaf_opcodes:
+                    leaves[op][0].append(k)
+                    leaves[op][1].append(data)
+                    active[k] = op == 'var'
+                    continue
+                elif op == 'sum':
+                    # An empty sum
+                    leaves['const'][0].append(k)
+                    leaves['const'][1].append(0)
+                    continue
+            lvl = level[k] = 1 + max([level[i] for i in args])
+            if op == 'unary':
+                key = data[0], data[1]
+            elif op in ('ineq', 'ranged'):
+                key = data
+            elif op == 'node':
+                key = k
+            else:
+                key = None
+            forward.setdefault((lvl, op, key), []).append((k, args))
+
+            if op in _inactive_opcodes:
+                continue
+            elif op == 'expr_if':
+                # The condition does not contribute to the derivative
+                positions = (1, 2)
+            elif op == 'unary' and data[0] in _constant_derivative_functions:
+                continue
+            else:
+                positions = range(len(args))
+            positions = [j for j in positions if active[args[j]]]
+            if not positions:
+                continue
+            if op == 'node':
+                raise ValueError(
+                    "Cannot differentiate expression node '%s' of type %s"
+                    % (data, type(data).__name__)
+                )
+            if op == 'unary' and data[0] not in _unary_derivatives:
+                raise ValueError(
+                    "Cannot differentiate unary function '%s'" % (data[0],)
+                )
+            active[k] = True
+            for j in positions:
+                if op in _constant_partials:
+                    key = op, None, None
+                elif op == 'unary':
+                    key = op, 0, data[0]
+                elif op == 'pow':
+                    # the partial tangent depends on the activity of the
+                    # other argument
+                    key = op, j, active[args[1 - j]]
+                elif op in ('max', 'min'):
+                    key = op, j, len(args)
+                else:
+                    key = op, j, None
+                groups.setdefault(key, []).append(len(edge_parents))
+                edge_parents.append(k)
+                edge_args.append(args[j])
+
+        self.n = n
+        self.level = level
+        self.active = active
+        self.leaves = {
+            op: (np.array(rows, dtype=int), vals) for op, (rows, vals) in leaves.items()
+        }
+        self.const_values = np.array(
+            [_float(v) for v in leaves['const'][1]], dtype=float
+        )
+        self.var_nodes = np.empty(len(compiled.variables), dtype=int)
+        self.var_nodes[leaves['var'][1]] = leaves['var'][0]
+        self.outputs = np.array(compiled.outputs, dtype=int)
+
+        self._forward_steps = [
+            self._forward_step(tape, op, key, items)
+            for (lvl, op, key), items in sorted(
+                forward.items(), key=lambda item: item[0][0]
+            )
+        ]
+
+        # Order the edges by the level of their parent, so that the
+        # edges on each level are contiguous
+        edge_parents = np.array(edge_parents, dtype=int)
+        order = np.argsort(np.array(level, dtype=int)[edge_parents], kind='stable')
+        position = np.empty_like(order)
+        position[order] = np.arange(len(order))
+        self.edge_parents = edge_parents[order]
+        self.edge_args = np.array(edge_args, dtype=int)[order]
+        self.edge_levels = np.array(level, dtype=int)[self.edge_parents]
+        self.max_level = max(level, default=0)
+        self.level_bounds = np.searchsorted(
+            self.edge_levels, np.arange(self.max_level + 2), side='left'
+        )
+
+        self._partial_steps = []
+        for (op, j, data), group in groups.items():
+            group = position[group]
+            parents = self.edge_parents[group]
+            if op in _constant_partials:
+                args = None
+            else:
+                args = np.array([tape[k][1] for k in parents], dtype=int).T
+            self._partial_steps.append((op, j, data, group, parents, args))
+
+        self._jacobian = None
+
+    def _forward_step(self, tape, op, data, items):
+        nodes = np.array([k for k, args in items], dtype=int)
+        if op in _reduce_opcodes:
+            flat = [i for k, args in items for i in args]
+            starts = np.cumsum([0] + [len(args) for k, args in items[:-1]])
+            return op, _reduce_opcodes[op], nodes, (np.array(flat, dtype=int), starts)
+        if op == 'unary':
+            name, fcn = data
+            if name in _numpy_functions:
+                data = getattr(np, _numpy_functions[name])
+            else:
+                data = np.vectorize(fcn, otypes=[float])
+        elif op == 'node':
+            # Generic nodes are evaluated by the node's
+            # _apply_operation() (and receive the original values of
+            # constant arguments, which may not be numbers)
+            ((k, args),) = items
+            node = tape[k][2]
+            args = [
+                (False, tape[i][2]) if tape[i][0] == 'const' else (True, i)
+                for i in args
+            ]
+            return op, _vectorize_node(node), k, args
+        args = np.array([args for k, args in items], dtype=int).T
+        return op, data, nodes, args
+
+    def values(self, x, p):
+        """Return the values of all the tape instructions
+
+        `x` is a 2-D array of variable values (one row per variable)
+        and `p` the list of (scalar or 1-D array) parameter values
+
+        """
+        V = np.empty((self.n, x.shape[1]))
+        rows, slots = self.leaves['var']
+        V[rows] = x[slots]
+        rows, slots = self.leaves['param']
+        for k, i in zip(rows, slots):
+            V[k] = p[i]
+        V[self.leaves['const'][0]] = self.const_values[:, None]
+        for op, data, nodes, args in self._forward_steps:
+            if op in _reduce_opcodes:
+                flat, starts = args
+                V[nodes] = data.reduceat(V[flat], starts, axis=0)
+            elif op == 'node':
+                V[nodes] = data(*[V[i] if row else i for row, i in args])
+            else:
+                V[nodes] = _forward_ops[op](data, [V[i] for i in args])
+        return V
+
+    def partials(self, V):
+        """Return the partial derivative along every edge"""
+        P = np.empty((len(self.edge_parents), V.shape[1]))
+        for op, j, data, group, parents, args in self._partial_steps:
+            if args is None:
+                P[group] = _constant_partials[op]
+            else:
+                P[group] = _partial(op, j, data, [V[i] for i in args], V[parents])
+        return P
+
+    def tangents(self, P, v):
+        """Return the forward tangents of all instructions along the
+        direction `v` (a 2-D array with one row per variable)"""
+        D = np.zeros((self.n, v.shape[1]))
+        D[self.var_nodes] = v
+        parents, args, bounds = self.edge_parents, self.edge_args, self.level_bounds
+        for lvl in range(1, self.max_level + 1):
+            e = slice(bounds[lvl], bounds[lvl + 1])
+            np.add.at(D, parents[e], P[e] * D[args[e]])
+        return D
+
+    def partial_tangents(self, V, D):
+        """Return the directional derivative of every edge partial along
+        the forward tangents `D`"""
+        dP = np.zeros((len(self.edge_parents), V.shape[1]))
+        for op, j, data, group, parents, args in self._partial_steps:
+            if args is None or op in _piecewise_constant_partials:
+                continue
+            dP[group] = _partial_tangent(
+                op, j, data, [V[i] for i in args], V[parents], [D[i] for i in args]
+            )
+        return dP
+
+    def reverse(self, seeds, P, dP=None):
+        """Perform a reverse sweep
+
+        `seeds` is a 2-D array of the adjoints of the outputs.  Returns
+        the adjoints of all the instructions (and, if the partial
+        tangents `dP` are provided, the tangent adjoints).
+
+        """
+        A = np.zeros((self.n, seeds.shape[1]))
+        np.add.at(A, self.outputs, seeds)
+        B = None if dP is None else np.zeros_like(A)
+        parents, args, bounds = self.edge_parents, self.edge_args, self.level_bounds
+        for lvl in range(self.max_level, 0, -1):
+            e = slice(bounds[lvl], bounds[lvl + 1])
+            a = A[parents[e]]
+            np.add.at(A, args[e], a * P[e])
+            if B is not None:
+                np.add.at(B, args[e], B[parents[e]] * P[e] + a * dP[e])
+        return A, B
+
+    def jacobian_structure(self):
+        """Build the data for the (simultaneous) reverse sweeps of the
+        individual expressions
+
+        Every (expression, reachable active instruction) pair is
+        assigned a separate adjoint "slot".  Returns the Jacobian
+        structure (the rows and the variable slots of the nonzeros).
+
+        """
+        if self._jacobian is not None:
+            return self._jacobian[0]
+        active = self.active
+        node_edges = [[] for _ in range(self.n)]
+        for e, (k, i) in enumerate(
+            zip(self.edge_parents.tolist(), self.edge_args.tolist())
+        ):
+            node_edges[k].append((e, i))
+        var_slot = {k: i for i, k in enumerate(self.var_nodes.tolist())}
+        rows = []
+        cols = []
+        nz_slots = []
+        seed_slots = []
+        # (parent slot, argument slot, edge) of every slot edge
+        parents = []
+        args = []
+        edges = []
+        n_slots = 0
+        for row, k in enumerate(self.outputs.tolist()):
+            if not active[k]:
+                continue
+            slots = {k: n_slots}
+            seed_slots.append(n_slots)
+            n_slots += 1
+            stack = [k]
+            while stack:
+                k = stack.pop()
+                s = slots[k]
+                for e, i in node_edges[k]:
+                    if i not in slots:
+                        slots[i] = n_slots
+                        n_slots += 1
+                        stack.append(i)
+                    parents.append(s)
+                    args.append(slots[i])
+                    edges.append(e)
+            nz = sorted((var_slot[k], s) for k, s in slots.items() if k in var_slot)
+            rows.extend([row] * len(nz))
+            cols.extend(col for col, s in nz)
+            nz_slots.extend(s for col, s in nz)
+        # Sort the slot edges by decreasing level of the parent (the
+        # edges are ordered by increasing level)
+        order = np.argsort(-np.array(edges, dtype=int), kind='stable')
+        parents = np.array(parents, dtype=int)[order]
+        args = np.array(args, dtype=int)[order]
+        edges = np.array(edges, dtype=int)[order]
+        # Split the slot edges into the (independent) edges on each level
+        splits = np.flatnonzero(np.diff(self.edge_levels[edges])) + 1
+        steps = list(
+            zip(
+                np.split(parents, splits),
+                np.split(args, splits),
+                np.split(edges, splits),
+            )
+        )
+        self._jacobian = (rows, cols), n_slots, seed_slots, nz_slots, steps
+        return self._jacobian[0]
+
+    def jacobian(self, P):
+        """Return the Jacobian nonzeros (one row per nonzero)"""
+        self.jacobian_structure()
+        structure, n_slots, seed_slots, nz_slots, steps = self._jacobian
+        S = np.zeros((n_slots, P.shape[1]))
+        S[seed_slots] = 1
+        for parents, args, edges in steps:
+            np.add.at(S, args, S[parents] * P[edges])
+        return S[nz_slots]
+
+
+class CompiledDerivatives(CompiledExpressions):
+    """A list of Pyomo expressions compiled for evaluating derivatives
+
+    This extends :py:class:`pyomo.core.expr.compiler.CompiledExpressions`
+    (so the expressions can also be evaluated) with the Jacobian,
+    gradient, and Hessian-vector products of the expressions with
+    respect to :py:attr:`variables`.  The schedule for replaying the
+    tape is built the first time the derivatives are evaluated.
+
+    Expressions that contain (variable-dependent) nodes that cannot be
+    differentiated (e.g., :py:class:`ExternalFunctionExpression`) raise
+    a ValueError when the derivatives are first evaluated.  Evaluation
+    errors (at single points or batches of points) are handled as in
+    :py:meth:`CompiledExpressions.evaluate_batch` (the corresponding
+    results are `nan`).
+
+    Parameters
+    ----------
+    exprs: Iterable[NumericValue]
+        The expressions to compile
+
+    variables: Iterable[VarData]
+        The ordering of the variables (see :py:class:`CompiledExpressions`)
+
+    """
+
+    def __init__(self, exprs, variables=None):
+        super().__init__(exprs, variables)
+        self._sweeps = None
+
+    def jacobian_structure(self):
+        """Return the sparsity structure of the Jacobian
+
+        Returns
+        -------
+        tuple: ``(rows, cols)``, the lists of the expression and the
+            variable (:py:attr:`variables`) indices of each
+            structural nonzero
+
+        """
+        return self._get_sweeps().jacobian_structure()
+
+    def jacobian(self, x=None):
+        """Evaluate the Jacobian at a single point
+
+        Parameters
+        ----------
+        x: Sequence[float]
+            The variable values (ordered as :py:attr:`variables`).  If
+            None, the current variable values are used.
+
+        Returns
+        -------
+        list: the value of each nonzero (ordered as
+            :py:meth:`jacobian_structure`)
+
+        """
+        x = self._check_point(x)
+        return self._jacobian(_columns(x), self.parameter_values())[:, 0].tolist()
+
+    def jacobian_batch(self, points, parameter_values=None):
+        """Evaluate the Jacobian at a batch of points
+
+        Evaluation errors are handled as in
+        :py:meth:`CompiledExpressions.evaluate_batch` (the corresponding
+        nonzeros are `nan`).
+
+        Parameters
+        ----------
+        points: numpy.ndarray
+            2-D array of variable values (one row per point, one column
+            per variable, ordered as :py:attr:`variables`)
+
+        parameter_values: Mapping
+            Map of parameters to (scalar or per-point) values to use in
+            place of their current values
+
+        Returns
+        -------
+        numpy.ndarray: 2-D array (one row per point and one column
+            per nonzero, ordered as :py:meth:`jacobian_structure`)
+
+        """
+        x, params = self._prepare_batch(points, parameter_values)
+        return self._jacobian(x, params).T
+
+    def gradient(self, x=None, weights=None):
+        """Evaluate the gradient of a weighted sum of the expressions
+
+        Parameters
+        ----------
+        x: Sequence[float]
+            The variable values (ordered as :py:attr:`variables`).  If
+            None, the current variable values are used.
+
+        weights: Sequence[float]
+            The weight of each expression (e.g., constraint multipliers).
+            If None, all weights are 1.
+
+        Returns
+        -------
+        list: the (dense) gradient, ordered as :py:attr:`variables`
+
+        """
+        x = self._check_point(x)
+        w = self._check_weights(weights)
+        sweeps = self._get_sweeps()
+        errors = set()
+        with np.errstate(all='call', call=lambda err, flag: errors.add(err)):
+            P = sweeps.partials(sweeps.values(_columns(x), self.parameter_values()))
+            A, B = sweeps.reverse(_columns(w), P)
+            ans = A[sweeps.var_nodes]
+        if errors:
+            self._process_sweep_errors(ans, errors, 'gradient')
+        return ans[:, 0].tolist()
+
+    def hessian_vector_product(self, v, x=None, weights=None):
+        """Evaluate the product of the Hessian of a weighted sum of the
+        expressions with a vector
+
+        Parameters
+        ----------
+        v: Sequence[float]
+            The vector (ordered as :py:attr:`variables`)
+
+        x: Sequence[float]
+            The variable values (ordered as :py:attr:`variables`).  If
+            None, the current variable values are used.
+
+        weights: Sequence[float]
+            The weight of each expression (e.g., constraint multipliers).
+            If None, all weights are 1.
+
+        Returns
+        -------
+        list: the (dense) Hessian-vector product, ordered as
+            :py:attr:`variables`
+
+        """
+        x = self._check_point(x)
+        if len(v) != len(self.variables):
+            raise ValueError(
+                "Expected a vector with %s values (found %s)"
+                % (len(self.variables), len(v))
+            )
+        w = self._check_weights(weights)
+        sweeps = self._get_sweeps()
+        errors = set()
+        with np.errstate(all='call', call=lambda err, flag: errors.add(err)):
+            V = sweeps.values(_columns(x), self.parameter_values())
+            P = sweeps.partials(V)
+            dP = sweeps.partial_tangents(V, sweeps.tangents(P, _columns(v)))
+            A, B = sweeps.reverse(_columns(w), P, dP)
+            ans = B[sweeps.var_nodes]
+        if errors:
+            self._process_sweep_errors(ans, errors, 'Hessian-vector product')
+        return ans[:, 0].tolist()
+
+    def _check_weights(self, weights):
+        if weights is None:
+            return [1] * len(self.outputs)
+        if len(weights) != len(self.outputs):
+            raise ValueError(
+                "Expected %s weights (found %s)" % (len(self.outputs), len(weights))
+            )
+        return weights
+
+    def _get_sweeps(self):
+        if self._sweeps is None:
+            self._sweeps = _TapeSweeps(self)
+        return self._sweeps
+
+    def _jacobian(self, x, params):
+        sweeps = self._get_sweeps()
+        errors = set()
+        with np.errstate(all='call', call=lambda err, flag: errors.add(err)):
+            ans = sweeps.jacobian(sweeps.partials(sweeps.values(x, params)))
+        if errors:
+            self._process_evaluation_errors(
+                ans,
+                errors,
+                sweeps.jacobian_structure()[0],
+                'the derivatives of expression',
+            )
+        return ans
+
+    def _process_sweep_errors(self, ans, errors, what):
+        # As for _process_evaluation_errors(), but for results that
+        # combine all the expressions
+        invalid = ~np.isfinite(ans)
+        if not invalid.any():
+            return
+        msg = "Floating point error encountered evaluating the %s\n\tmessage: %s" % (
+            what,
+            ', '.join(sorted(errors)),
+        )
+        if repn_util.HALT_ON_EVALUATION_ERROR:
+            raise InvalidValueError(msg)
+        logger.warning(msg)
+        ans[invalid] = np.nan
+
+
+def _columns(x):
+    """Return the sequence `x` as a 2-D column array"""
+    return np.asarray(x, dtype=float).reshape(-1, 1)
+
+
+def compile_derivatives(exprs, variables=None):
+    """Compile a list of expressions into a :py:class:`CompiledDerivatives`
+
+    Parameters
+    ----------
+    exprs: Iterable[NumericValue]
+        The expressions to compile (e.g., constraint bodies)
+
+    variables: Iterable[VarData]
+        The ordering of the variables (see :py:class:`CompiledExpressions`)
+
+    """
+    return CompiledDerivatives(exprs, variables)
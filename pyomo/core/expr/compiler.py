@@ -0,0 +1,729 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""Compile Pyomo expressions into flat evaluation tapes
+
+This module "lowers" a list of Pyomo expression trees into a single
+linear instruction tape (in topological order, with shared
+subexpressions recorded only once), where the leaves are either
+constants or "slots" for the variables and (mutable) parameters that
+appear in the expressions.  The tape is then translated into a Python
+function (once per evaluation mode) that evaluates all the expressions
+without walking the expression trees: either for a single point (using
+Python floats) or for a batch of points (using NumPy arrays).
+
+Example
+-------
+
+.. code::
+
+   >>> f = compile_expressions([m.c[i].body for i in m.I])
+   >>> f.evaluate()                   # at the current variable values
+   >>> f.evaluate([1, 2, 3])          # at x = [1, 2, 3] (f.variables order)
+   >>> f.evaluate_batch(points)       # points: (n_points, len(f.variables))
+
+:py:func:`evaluate_at_points` and :py:func:`constraint_residuals_at_points`
+wrap the compilation and batch evaluation of expressions and constraint
+residuals over a set of points (e.g., for multistart screening or
+sampling-based parameter studies) without changing the model.
+
+"""
+
+import logging
+import math
+
+import pyomo.repn.util as repn_util
+
+from pyomo.common.dependencies import numpy as np
+from pyomo.common.errors import InvalidValueError
+from pyomo.common.numeric_types import native_numeric_types, native_types, value
+from pyomo.core.expr.numeric_expr import (
+    AbsExpression,
+    DivisionExpression,
+    Expr_ifExpression,
+    MaxExpression,
+    MinExpression,
+    NegationExpression,
+    PowExpression,
+    ProductExpression,
+    SumExpression,
+    UnaryFunctionExpression,
+)
+from pyomo.core.expr.relational_expr import (
+    EqualityExpression,
+    InequalityExpression,
+    RangedExpression,
+)
+from pyomo.core.expr.visitor import StreamBasedExpressionVisitor
+from pyomo.repn.util import InvalidNumber, apply_node_operation
+
+logger = logging.getLogger(__name__)
+
+# Nested (inlined) subexpressions deeper than this are stored in
+# temporary variables (the Python parser limits the expression nesting)
+_MAX_INLINE_DEPTH = 50
+
+# Sums with more terms are generated as calls to sum() (the Python
+# compiler recurses on chained binary operators)
+_MAX_INLINE_SUM = 100
+
+# The generated code is split into functions of (about) this many
+# lines (compiling very large functions is slow and memory intensive)
+_MAX_FUNCTION_LINES = 1000
+
+_node_opcodes = {
+    SumExpression: 'sum',
+    NegationExpression: 'neg',
+    ProductExpression: 'mul',
+    DivisionExpression: 'div',
+    PowExpression: 'pow',
+    AbsExpression: 'abs',
+    UnaryFunctionExpression: 'unary',
+    MaxExpression: 'max',
+    MinExpression: 'min',
+    Expr_ifExpression: 'expr_if',
+    InequalityExpression: 'ineq',
+    EqualityExpression: 'eq',
+    RangedExpression: 'ranged',
+}
+
+_leaf_opcodes = {'var', 'param', 'const'}
+
+# Map the UnaryFunctionExpression names to the corresponding NumPy ufuncs
+_numpy_functions = {
+    'log': 'log',
+    'log10': 'log10',
+    'sin': 'sin',
+    'cos': 'cos',
+    'tan': 'tan',
+    'cosh': 'cosh',
+    'sinh': 'sinh',
+    'tanh': 'tanh',
+    'asin': 'arcsin',
+    'acos': 'arccos',
+    'atan': 'arctan',
+    'exp': 'exp',
+    'sqrt': 'sqrt',
+    'asinh': 'arcsinh',
+    'acosh': 'arccosh',
+    'atanh': 'arctanh',
+    'ceil': 'ceil',
+    'floor': 'floor',
+}
+
+
+def _vectorize_node(node):
+    """Return a NumPy-vectorized version of node._apply_operation()
+
+    Evaluation errors are handled by :py:func:`apply_node_operation`
+    (and result in `nan`)
+
+    """
+
+    def _apply(*args):
+        ans = apply_node_operation(node, args)
+        if ans.__class__ is InvalidNumber:
+            return ans.value
+        return ans
+
+    return np.vectorize(_apply, otypes=[float])
+
+
+def _get_opcode(node_class):
+    for cls in node_class.__mro__:
+        if cls in _node_opcodes:
+            ans = _node_opcodes[cls]
+            break
+    else:
+        # Generic node: evaluated by calling node._apply_operation()
+        ans = 'node'
+    _node_opcodes[node_class] = ans
+    return ans
+
+
+class _TapeRecorder(StreamBasedExpressionVisitor):
+    def __init__(self, tape, variables, parameters):
+        super().__init__()
+        self.tape = tape
+        self.variables = variables
+        self.parameters = parameters
+        # map id(node) -> tape position (so shared subexpressions are
+        # only recorded once)
+        self.node_map = {}
+        self.const_map = {}
+        # Keep references to the nodes in node_map (so that the ids
+        # remain valid while we are recording)
+        self.nodes = []
+
+    def initializeWalker(self, expr):
+        walk, result = self.beforeChild(None, expr, 0)
+        if not walk:
+            return False, result
+        return True, expr
+
+    def beforeChild(self, node, child, child_idx):
+        if child.__class__ in native_types:
+            return False, self.record_constant(child)
+        ans = self.node_map.get(id(child), None)
+        if ans is not None:
+            return False, ans
+        if child.is_expression_type():
+            return True, None
+        if child.is_potentially_variable():
+            if not child.is_variable_type():
+                raise TypeError(
+                    "Cannot compile expression leaf '%s' of type %s"
+                    % (child, type(child).__name__)
+                )
+            ans = self._record_slot(child, 'var', self.variables)
+        elif child.is_constant():
+            ans = self.record_constant(value(child))
+            self.node_map[id(child)] = ans
+            self.nodes.append(child)
+        else:
+            # Mutable parameters (and other fixed leaves, e.g., units)
+            # are evaluated when the tape is evaluated
+            ans = self._record_slot(child, 'param', self.parameters)
+        return False, ans
+
+    def exitNode(self, node, data):
+        if node.is_named_expression_type():
+            ans = data[0]
+        else:
+            op = _get_opcode(node.__class__)
+            if op == 'unary':
+                info = (node.getname(), node._fcn)
+            elif op == 'ineq':
+                info = node.strict
+            elif op == 'ranged':
+                info = node._strict
+            elif op == 'node':
+                info = node
+            else:
+                info = None
+            ans = len(self.tape)
+            self.tape.append((op, tuple(data), info))
+        self.node_map[id(node)] = ans
+        self.nodes.append(node)
+        return ans
+
+    def record_constant(self, val):
+        key = (val.__class__, val)
+        ans = self.const_map.get(key, None)
+        if ans is None:
+            ans = self.const_map[key] = len(self.tape)
+            self.tape.append(('const', (), val))
+        return ans
+
+    def _record_slot(self, leaf, op, slots):
+        ans = self.node_map[id(leaf)] = len(self.tape)
+        self.nodes.append(leaf)
+        self.tape.append((op, (), len(slots)))
+        slots.append(leaf)
+        return ans
+
+
+class CompiledExpressions(object):
+    """A list of Pyomo expressions compiled into an evaluation tape
+
+    Parameters
+    ----------
+    exprs: Iterable[NumericValue]
+        The expressions to compile
+
+    variables: Iterable[VarData]
+        The ordering of the variables in the evaluation points.  If not
+        provided, the variables are ordered by their first appearance
+        in `exprs`.  Any variable appearing in `exprs` that is not
+        in `variables` is appended to the end of the list.
+
+    Attributes
+    ----------
+    expressions: list
+        The compiled expressions
+
+    tape: list
+        The instruction tape.  Each instruction is an
+        ``(opcode, args, data)`` tuple, where `args` are the positions
+        (in the tape) of the operation arguments.  Leaf instructions
+        are ``'const'`` (`data` is the value), and ``'var'`` and
+        ``'param'`` (`data` is the slot in :py:attr:`variables` or
+        :py:attr:`parameters`)
+
+    outputs: list
+        The tape positions holding the value of each expression
+
+    variables: list
+        The variables (slots) referenced by the tape
+
+    parameters: list
+        The mutable (non-variable) leaves referenced by the tape.  These
+        are evaluated every time the tape is evaluated.
+
+    """
+
+    def __init__(self, exprs, variables=None):
+        self.tape = []
+        self.variables = []
+        self.parameters = []
+        recorder = _TapeRecorder(self.tape, self.variables, self.parameters)
+        if variables is not None:
+            for v in variables:
+                if id(v) in recorder.node_map:
+                    raise ValueError(
+                        "Variable '%s' appears more than once in the "
+                        "variables list" % (v.name,)
+                    )
+                recorder._record_slot(v, 'var', self.variables)
+        self.expressions = list(exprs)
+        self.outputs = [recorder.walk_expression(e) for e in self.expressions]
+        self._evaluators = {}
+
+    def __len__(self):
+        return len(self.outputs)
+
+    def variable_values(self):
+        """Return the list of the current values of the variables"""
+        ans = [v.value for v in self.variables]
+        if None in ans:
+            v = self.variables[ans.index(None)]
+            raise ValueError(
+                "No value for uninitialized NumericValue object %s" % (v.name,)
+            )
+        return ans
+
+    def parameter_values(self):
+        """Return the list of the current values of the parameters"""
+        return [value(p) for p in self.parameters]
+
+    def evaluate(self, x=None):
+        """Evaluate the expressions at a single point
+
+        Parameters
+        ----------
+        x: Sequence[float]
+            The variable values (ordered as :py:attr:`variables`).  If
+            None, the current variable values are used.
+
+        Returns
+        -------
+        list: the value of each expression
+
+        """
+        x = self._check_point(x)
+        ans = [None] * len(self.outputs)
+        self._get_evaluator(False)(x, self.parameter_values(), ans)
+        return ans
+
+    def evaluate_batch(self, points, parameter_values=None):
+        """Evaluate the expressions at a batch of points
+
+        Evaluation errors (e.g., division by zero, or `log()` of a
+        negative number) follow the semantics of the model writers
+        (:py:func:`pyomo.repn.util.apply_node_operation`): a warning is
+        logged and the corresponding results are `nan` (unless
+        :py:data:`pyomo.repn.util.HALT_ON_EVALUATION_ERROR` is set, in
+        which case an exception is raised).
+
+        Parameters
+        ----------
+        points: numpy.ndarray
+            2-D array of variable values (one row per point, one column
+            per variable, ordered as :py:attr:`variables`)
+
+        parameter_values: Mapping
+            Map of parameters to the values to use in place of their
+            current values.  Values may be scalars or 1-D arrays (with
+            one value for each point).  Parameters that do not appear
+            in the expressions are ignored.
+
+        Returns
+        -------
+        numpy.ndarray: 2-D array (one row per point and one column
+            per expression) of the expression values
+
+        """
+        x, params = self._prepare_batch(points, parameter_values)
+        n_points = x.shape[1]
+        ans = np.empty((len(self.outputs), n_points))
+        errors = set()
+        with np.errstate(all='call', call=lambda err, flag: errors.add(err)):
+            self._get_evaluator(True)(x, params, ans)
+        if errors:
+            self._process_evaluation_errors(ans, errors)
+        return ans.T
+
+    def _check_point(self, x):
+        if x is None:
+            return self.variable_values()
+        if len(x) != len(self.variables):
+            raise ValueError(
+                "Expected a point with %s values (found %s)"
+                % (len(self.variables), len(x))
+            )
+        return x
+
+    def _prepare_batch(self, points, parameter_values):
+        points = np.asarray(points, dtype=float)
+        if points.ndim != 2 or points.shape[1] != len(self.variables):
+            raise ValueError(
+                "Expected a 2-D array of points with %s columns (found shape %s)"
+                % (len(self.variables), points.shape)
+            )
+        n_points = points.shape[0]
+        params = self.parameter_values()
+        if parameter_values:
+            slots = {id(p): i for i, p in enumerate(self.parameters)}
+            for param, val in parameter_values.items():
+                i = slots.get(id(param), None)
+                if i is None:
+                    continue
+                val = np.asarray(val, dtype=float)
+                if val.ndim and val.shape != (n_points,):
+                    raise ValueError(
+                        "Expected %s values for parameter '%s' (found shape %s)"
+                        % (n_points, param.name, val.shape)
+                    )
+                params[i] = val
+        # Evaluating the tape "row-wise" lets each instruction operate
+        # on a contiguous vector of point values
+        return np.ascontiguousarray(points.T), params
+
+    def _process_evaluation_errors(self, ans, errors, rows=None, what='expression'):
+        # Not all floating point errors are evaluation errors (e.g.,
+        # Expr_if evaluates both branches), so we only report the
+        # expressions that evaluated to non-finite values.  `rows` maps
+        # the rows of `ans` to expressions (if they are not 1:1).
+        invalid = ~np.isfinite(ans)
+        if rows is None:
+            by_expr = invalid
+        else:
+            by_expr = np.zeros((len(self.outputs), ans.shape[1]), dtype=bool)
+            np.logical_or.at(by_expr, rows, invalid)
+        for i in np.flatnonzero(by_expr.any(axis=1)):
+            msg = (
+                "Floating point error encountered evaluating %s "
+                "at %s point(s)\n\tmessage: %s\n\texpression: %s"
+                % (
+                    what,
+                    np.count_nonzero(by_expr[i]),
+                    ', '.join(sorted(errors)),
+                    self.expressions[i],
+                )
+            )
+            if repn_util.HALT_ON_EVALUATION_ERROR:
+                raise InvalidValueError(msg)
+            logger.warning(msg)
+        ans[invalid] = np.nan
+
+    def _get_evaluator(self, vectorized):
+        ans = self._evaluators.get(vectorized, None)
+        if ans is None:
+            ans = self._evaluators[vectorized] = self._generate(vectorized)
+        return ans
+
+    def _generate(self, vectorized):
+        """Translate the tape into a Python function
+
+        The function has the signature ``f(x, p, y)``, where `x` and
+        `p` are the variable and parameter values and `y` is the
+        (preallocated) output list / array.  Instructions that are
+        used more than once (or whose inlined representation would be
+        too deeply nested) are stored in temporary local variables;
+        all others are inlined into the expression that uses them.
+
+        The outputs are generated in groups, each of which is compiled
+        into a separate function of at most (about)
+        ``_MAX_FUNCTION_LINES`` lines.  Instructions that are shared
+        between groups are evaluated in every group that uses them.
+
+        """
+        tape = self.tape
+        uses = [0] * len(tape)
+        for op, args, data in tape:
+            for i in args:
+                uses[i] += 1
+        for i in self.outputs:
+            uses[i] += 1
+
+        gen = TapeCodeGenerator(vectorized)
+        funcs = []
+        lines = []
+        # map tape position -> source (for the current group)
+        exprs = {}
+        depth = {}
+        for i, root in enumerate(self.outputs):
+            # Collect the instructions this output needs that were not
+            # generated in the current group
+            needed = []
+            stack = [root]
+            while stack:
+                k = stack.pop()
+                if k in exprs or k in depth:
+                    continue
+                depth[k] = 0
+                needed.append(k)
+                stack.extend(tape[k][1])
+            for k in sorted(needed):
+                op, args, data = tape[k]
+                if not args and op in _leaf_opcodes:
+                    exprs[k] = gen.leaf(op, data)
+                    continue
+                s = gen.node(op, [exprs[j] for j in args], data)
+                d = 1 + max([depth[j] for j in args], default=0)
+                if uses[k] > 1 or d > _MAX_INLINE_DEPTH:
+                    lines.append(f't{k} = {s}')
+                    exprs[k] = f't{k}'
+                else:
+                    exprs[k] = s
+                    depth[k] = d
+            lines.append(f'y[{i}] = {exprs[root]}')
+            if len(lines) >= _MAX_FUNCTION_LINES:
+                funcs.append(gen.compile('evaluate', 'x, p, y', lines, 'y'))
+                lines = []
+                exprs = {}
+                depth = {}
+        if lines or not funcs:
+            funcs.append(gen.compile('evaluate', 'x, p, y', lines, 'y'))
+        if len(funcs) == 1:
+            return funcs[0]
+
+        def evaluate(x, p, y):
+            for f in funcs:
+                f(x, p, y)
+            return y
+
+        return evaluate
+
+
+class TapeCodeGenerator(object):
+    """Translate tape instructions into Python source code
+
+    This generates the source for individual tape instructions (either
+    for evaluating on Python floats or, if `vectorized`, on NumPy
+    arrays), and maintains the namespace (:py:attr:`env`) needed to
+    execute the generated code.  Leaves reference the variable values
+    as ``x[i]`` and the parameter values as ``p[i]``.
+
+    """
+
+    def __init__(self, vectorized):
+        self.vectorized = vectorized
+        if vectorized:
+            self.env = {
+                'abs': np.abs,
+                'max': lambda *args: np.maximum.reduce(np.broadcast_arrays(*args)),
+                'min': lambda *args: np.minimum.reduce(np.broadcast_arrays(*args)),
+                'where': np.where,
+                'land': np.logical_and,
+            }
+        else:
+            self.env = {'abs': abs, 'max': max, 'min': min}
+        self._names = {}
+
+    def env_name(self, obj, prefix):
+        """Return the name of (a new global variable holding) `obj`"""
+        if id(obj) not in self._names:
+            self._names[id(obj)] = name = f'{prefix}{len(self._names)}'
+            self.env[name] = obj
+        return self._names[id(obj)]
+
+    def leaf(self, op, data):
+        """Return the source for a leaf ('var', 'param', or 'const')"""
+        if op == 'var':
+            return f'x[{data}]'
+        elif op == 'param':
+            return f'p[{data}]'
+        if data.__class__ is int or data.__class__ is bool:
+            ans = repr(data)
+        elif data.__class__ in native_numeric_types and math.isfinite(data):
+            ans = repr(float(data))
+        else:
+            return self.env_name(data, 'c')
+        if ans[0] == '-':
+            # Protect negative constants (e.g., "(-2) ** x")
+            return f'({ans})'
+        return ans
+
+    def node(self, op, a, data):
+        """Return the source for an operation on the argument sources `a`"""
+        if op == 'sum':
+            if len(a) > _MAX_INLINE_SUM:
+                return f'sum(({"".join(i + ", " for i in a)}))'
+            return '(' + ' + '.join(a) + ')' if a else '0'
+        elif op == 'neg':
+            return f'(-{a[0]})'
+        elif op == 'mul':
+            return f'({a[0]} * {a[1]})'
+        elif op == 'div':
+            return f'({a[0]} / {a[1]})'
+        elif op == 'pow':
+            return f'({a[0]} ** {a[1]})'
+        elif op == 'abs':
+            return f'abs({a[0]})'
+        elif op in ('max', 'min'):
+            return f'{op}({", ".join(a)})'
+        elif op == 'unary':
+            name, fcn = data
+            if not self.vectorized:
+                f = self.env_name(fcn, 'f')
+            elif name in _numpy_functions:
+                f = self.env_name(getattr(np, _numpy_functions[name]), 'f')
+            else:
+                f = self.env_name(np.vectorize(fcn, otypes=[float]), 'f')
+            return f'{f}({a[0]})'
+        elif op == 'expr_if':
+            if self.vectorized:
+                return f'where({a[0]}, {a[1]}, {a[2]})'
+            return f'({a[1]} if {a[0]} else {a[2]})'
+        elif op == 'ineq':
+            return f'({a[0]} {"<" if data else "<="} {a[1]})'
+        elif op == 'eq':
+            return f'({a[0]} == {a[1]})'
+        elif op == 'ranged':
+            lb = f'{a[0]} {"<" if data[0] else "<="} {a[1]}'
+            ub = f'{a[1]} {"<" if data[1] else "<="} {a[2]}'
+            if self.vectorized:
+                return f'land({lb}, {ub})'
+            return f'({lb} and {ub})'
+        # Generic node: defer to the node's _apply_operation()
+        if self.vectorized:
+            fcn = self.env_name(_vectorize_node(data), 'n')
+            return f'{fcn}({", ".join(a)})'
+        fcn = self.env_name(data._apply_operation, 'n')
+        return f'{fcn}(({"".join(i + ", " for i in a)}))'
+
+    def compile(self, name, signature, lines, result):
+        """Compile the function `name` from the body `lines`"""
+        src = '\n    '.join(
+            [f'def {name}({signature}):'] + lines + [f'return {result}']
+        )
+        exec(src, self.env)
+        return self.env.pop(name)
+
+
+def compile_expressions(exprs, variables=None):
+    """Compile a list of expressions into a :py:class:`CompiledExpressions`
+
+    Parameters
+    ----------
+    exprs: Iterable[NumericValue]
+        The expressions to compile (e.g., constraint bodies)
+
+    variables: Iterable[VarData]
+        The ordering of the variables in the evaluation points (see
+        :py:class:`CompiledExpressions`)
+
+    """
+    return CompiledExpressions(exprs, variables)
+
+
+def _check_variables(compiled, variables):
+    if len(compiled.variables) != len(variables):
+        raise ValueError(
+            "The expressions reference variables that are not in the "
+            "variables list: %s"
+            % (', '.join(v.name for v in compiled.variables[len(variables) :]),)
+        )
+
+
+def evaluate_at_points(exprs, points, variables, parameter_values=None):
+    """Evaluate a list of expressions at a batch of points
+
+    The model is not changed (the variable values are taken from
+    `points` and not from the model).  Use :py:func:`compile_expressions`
+    directly to reuse the compiled expressions for multiple batches.
+
+    Parameters
+    ----------
+    exprs: Iterable[NumericValue]
+        The expressions to evaluate
+
+    points: numpy.ndarray
+        2-D array of variable values (one row per point, one column per
+        variable)
+
+    variables: Sequence[VarData]
+        The variables corresponding to the columns of `points`.  All
+        variables appearing in `exprs` must be included.
+
+    parameter_values: Mapping
+        Map of parameters to (scalar or per-point) values to use in
+        place of their current values
+
+    Returns
+    -------
+    numpy.ndarray: 2-D array (one row per point and one column per
+        expression) of the expression values
+
+    """
+    compiled = compile_expressions(exprs, variables)
+    _check_variables(compiled, variables)
+    return compiled.evaluate_batch(points, parameter_values)
+
+
+def constraint_residual(con):
+    """Return an expression for the violation of a constraint
+
+    The residual is ``max(lb - body, body - ub, 0)`` (i.e., 0 when the
+    constraint is satisfied).  Bounds that are None are omitted.
+
+    Parameters
+    ----------
+    con: ConstraintData
+        The constraint
+
+    """
+    lb, body, ub = con.to_bounded_expression()
+    if lb is None and ub is None:
+        return 0
+    if lb is not None and lb is ub:
+        return abs(body - ub)
+    args = [0]
+    if lb is not None:
+        args.append(lb - body)
+    if ub is not None:
+        args.append(body - ub)
+    return MaxExpression(args)
+
+
+def constraint_residuals_at_points(
+    constraints, points, variables, parameter_values=None
+):
+    """Evaluate the violation of a list of constraints at a batch of points
+
+    Parameters
+    ----------
+    constraints: Iterable[ConstraintData]
+        The constraints to evaluate
+
+    points: numpy.ndarray
+        2-D array of variable values (one row per point, one column per
+        variable)
+
+    variables: Sequence[VarData]
+        The variables corresponding to the columns of `points`.  All
+        variables appearing in the constraints must be included.
+
+    parameter_values: Mapping
+        Map of parameters to (scalar or per-point) values to use in
+        place of their current values
+
+    Returns
+    -------
+    numpy.ndarray: 2-D array (one row per point and one column per
+        constraint) of the constraint residuals (see
+        :py:func:`constraint_residual`)
+
+    """
+    return evaluate_at_points(
+        map(constraint_residual, constraints), points, variables, parameter_values
+    )
@@ -0,0 +1,235 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""Hash-consing (structural sharing) of Pyomo expression trees
+
+Pyomo creates new expression nodes every time an expression is built,
+so models generated by rules frequently contain many structurally
+identical copies of the same subexpression (e.g.,
+``exp(-E/(R*T[t]))`` repeated for every reaction).  A
+:py:class:`SubexpressionTable` maps every subexpression to a canonical
+node, such that structurally identical subexpressions (the same node
+types, local data, and leaves) are mapped to the same object.
+
+Unlike comparing expressions with
+:py:func:`pyomo.core.expr.compare.convert_expression_to_prefix_notation`,
+the structural key of each node only contains the ids of its (already
+canonical) children, so building the table is linear in the size of
+the expressions.  Constants are compared by value, while other leaves
+(variables, parameters, and named expressions) are only equal to
+themselves.
+
+"""
+
+from pyomo.common.numeric_types import native_types
+from pyomo.core.expr.base import ExpressionBase, NPV_Mixin
+from pyomo.core.expr.numvalue import NumericConstant
+from pyomo.core.expr.numeric_expr import (
+    ExternalFunctionExpression,
+    LinearExpression,
+    MonomialTermExpression,
+    UnaryFunctionExpression,
+)
+from pyomo.core.expr.relational_expr import InequalityExpression, RangedExpression
+from pyomo.core.expr.visitor import StreamBasedExpressionVisitor, polynomial_degree
+
+# Map node types to a function returning the (hashable) local data
+# that is part of the node's structural key
+_local_data = {
+    UnaryFunctionExpression: lambda node: node._name,
+    ExternalFunctionExpression: lambda node: node._fcn,
+    InequalityExpression: lambda node: node._strict,
+    RangedExpression: lambda node: node._strict,
+}
+
+# create_node_with_local_data() implementations that do not rely on
+# any local data
+_no_local_data = {
+    ExpressionBase.create_node_with_local_data,
+    NPV_Mixin.create_node_with_local_data,
+    MonomialTermExpression.create_node_with_local_data,
+    LinearExpression.create_node_with_local_data,
+}
+
+
+def _none(node):
+    return None
+
+
+def _get_local_data(node_class):
+    for cls in node_class.__mro__:
+        if cls in _local_data:
+            ans = _local_data[cls]
+            break
+    else:
+        if node_class.create_node_with_local_data in _no_local_data:
+            ans = _none
+        else:
+            # Unknown local data: the node is only equal to itself
+            ans = False
+    _local_data[node_class] = ans
+    return ans
+
+
+class _HashConsVisitor(StreamBasedExpressionVisitor):
+    def __init__(self, table):
+        super().__init__()
+        self.table = table
+
+    def initializeWalker(self, expr):
+        walk, result = self.beforeChild(None, expr, 0)
+        if not walk:
+            return False, result
+        return True, expr
+
+    def beforeChild(self, node, child, child_idx):
+        return self.table._before_child(child)
+
+    def exitNode(self, node, data):
+        return self.table._record_node(node, data)
+
+
+class SubexpressionTable(object):
+    """A table of the (canonical) subexpressions of a set of expressions
+
+    Every unique subexpression is assigned an integer id (in
+    topological order: the children of a subexpression have smaller
+    ids than the subexpression).
+
+    Attributes
+    ----------
+    nodes: list
+        The canonical node for each subexpression id.  Canonical
+        nodes are the original nodes where possible; nodes whose
+        arguments were replaced by canonical nodes are rebuilt.
+
+    args: list
+        The ids of the arguments of each subexpression (None for leaves)
+
+    uses: list
+        The number of times each subexpression is used (as an argument
+        of distinct canonical nodes, or as one of the expressions added
+        to the table)
+
+    degree: list
+        The polynomial degree of each subexpression (treating all
+        variables, fixed or not, as degree 1)
+
+    """
+
+    def __init__(self):
+        self.nodes = []
+        self.args = []
+        self.uses = []
+        self.degree = []
+        # map structural key -> id
+        self._keys = {}
+        # map id(node) -> id (so repeated walks of shared nodes are O(1))
+        self._visited = {}
+        # hold references to the nodes in _visited (so the ids remain valid)
+        self._refs = []
+        self._visitor = _HashConsVisitor(self)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def add(self, expr):
+        """Add an expression to the table and return its id"""
+        ans = self._visitor.walk_expression(expr)
+        self.uses[ans] += 1
+        return ans
+
+    def _register(self, key, node, args, degree):
+        ans = self._keys[key] = len(self.nodes)
+        self.nodes.append(node)
+        self.args.append(args)
+        self.uses.append(0)
+        self.degree.append(degree)
+        return ans
+
+    def _before_child(self, child):
+        if child.__class__ in native_types:
+            key = (child.__class__, child)
+            ans = self._keys.get(key, None)
+            if ans is None:
+                ans = self._register(key, child, None, 0)
+            return False, ans
+        ans = self._visited.get(id(child), None)
+        if ans is not None:
+            return False, ans
+        if child.is_expression_type() and not child.is_named_expression_type():
+            return True, None
+        if isinstance(child, NumericConstant):
+            # e.g., the function ids of PythonCallbackFunction arguments
+            key = (child.__class__, child.value)
+        else:
+            # Leaves (and named expressions) are only equal to themselves
+            key = ('leaf', id(child))
+        ans = self._keys.get(key, None)
+        if ans is None:
+            if not child.is_potentially_variable():
+                degree = 0
+            elif child.is_expression_type():
+                degree = polynomial_degree(child)
+            else:
+                degree = 1
+            ans = self._register(key, child, None, degree)
+        self._visited[id(child)] = ans
+        self._refs.append(child)
+        return False, ans
+
+    def _record_node(self, node, args):
+        local_data = _local_data.get(node.__class__, None)
+        if local_data is None:
+            local_data = _get_local_data(node.__class__)
+        if local_data is False:
+            key = ('node', id(node))
+        else:
+            key = (node.__class__, local_data(node), *args)
+        ans = self._keys.get(key, None)
+        if ans is None:
+            nodes = self.nodes
+            new_args = [nodes[i] for i in args]
+            canonical = node
+            for orig, new in zip(node.args, new_args):
+                if orig is not new and orig.__class__ not in native_types:
+                    canonical = node.create_node_with_local_data(new_args)
+                    break
+            try:
+                degree = node._compute_polynomial_degree([self.degree[i] for i in args])
+            except AttributeError:
+                degree = None
+            ans = self._register(key, canonical, tuple(args), degree)
+            uses = self.uses
+            for i in args:
+                uses[i] += 1
+        self._visited[id(node)] = ans
+        self._refs.append(node)
+        return ans
+
+
+def hash_cons(exprs):
+    """Return the expressions with structurally identical subexpressions
+    replaced by shared nodes
+
+    Parameters
+    ----------
+    exprs: Iterable[NumericValue]
+        The expressions
+
+    Returns
+    -------
+    list: the (equivalent) expressions, where all structurally
+        identical subexpressions are the same node object
+
+    """
+    table = SubexpressionTable()
+    return [table.nodes[table.add(e)] for e in exprs]
@@ -21,6 +21,7 @@ from pyomo.common.dependencies import attempt_import
 from pyomo.common.deprecation import deprecated, relocated_module_attribute
 from pyomo.common.errors import PyomoException, DeveloperError
 from pyomo.common.formatting import tostr
+from pyomo.common.gc_manager import PauseGC
 from pyomo.common.numeric_types import (
     native_types,
     nonpyomo_leaf_types,
@@ -1283,9 +1284,14 @@ class LinearExpression(SumExpression):
         contains only constants, NPV objects/expressions, variables, or
         :py:class:`MonomialTermExpression` objects.  Alternatively, you
         can specify the constant, the list of linear_coefs and the list
-        of linear_vars separately.  Note that these lists are NOT
+        of linear_vars separately (any sized iterables, e.g., numpy
+        arrays, are accepted).  Note that these lists are NOT
         preserved.
 
+        Building the expression from linear_coefs and linear_vars is
+        the fastest way to create large linear expressions, as it
+        bypasses the operator dispatch entirely.
+
         """
         # I am not sure why LinearExpression allows omitting args, but
         # it does.  If they are provided, they should be the (non-zero)
@@ -1312,9 +1318,17 @@ class LinearExpression(SumExpression):
                         f"linear_vars ({tostr(linear_vars)}) is not compatible "
                         f"with linear_coefs ({tostr(linear_coefs)})"
                     )
-                self._args_.extend(
-                    map(MonomialTermExpression, zip(linear_coefs, linear_vars))
-                )
+                if hasattr(linear_coefs, 'tolist'):
+                    # e.g., numpy arrays: store native Python numbers
+                    linear_coefs = linear_coefs.tolist()
+                # Creating many (container) objects triggers repeated
+                # (and for large models, expensive) cyclic garbage
+                # collection passes.  The new terms cannot create
+                # reference cycles, so we pause the GC.
+                with PauseGC():
+                    self._args_.extend(
+                        map(MonomialTermExpression, zip(linear_coefs, linear_vars))
+                    )
         self._nargs = len(self._args_)
 
     def _build_cache(self):
@@ -1399,6 +1413,11 @@ class _MutableSumExpression(SumExpression):
     def make_immutable(self):
         self.__class__ = SumExpression
 
+    def __deepcopy__(self, memo):
+        # Mutable expressions are never shared with a clone (bypass
+        # ExpressionBase.__deepcopy__)
+        return super(ExpressionBase, self).__deepcopy__(memo)
+
     def __iadd__(self, other):
         return _iadd_mutablesum_dispatcher[other.__class__](self, other)
 
@@ -1205,7 +1205,8 @@ def templatize_rule(block, rule, index_set):
             if internal_error is not None:
                 logger.error(
                     "The following exception was raised when "
-                    "templatizing the rule '%s':\n\t%s" % (rule.name, internal_error[1])
+                    "templatizing the rule '%s':\n\t%s"
+                    % (getattr(rule, 'name', rule), internal_error[1])
                 )
             raise TemplateExpressionError(
                 None,
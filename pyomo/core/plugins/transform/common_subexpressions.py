@@ -0,0 +1,124 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+from pyomo.common.config import ConfigBlock, ConfigValue, PositiveInt
+from pyomo.common.modeling import unique_component_name
+from pyomo.common.numeric_types import native_types
+from pyomo.core import (
+    TransformationFactory,
+    Constraint,
+    Expression,
+    NonNegativeIntegers,
+    Objective,
+)
+from pyomo.core.expr.hash_cons import SubexpressionTable
+from pyomo.core.plugins.transform.hierarchy import IsomorphicTransformation
+
+
+@TransformationFactory.register(
+    'core.eliminate_common_subexpressions',
+    doc="Replace repeated nonlinear subexpressions with named Expressions",
+)
+class EliminateCommonSubexpressions(IsomorphicTransformation):
+    """Replace repeated (nonlinear) subexpressions with named Expressions
+
+    This transformation finds the structurally identical subexpressions
+    in the active Constraint, Objective, and Expression components (see
+    :py:class:`pyomo.core.expr.hash_cons.SubexpressionTable`).  Every
+    nonlinear subexpression that is used more than once is replaced by
+    a single named Expression.  The new Expressions are added to an
+    indexed Expression component on the transformed model (or, if the
+    subexpression is the body of an existing Expression, that Expression
+    is reused).  Writers that support named expressions (e.g., the NL
+    writer, which exports them as "defined variables") will then only
+    write (and the solver will only evaluate and differentiate) each
+    subexpression once.
+
+    """
+
+    CONFIG = ConfigBlock("core.eliminate_common_subexpressions")
+    CONFIG.declare(
+        'min_uses',
+        ConfigValue(
+            default=2,
+            domain=PositiveInt,
+            description="Minimum number of uses of an extracted subexpression",
+            doc="""
+            Subexpressions are only replaced by a named Expression if
+            they appear at least this many times in the model.""",
+        ),
+    )
+
+    def __init__(self, **kwds):
+        kwds['name'] = "eliminate_common_subexpressions"
+        super().__init__(**kwds)
+
+    def _apply_to(self, instance, **kwds):
+        config = self.CONFIG(kwds.pop('options', {}))
+        config.set_value(kwds)
+
+        table = SubexpressionTable()
+        roots = []
+        # map subexpression id -> the Expression whose body it is
+        owners = {}
+        for obj in instance.component_data_objects(
+            (Constraint, Objective, Expression), active=True, descend_into=True
+        ):
+            if obj.expr is None:
+                continue
+            i = table.add(obj.expr)
+            roots.append((obj, i))
+            if obj.ctype is Expression:
+                owners.setdefault(i, obj)
+
+        nodes = table.nodes
+        # Only numeric subexpressions can be extracted (repeated
+        # relational expressions, e.g., duplicated constraints, are not
+        # valid Expression bodies)
+        extract = [
+            n >= config.min_uses
+            and table.args[i] is not None
+            and nodes[i].__class__ not in native_types
+            and nodes[i].is_numeric_type()
+            and nodes[i].is_potentially_variable()
+            and (table.degree[i] is None or table.degree[i] > 1)
+            for i, n in enumerate(table.uses)
+        ]
+        if not any(extract):
+            return
+
+        if any(extract[i] and i not in owners for i in range(len(nodes))):
+            new_exprs = Expression(NonNegativeIntegers)
+            instance.add_component(
+                unique_component_name(instance, '_common_subexpressions'), new_exprs
+            )
+
+        # Rebuild the (canonical) subexpressions in topological order,
+        # replacing the extracted subexpressions by named Expressions
+        rebuilt = [None] * len(nodes)
+        final = [None] * len(nodes)
+        for i, node in enumerate(nodes):
+            args = table.args[i]
+            if args is not None and any(final[j] is not nodes[j] for j in args):
+                node = node.create_node_with_local_data([final[j] for j in args])
+            rebuilt[i] = final[i] = node
+            if not extract[i]:
+                continue
+            if i in owners:
+                final[i] = owners[i]
+                continue
+            new_exprs[len(new_exprs) + 1] = node
+            final[i] = new_exprs[len(new_exprs)]
+
+        for obj, i in roots:
+            expr = rebuilt[i] if owners.get(i, None) is obj else final[i]
+            if expr is not obj.expr:
+                obj.set_value(expr)
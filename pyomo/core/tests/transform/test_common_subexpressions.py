@@ -0,0 +1,158 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+from io import StringIO
+
+import pyomo.common.unittest as unittest
+
+from pyomo.environ import (
+    Block,
+    ConcreteModel,
+    Constraint,
+    Expression,
+    Objective,
+    Param,
+    RangeSet,
+    TransformationFactory,
+    Var,
+    exp,
+    value,
+)
+from pyomo.core.expr.compare import assertExpressionsEqual
+from pyomo.repn.plugins.nl_writer import NLWriter
+
+
+class TestEliminateCommonSubexpressions(unittest.TestCase):
+    def make_model(self):
+        m = ConcreteModel()
+        m.I = RangeSet(3)
+        m.T = Var(m.I, initialize=lambda m, i: 300 + 10 * i)
+        m.c = Var(m.I, initialize=lambda m, i: i)
+        m.E = Param(initialize=1000, mutable=True)
+        m.rate = Constraint(
+            m.I,
+            rule=lambda m, i: m.c[i] * exp(-m.E / (8.314 * m.T[i]))
+            + m.c[i] ** 3 * exp(-m.E / (8.314 * m.T[i]))
+            == 1,
+        )
+        m.bal = Constraint(m.I, rule=lambda m, i: exp(-m.E / (8.314 * m.T[i])) <= 5)
+        m.lin = Constraint(expr=2 * m.c[1] + 2 * m.c[1] <= 3)
+        m.o = Objective(expr=m.c[1] ** 3 + sum(m.T[i] for i in m.I))
+        return m
+
+    def test_transformation(self):
+        m = self.make_model()
+        values = [value(c.body) for c in m.component_data_objects(Constraint)]
+        values.append(value(m.o))
+        TransformationFactory('core.eliminate_common_subexpressions').apply_to(m)
+        self.assertEqual(
+            [value(c.body) for c in m.component_data_objects(Constraint)]
+            + [value(m.o)],
+            values,
+        )
+        E = m._common_subexpressions
+        self.assertEqual(len(E), 4)
+        assertExpressionsEqual(self, E[2].expr, m.c[1] ** 3)
+        for i, k in zip(m.I, (1, 3, 4)):
+            assertExpressionsEqual(self, E[k].expr, exp(-m.E / (8.314 * m.T[i])))
+            self.assertIs(m.bal[i].body, E[k])
+        assertExpressionsEqual(self, m.rate[1].body, m.c[1] * E[1] + E[2] * E[1])
+        assertExpressionsEqual(self, m.rate[2].body, m.c[2] * E[3] + m.c[2] ** 3 * E[3])
+        assertExpressionsEqual(self, m.o.expr, E[2] + sum(m.T[i] for i in m.I))
+        # Linear subexpressions are not extracted
+        assertExpressionsEqual(self, m.lin.body, 2 * m.c[1] + 2 * m.c[1])
+
+    def test_min_uses(self):
+        m = self.make_model()
+        TransformationFactory('core.eliminate_common_subexpressions').apply_to(
+            m, min_uses=3
+        )
+        self.assertEqual(len(m._common_subexpressions), 3)
+        self.assertIs(m.bal[2].body, m._common_subexpressions[2])
+        m = self.make_model()
+        TransformationFactory('core.eliminate_common_subexpressions').apply_to(
+            m, min_uses=4
+        )
+        self.assertFalse(hasattr(m, '_common_subexpressions'))
+
+    def test_existing_expressions(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.y = Var()
+        m.e = Expression(expr=exp(m.x * m.y))
+        m.b = Block()
+        m.b.c = Constraint(expr=exp(m.x * m.y) + m.e <= 1)
+        m.b.d = Constraint(expr=exp(m.x * m.y) >= 0)
+        m.b.inactive = Constraint(expr=exp(m.x * m.y) >= -1)
+        m.b.inactive.deactivate()
+        TransformationFactory('core.eliminate_common_subexpressions').apply_to(m)
+        # The repeated subexpression is replaced by the existing Expression
+        self.assertFalse(hasattr(m, '_common_subexpressions'))
+        assertExpressionsEqual(self, m.e.expr, exp(m.x * m.y))
+        assertExpressionsEqual(self, m.b.c.body, m.e + m.e)
+        self.assertIs(m.b.d.body, m.e)
+        assertExpressionsEqual(self, m.b.inactive.body, exp(m.x * m.y))
+
+    def test_duplicate_constraints(self):
+        m = ConcreteModel()
+        m.x = Var(initialize=2)
+        m.y = Var(initialize=3)
+        m.c1 = Constraint(expr=m.x * m.y <= 1)
+        m.c2 = Constraint(expr=m.x * m.y <= 1)
+        m.d1 = Constraint(expr=m.x * m.y == 1)
+        m.d2 = Constraint(expr=m.x * m.y == 1)
+        m.r1 = Constraint(expr=(0, m.x * m.y, 1))
+        m.r2 = Constraint(expr=(0, m.x * m.y, 1))
+        TransformationFactory('core.eliminate_common_subexpressions').apply_to(m)
+        E = m._common_subexpressions
+        self.assertEqual(len(E), 1)
+        assertExpressionsEqual(self, E[1].expr, m.x * m.y)
+        for c in (m.c1, m.c2, m.d1, m.d2, m.r1, m.r2):
+            self.assertIs(c.body, E[1])
+        self.assertEqual(m.c2.upper, 1)
+        self.assertEqual(m.d2.lower, 1)
+        self.assertEqual((m.r2.lower, m.r2.upper), (0, 1))
+
+        # Repeated linear constraints have nothing to extract
+        m = ConcreteModel()
+        m.x = Var()
+        m.c1 = Constraint(expr=m.x <= 1)
+        m.c2 = Constraint(expr=m.x <= 1)
+        TransformationFactory('core.eliminate_common_subexpressions').apply_to(m)
+        self.assertFalse(hasattr(m, '_common_subexpressions'))
+        self.assertIs(m.c2.body, m.x)
+
+    def test_create_using(self):
+        m = self.make_model()
+        m2 = TransformationFactory('core.eliminate_common_subexpressions').create_using(
+            m
+        )
+        self.assertFalse(hasattr(m, '_common_subexpressions'))
+        self.assertEqual(len(m2._common_subexpressions), 4)
+
+    def test_nl_defined_variables(self):
+        m = self.make_model()
+        OUT = StringIO()
+        NLWriter().write(m, OUT, symbolic_solver_labels=True)
+        orig = OUT.getvalue()
+        TransformationFactory('core.eliminate_common_subexpressions').apply_to(m)
+        OUT = StringIO()
+        NLWriter().write(m, OUT, symbolic_solver_labels=True)
+        nl = OUT.getvalue()
+        self.assertNotIn('\nV', orig)
+        # Each shared subexpression is written once, as a defined variable
+        self.assertEqual(nl.count('\nV'), 4)
+        self.assertEqual(nl.count('o44'), 3)
+        self.assertEqual(orig.count('o44'), 9)
+
+
+if __name__ == "__main__":
+    unittest.main()
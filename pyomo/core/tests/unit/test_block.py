@@ -13,11 +13,13 @@
 #
 
 from io import StringIO
+import gc
 import logging
 import os
 import pickle
 import sys
 import types
+import weakref
 import json
 
 from copy import deepcopy
@@ -2498,6 +2500,60 @@ class TestBlock(unittest.TestCase):
             sorted(id(x) for x in (m.x, m.y[1], nb.x, nb.y[1])),
         )
 
+    def test_clone_share_structure(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2], initialize=1)
+        m.p = Param(mutable=True, initialize=2)
+        m.b = Block()
+        m.b.x = Var(bounds=(0, 5), initialize=3)
+        m.b.q = Param(mutable=True, initialize=4)
+        m.b.c = Constraint(expr=m.p * m.x[1] ** 2 + m.x[2] + m.b.q * m.b.x**2 <= 10)
+        m.b.d = Constraint(expr=m.p * m.x[1] ** 2 >= 1)
+        m.b.e = Expression(expr=m.x[1] + m.x[2] + m.b.x)
+        m.b.f = Expression(expr=m.x[1] + m.x[2])
+
+        nb = m.b.clone(share_structure=True)
+
+        # Subexpressions that only reference out-of-scope components
+        # are shared
+        e_c, e_nc = m.b.c.body, nb.c.body
+        self.assertIsNot(e_c, e_nc)
+        self.assertIs(e_c.arg(0), e_nc.arg(0))
+        self.assertIs(e_c.arg(1), e_nc.arg(1))
+        self.assertIsNot(e_c.arg(2), e_nc.arg(2))
+        self.assertIs(nb.d.expr, m.b.d.expr)
+        # ... while in-scope components are still duplicated
+        self.assertIs(e_nc.arg(2).arg(0), nb.q)
+        self.assertIs(e_nc.arg(2).arg(1).arg(0), nb.x)
+        self.assertEqual(
+            sorted(id(x) for x in EXPR.identify_variables(nb.c.body)),
+            sorted(id(x) for x in (m.x[1], m.x[2], nb.x)),
+        )
+        self.assertEqual(
+            sorted(id(x) for x in EXPR.identify_variables(nb.e.expr)),
+            sorted(id(x) for x in (m.x[1], m.x[2], nb.x)),
+        )
+
+        # Component state is independent
+        nb.x.setlb(1)
+        nb.x.value = 2
+        nb.q = 5
+        nb.d.deactivate()
+        self.assertEqual(m.b.x.bounds, (0, 5))
+        self.assertEqual(m.b.x.value, 3)
+        self.assertEqual(value(m.b.c.body), 1 + 2 + 4 * 9)
+        self.assertEqual(value(nb.c.body), 1 + 2 + 5 * 4)
+        self.assertTrue(m.b.d.active)
+        self.assertFalse(nb.d.active)
+
+        # Extending a shared (sum) expression does not change the other
+        self.assertIs(nb.f.expr, m.b.f.expr)
+        nb.f.expr += nb.x
+        self.assertEqual(m.b.f.expr.nargs(), 2)
+        self.assertEqual(nb.f.expr.nargs(), 3)
+        self.assertEqual(value(m.b.f), 2)
+        self.assertEqual(value(nb.f), 4)
+
     def test_clone_indexed_subblock(self):
         m = ConcreteModel()
 
@@ -3487,6 +3543,149 @@ class TestBlock(unittest.TestCase):
             ],
         )
 
+    def _traverse(self, fcn, *args, **kwds):
+        # The first traversal is not recorded, the second is recorded
+        # and cached, and the third is served from the cache
+        ans = list(fcn(*args, **kwds))
+        self.assertEqual(list(fcn(*args, **kwds)), ans)
+        self.assertEqual(list(fcn(*args, **kwds)), ans)
+        return ans
+
+    def test_cached_traversals(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2], dense=False)
+        m.x[1]
+        m.b = Block([1, 2])
+        m.b[1].c = Constraint(expr=m.x[1] >= 0)
+        m.b[2].c = Constraint([1, 2], rule=lambda b, i: m.x[1] <= i)
+
+        def cons(**kwds):
+            return self._traverse(m.component_data_objects, Constraint, **kwds)
+
+        ref = [m.b[1].c, m.b[2].c[1], m.b[2].c[2]]
+        self.assertEqual(list(m.component_data_objects(Constraint)), ref)
+        # The first traversal is only noted (not recorded)
+        self.assertEqual(list(m._traversal_cache.values()), [None])
+        self.assertEqual(cons(), ref)
+        self.assertEqual(len(m._traversal_cache), 1)
+        self.assertEqual(list(m._traversal_cache.values())[0][0], ref)
+        self.assertEqual(self._traverse(m.component_data_objects, Var), [m.x[1]])
+        # The cached results are invalidated by new component data ...
+        m.x[2]
+        self.assertEqual(
+            self._traverse(m.component_data_objects, Var), [m.x[1], m.x[2]]
+        )
+        # ... deactivating components ...
+        m.b[2].c[1].deactivate()
+        self.assertIsNone(m._traversal_cache)
+        self.assertEqual(cons(active=True), [m.b[1].c, m.b[2].c[2]])
+        m.b[1].deactivate()
+        self.assertEqual(cons(active=True), [m.b[2].c[2]])
+        self.assertEqual(self._traverse(m.block_data_objects, active=True), [m, m.b[2]])
+        m.b[1].activate()
+        self.assertEqual(
+            self._traverse(m.block_data_objects, active=True), [m, m.b[1], m.b[2]]
+        )
+        # ... adding or removing components ...
+        m.b[2].d = Constraint(expr=m.x[2] == 1)
+        self.assertEqual(cons(), ref + [m.b[2].d])
+        self.assertEqual(
+            self._traverse(m.component_objects, Constraint),
+            [m.b[1].c, m.b[2].c, m.b[2].d],
+        )
+        m.b[2].del_component('d')
+        self.assertEqual(cons(), ref)
+        # ... and removing component data
+        del m.b[2].c[2]
+        self.assertEqual(cons(), ref[:2])
+        # Partial traversals are not cached
+        m._traversal_cache = None
+        for i in range(3):
+            next(m.component_data_objects(Constraint))
+        self.assertEqual(list(m._traversal_cache.values()), [None])
+        # The cache is not copied when cloning or pickling the model
+        self.assertEqual(cons(), ref[:2])
+        self.assertIsNotNone(m._traversal_cache)
+        self.assertIsNone(m.clone()._traversal_cache)
+        m.b[2].c._rule = None
+        self.assertIsNone(pickle.loads(pickle.dumps(m))._traversal_cache)
+
+    def test_cached_traversals_with_references(self):
+        m = ConcreteModel()
+        m.b = Block([1, 2])
+        m.b[1].x = Var()
+        m.b[2].x = Var()
+        m.r = Reference(m.b[:].x)
+        self.assertEqual(
+            self._traverse(m.component_data_objects, Var), [m.b[1].x, m.b[2].x]
+        )
+        # Traversals that include References are not cached
+        self.assertEqual(list(m._traversal_cache.values()), [None])
+        self.assertEqual(
+            self._traverse(m.component_data_objects, Var, descend_into=False),
+            [m.b[1].x, m.b[2].x],
+        )
+        self.assertEqual(list(m._traversal_cache.values()), [None, None])
+
+    def test_cached_traversals_only_on_root(self):
+        m = ConcreteModel()
+        m.b = Block([1, 2])
+        m.b[1].x = Var()
+        self.assertEqual(self._traverse(m.b[1].component_data_objects), [m.b[1].x])
+        self.assertEqual(self._traverse(m.b[1].block_data_objects), [m.b[1]])
+        self.assertIsNone(m.b[1]._traversal_cache)
+        self.assertIsNone(m._traversal_cache)
+
+        # The cache of a (root) block is discarded when it is added to
+        # another block
+        b = Block([1])
+        b.construct()
+        b[1].x = Var()
+        self.assertEqual(self._traverse(b[1].component_data_objects), [b[1].x])
+        self.assertIsNotNone(b[1]._traversal_cache)
+        m.c = b
+        self.assertIsNone(b[1]._traversal_cache)
+        b[1].y = Var()
+        m.del_component(m.c)
+        self.assertEqual(self._traverse(b[1].component_data_objects), [b[1].x, b[1].y])
+
+    def test_cached_traversals_cleared(self):
+        m = ConcreteModel()
+        m.b = Block([1, 2])
+        self.assertEqual(self._traverse(m.block_data_objects), [m, m.b[1], m.b[2]])
+        self.assertIsNotNone(m._traversal_cache)
+        ref = weakref.ref(m.b[1])
+        m.del_component(m.b)
+        # The cache is cleared (and does not keep the removed blocks alive)
+        self.assertIsNone(m._traversal_cache)
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_cached_traversals_per_model(self):
+        m1 = ConcreteModel()
+        m1.x = Var()
+        m2 = ConcreteModel()
+        m2.x = Var()
+        self.assertEqual(self._traverse(m1.component_data_objects), [m1.x])
+        self.assertEqual(self._traverse(m2.component_data_objects), [m2.x])
+        # Changing one model does not discard the cache on the other
+        m2.y = Var()
+        self.assertIsNone(m2._traversal_cache)
+        self.assertIsNotNone(m1._traversal_cache)
+        self.assertEqual(self._traverse(m2.component_data_objects), [m2.x, m2.y])
+
+    def test_cached_traversals_lru(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.c = Constraint(expr=m.x >= 0)
+        for ctype in (Var, Constraint, Block, Param, Set, Objective) * 2:
+            for active in (None, True):
+                self._traverse(m.component_data_objects, ctype, active=active)
+        self.assertEqual(len(m._traversal_cache), 8)
+        # The most recently used traversals are kept
+        self.assertIn(('data', Objective, True, False, True, None), m._traversal_cache)
+        self.assertNotIn(('data', Var, None, False, True, None), m._traversal_cache)
+
     def test_deduplicate_component_data_iterindex(self):
         m = ConcreteModel()
         m.b = Block()
@@ -45,7 +45,7 @@ from pyomo.core.expr import (
     InequalityExpression,
     RangedExpression,
 )
-from pyomo.core.base.constraint import ConstraintData
+from pyomo.core.base.constraint import ConstraintData, TemplateConstraintData
 
 
 class TestConstraintCreation(unittest.TestCase):
@@ -1143,6 +1143,66 @@ class TestArrayCon(unittest.TestCase):
         m.c[2] = Constraint.Skip
         self.assertEqual(len(m.c), 0)
 
+    def test_templatize(self):
+        m = ConcreteModel()
+        m.I = RangeSet(3)
+        m.x = Var(m.I)
+        m.c = Constraint(m.I, rule=lambda m, i: (i, m.x[i] + 2 * i, None))
+        m.t = Constraint(
+            m.I, rule=lambda m, i: (i, m.x[i] + 2 * i, None), templatize=True
+        )
+        self.assertNotIsInstance(m.c[1], TemplateConstraintData)
+        self.assertEqual(len(m.t), 3)
+        for i in m.I:
+            self.assertIsInstance(m.t[i], TemplateConstraintData)
+        self.assertIs(m.t[1].template_expr(), m.t[2].template_expr())
+        lb, body, ub = m.t[2].template_bounded_expression()
+        self.assertEqual(str(body), 'x[_1] + 2*_1')
+
+        # Accessing the body / bounds generates the expression for
+        # (only) that index
+        self.assertEqual(str(m.t[2].body), 'x[2] + 4')
+        self.assertEqual(m.t[2].lb, 2)
+        self.assertEqual(m.t[3].to_bounded_expression(True), (3, m.t[3].body, None))
+        self.assertNotIsInstance(m.t[2], TemplateConstraintData)
+        self.assertNotIsInstance(m.t[3], TemplateConstraintData)
+        self.assertIsInstance(m.t[1], TemplateConstraintData)
+        self.assertEqual(str(m.t[1].expr), '1  <=  x[1] + 2')
+        self.assertNotIsInstance(m.t[1], TemplateConstraintData)
+
+        # Rules that cannot be templatized are constructed normally
+        m.s = Constraint(
+            m.I,
+            rule=lambda m, i: sum(m.x[j] for j in m.I if j <= i) >= 0,
+            templatize=True,
+        )
+        self.assertNotIsInstance(m.s[1], TemplateConstraintData)
+        self.assertEqual(str(m.s[2].body), 'x[1] + x[2]')
+        m.u = Constraint(
+            m.I,
+            rule=lambda m, i: m.x[i] >= 0 if i > 1 else Constraint.Skip,
+            templatize=True,
+        )
+        self.assertEqual(list(m.u), [2, 3])
+        self.assertNotIsInstance(m.u[2], TemplateConstraintData)
+        rhs = {1: 10, 2: 20, 3: 30}
+        m.v = Constraint(m.I, rule=lambda m, i: m.x[i] >= rhs[i], templatize=True)
+        self.assertNotIsInstance(m.v[1], TemplateConstraintData)
+        self.assertEqual(m.v[3].lb, 30)
+
+        # Other errors raised while templatizing the rule propagate
+        calls = []
+
+        def rule(m, i):
+            calls.append(i)
+            raise RuntimeError("rule error")
+
+        with LoggingIntercept() as LOG:
+            with self.assertRaisesRegex(RuntimeError, "rule error"):
+                m.w = Constraint(m.I, rule=rule, templatize=True)
+        self.assertEqual(len(calls), 1)
+        self.assertIn("Rule failed when generating expression", LOG.getvalue())
+
 
 class TestConList(unittest.TestCase):
     def create_model(self):
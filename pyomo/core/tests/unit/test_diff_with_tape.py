@@ -0,0 +1,308 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import math
+
+import pyomo.common.unittest as unittest
+
+from pyomo.common.collections import ComponentMap
+from pyomo.common.dependencies import numpy as np, numpy_available
+from pyomo.common.log import LoggingIntercept
+from pyomo.environ import (
+    ConcreteModel,
+    Expression,
+    ExternalFunction,
+    Expr_if,
+    Param,
+    Var,
+    acos,
+    acosh,
+    asin,
+    asinh,
+    atan,
+    atanh,
+    cos,
+    cosh,
+    exp,
+    floor,
+    log,
+    log10,
+    sin,
+    sinh,
+    sqrt,
+    tan,
+    tanh,
+)
+from pyomo.core.expr.calculus.diff_with_pyomo import reverse_ad
+from pyomo.core.expr.calculus.diff_with_tape import (
+    CompiledDerivatives,
+    compile_derivatives,
+)
+from pyomo.core.expr.numeric_expr import MaxExpression, MinExpression
+
+
+def _square(a):
+    return a**2
+
+
+@unittest.skipUnless(numpy_available, "numpy is not available")
+class TestCompiledDerivatives(unittest.TestCase):
+    def build_model(self):
+        m = ConcreteModel()
+        m.x = Var(initialize=0.5)
+        m.y = Var(initialize=2.3)
+        m.z = Var(initialize=1.5)
+        m.p = Param(initialize=3, mutable=True)
+        m.e = Expression(expr=exp(m.x) * m.p)
+        m.exprs = [
+            m.x * m.y / m.z - m.p,
+            m.x**m.y + m.z**2 + 2**m.z + m.x**1,
+            -abs(m.z) + sqrt(m.y) - log(m.x),
+            m.e + m.e**2 + sin(m.e),
+            m.y / (m.x * m.z) ** m.p,
+            m.y**m.z / m.x,
+            Expr_if(IF=m.x <= m.y, THEN=m.z**3, ELSE=m.y),
+            floor(m.y) * m.x,
+            5 + m.p,
+            m.x,
+        ]
+        return m
+
+    def finite_difference(self, f, x, h=1e-6):
+        x = np.array(x, dtype=float)
+        return np.array(
+            [
+                (np.array(f(list(x + dx))) - np.array(f(list(x - dx)))) / (2 * h)
+                for dx in np.eye(len(x)) * h
+            ]
+        ).T
+
+    def test_jacobian_structure(self):
+        m = self.build_model()
+        d = compile_derivatives(m.exprs)
+        self.assertIsInstance(d, CompiledDerivatives)
+        self.assertEqual([v.name for v in d.variables], ['x', 'y', 'z'])
+        rows, cols = d.jacobian_structure()
+        self.assertEqual(
+            rows, [0, 0, 0, 1, 1, 1, 2, 2, 2, 3, 4, 4, 4, 5, 5, 5, 6, 6, 7, 9]
+        )
+        self.assertEqual(
+            cols, [0, 1, 2, 0, 1, 2, 0, 1, 2, 0, 0, 1, 2, 0, 1, 2, 1, 2, 0, 0]
+        )
+
+    def test_jacobian(self):
+        m = self.build_model()
+        d = compile_derivatives(m.exprs)
+        rows, cols = d.jacobian_structure()
+        J = d.jacobian()
+        for r, c, val in zip(rows, cols, J):
+            if r < 6:  # reverse_ad does not support Expr_if / floor
+                self.assertAlmostEqual(val, reverse_ad(m.exprs[r])[d.variables[c]])
+        # Evaluate at a different point
+        x = [0.75, 1.5, 2]
+        J = d.jacobian(x)
+        dense = np.zeros((len(m.exprs), 3))
+        dense[rows, cols] = J
+        self.assertStructuredAlmostEqual(
+            dense.tolist(), self.finite_difference(d.evaluate, x).tolist(), abstol=1e-6
+        )
+        self.assertEqual(m.x.value, 0.5)
+        with self.assertRaisesRegex(ValueError, r"Expected a point with 3 values"):
+            d.jacobian([1, 2])
+
+    def test_unary_functions(self):
+        m = ConcreteModel()
+        m.x = Var(initialize=0.5)
+        m.y = Var(initialize=2)
+        funcs = [log, log10, sin, cos, tan, sinh, cosh, tanh]
+        funcs += [asin, acos, atan, exp, sqrt, asinh, atanh]
+        exprs = [f(m.x * m.y - 0.6) for f in funcs] + [acosh(m.x + m.y)]
+        d = compile_derivatives(exprs)
+        fd = self.finite_difference(d.evaluate, [0.5, 2])
+        rows, cols = d.jacobian_structure()
+        self.assertStructuredAlmostEqual(
+            d.jacobian(), fd[rows, cols].tolist(), abstol=1e-6
+        )
+        w = list(range(1, len(exprs) + 1))
+        H = self.finite_difference(lambda x: d.gradient(x, w), [0.5, 2])
+        self.assertStructuredAlmostEqual(
+            d.hessian_vector_product([0.3, -0.7], weights=w),
+            (H @ [0.3, -0.7]).tolist(),
+            abstol=1e-5,
+        )
+
+    def test_max_min(self):
+        m = ConcreteModel()
+        m.x = Var(initialize=0.5)
+        m.y = Var(initialize=2)
+        d = compile_derivatives(
+            [MaxExpression((m.x, m.y, m.x * m.y)), MinExpression((m.x, m.y, m.x))]
+        )
+        self.assertEqual(d.jacobian_structure(), ([0, 0, 1, 1], [0, 1, 0, 1]))
+        self.assertEqual(d.jacobian(), [0, 1, 1, 0])
+        self.assertEqual(d.jacobian([2, 3]), [3, 2, 1, 0])
+        self.assertEqual(d.hessian_vector_product([1, 1], [2, 3]), [1, 1])
+
+    def test_gradient(self):
+        m = self.build_model()
+        d = compile_derivatives(m.exprs)
+        rows, cols = d.jacobian_structure()
+        J = d.jacobian()
+        w = [1, -2, 3, 0.5, 1, 2, -1, 1, 4, 3]
+        ans = [0, 0, 0]
+        for r, c, val in zip(rows, cols, J):
+            ans[c] += w[r] * val
+        self.assertStructuredAlmostEqual(d.gradient(weights=w), ans)
+        self.assertStructuredAlmostEqual(
+            compile_derivatives([m.exprs[0]]).gradient(),
+            [reverse_ad(m.exprs[0])[v] for v in (m.x, m.y, m.z)],
+        )
+        with self.assertRaisesRegex(ValueError, r"Expected 10 weights \(found 2\)"):
+            d.gradient(weights=[1, 2])
+
+    def test_hessian_vector_product(self):
+        m = self.build_model()
+        d = compile_derivatives(m.exprs)
+        w = [1, -2, 3, 0.5, 1, 2, -1, 1, 4, 3]
+        x = [0.5, 2.3, 1.5]
+        H = self.finite_difference(lambda x: d.gradient(x, w), x)
+        for v in ([1, 0, 0], [0, 1, 0], [0.3, -0.7, 1.1]):
+            self.assertStructuredAlmostEqual(
+                d.hessian_vector_product(v, weights=w), (H @ v).tolist(), reltol=1e-6
+            )
+        # Linear expressions have a zero Hessian
+        d = compile_derivatives([m.x + 2 * m.y, m.p * m.z])
+        self.assertEqual(d.hessian_vector_product([1, 1, 1]), [0, 0, 0])
+        with self.assertRaisesRegex(ValueError, r"Expected a vector with 3 values"):
+            d.hessian_vector_product([1])
+
+    def test_parameters(self):
+        m = self.build_model()
+        d = compile_derivatives([m.p * m.x**2], [m.x])
+        self.assertEqual(d.jacobian(), [3])
+        m.p = 5
+        self.assertEqual(d.jacobian(), [5])
+        self.assertEqual(d.hessian_vector_product([1]), [10])
+
+    def test_deep_expression(self):
+        m = ConcreteModel()
+        m.x = Var(initialize=0.5)
+        e = m.x
+        for i in range(500):
+            e = (e + 1) * m.x
+        d = compile_derivatives([e])
+        self.assertAlmostEqual(d.jacobian()[0], reverse_ad(e)[m.x])
+
+    def test_many_expressions(self):
+        m = ConcreteModel()
+        m.x = Var(range(2001), initialize=lambda m, i: i / 2000)
+        m.e = Expression(expr=exp(m.x[0]))
+        exprs = [
+            m.x[i] ** 2 + m.x[i + 1] * m.x[i] - exp(m.x[i]) + m.e for i in range(2000)
+        ]
+        d = compile_derivatives(exprs)
+        x = [v.value for v in d.variables]
+        e = math.exp(x[0])
+        rows, cols = d.jacobian_structure()
+        J = d.jacobian()
+        ref = {}
+        for i in range(2000):
+            ref[i, i] = 2 * x[i] + x[i + 1] - math.exp(x[i])
+            ref[i, i + 1] = x[i]
+            ref[i, 0] = ref.get((i, 0), 0) + e
+        self.assertEqual(sorted(zip(rows, cols)), sorted(ref))
+        self.assertStructuredAlmostEqual(
+            J, [ref[r, c] for r, c in zip(rows, cols)], reltol=1e-12
+        )
+        # Compare the Hessian-vector product with finite differences of
+        # the gradient for a subset of the variables
+        w = [(-1) ** i for i in range(2000)]
+        v = [0.5] * 2001
+        hv = d.hessian_vector_product(v, weights=w)
+        h = 1e-6
+        xp = [xi + h * vi for xi, vi in zip(x, v)]
+        xm = [xi - h * vi for xi, vi in zip(x, v)]
+        fd = [
+            (a - b) / (2 * h)
+            for a, b in zip(d.gradient(xp, weights=w), d.gradient(xm, weights=w))
+        ]
+        self.assertStructuredAlmostEqual(hv, fd, abstol=1e-6)
+
+    def test_evaluation_errors(self):
+        m = ConcreteModel()
+        m.x = Var(initialize=0)
+        d = compile_derivatives([log(m.x), m.x**2])
+        with LoggingIntercept() as LOG:
+            J = d.jacobian()
+        self.assertStructuredAlmostEqual(J, [float('nan'), 0])
+        self.assertIn("expression: log(x)", LOG.getvalue())
+        with LoggingIntercept() as LOG:
+            g = d.gradient()
+        self.assertStructuredAlmostEqual(g, [float('nan')])
+        self.assertIn(
+            "Floating point error encountered evaluating the gradient\n"
+            "\tmessage: divide by zero",
+            LOG.getvalue(),
+        )
+
+    def test_external_function(self):
+        m = ConcreteModel()
+        m.x = Var(initialize=2)
+        m.p = Param(initialize=3, mutable=True)
+        m.f = ExternalFunction(_square)
+        d = compile_derivatives([m.f(m.p) * m.x])
+        self.assertEqual(d.jacobian(), [9])
+        d = compile_derivatives([m.f(m.x) + 1])
+        self.assertEqual(d.evaluate(), [5])
+        with self.assertRaisesRegex(
+            ValueError,
+            r"Cannot differentiate expression node 'f\(x, \d+\)' of type "
+            r"ExternalFunctionExpression",
+        ):
+            d.jacobian()
+
+    def test_jacobian_batch(self):
+        m = self.build_model()
+        d = compile_derivatives(m.exprs)
+        points = np.array([[0.5, 2.3, 1.5], [0.75, 1.5, 2], [1.5, 0.5, 1]])
+        ans = d.jacobian_batch(points)
+        self.assertEqual(ans.shape, (3, len(d.jacobian_structure()[0])))
+        for i, pt in enumerate(points):
+            self.assertStructuredAlmostEqual(list(ans[i]), d.jacobian(list(pt)))
+        ans = d.jacobian_batch(
+            points[:2], parameter_values=ComponentMap([(m.p, [1, 2])])
+        )
+        m.p = 2
+        self.assertStructuredAlmostEqual(list(ans[1]), d.jacobian(list(points[1])))
+
+    def test_jacobian_batch_errors(self):
+        m = ConcreteModel()
+        m.x = Var()
+        d = compile_derivatives([m.x**2, sqrt(m.x), m.x + log(m.x)])
+        with LoggingIntercept() as LOG:
+            ans = d.jacobian_batch([[0], [-1], [4]])
+        nan = float('nan')
+        self.assertStructuredAlmostEqual(
+            ans.tolist(), [[0, nan, nan], [-2, nan, 0], [8, 0.25, 1.25]]
+        )
+        self.assertIn(
+            "Floating point error encountered evaluating the derivatives of "
+            "expression at 2 point(s)\n\tmessage: divide by zero, invalid value\n"
+            "\texpression: sqrt(x)\n",
+            LOG.getvalue(),
+        )
+        self.assertIn("at 1 point(s)", LOG.getvalue())
+        self.assertIn("expression: x + log(x)\n", LOG.getvalue())
+        self.assertNotIn("x**2", LOG.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,307 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import math
+
+import pyomo.common.unittest as unittest
+import pyomo.repn.util as repn_util
+
+from pyomo.common.collections import ComponentMap
+from pyomo.common.dependencies import numpy as np, numpy_available
+from pyomo.common.errors import InvalidValueError
+from pyomo.common.log import LoggingIntercept
+from pyomo.environ import (
+    ConcreteModel,
+    Constraint,
+    Expression,
+    ExternalFunction,
+    Expr_if,
+    Param,
+    Var,
+    acos,
+    atan,
+    exp,
+    inequality,
+    log,
+    quicksum,
+    sin,
+    sqrt,
+    value,
+)
+from pyomo.core.expr.numeric_expr import MaxExpression, MinExpression
+from pyomo.core.expr.compare import assertExpressionsEqual
+from pyomo.core.expr.compiler import (
+    CompiledExpressions,
+    compile_expressions,
+    constraint_residual,
+    constraint_residuals_at_points,
+    evaluate_at_points,
+)
+
+
+def _square(a):
+    return a**2
+
+
+class TestCompiledExpressions(unittest.TestCase):
+    def build_model(self):
+        m = ConcreteModel()
+        m.x = Var(initialize=0.5)
+        m.y = Var(initialize=2)
+        m.z = Var([1, 2, 3], initialize={1: 1, 2: -2, 3: 3})
+        m.p = Param(initialize=3, mutable=True)
+        m.e = Expression(expr=exp(m.x) * m.p)
+        m.f = ExternalFunction(_square)
+        m.exprs = [
+            m.x + 2 * m.y - m.z[1] + 5,
+            m.x * m.y / m.z[3] - m.p,
+            m.x**m.y + m.z[2] ** 2 + 2 ** m.z[1],
+            -abs(m.z[2]) + sqrt(m.y) - log(m.x),
+            m.e + m.e**2 + sin(m.e),
+            acos(m.x) + atan(m.z[3]),
+            Expr_if(IF=m.x <= m.y, THEN=m.z[1], ELSE=m.z[3]),
+            Expr_if(IF=inequality(0, m.z[2], 1), THEN=m.z[1], ELSE=m.z[3]),
+            Expr_if(IF=m.x >= m.y, THEN=m.z[1], ELSE=m.z[3]),
+            MaxExpression((m.x, m.y, m.z[1])) + MinExpression((m.x, m.z[2])),
+            m.f(m.y) + 1,
+            m.p / 2,
+            m.x * 0 + 4,
+        ]
+        return m
+
+    def test_evaluate(self):
+        m = self.build_model()
+        f = compile_expressions(m.exprs)
+        self.assertIsInstance(f, CompiledExpressions)
+        self.assertEqual(len(f), len(m.exprs))
+        self.assertEqual(
+            [v.name for v in f.variables], ['x', 'y', 'z[1]', 'z[3]', 'z[2]']
+        )
+        # Note: the ExternalFunction id is also a (fixed) leaf
+        self.assertIs(f.parameters[0], m.p)
+        self.assertEqual(len(f.parameters), 2)
+        ans = f.evaluate()
+        for val, e in zip(ans, m.exprs):
+            self.assertAlmostEqual(val, value(e))
+        # Evaluating at a point does not change the model
+        ans = f.evaluate([0.25, 3, 2, 1, -1])
+        self.assertEqual(m.x.value, 0.5)
+        m.x.value = 0.25
+        m.y.value = 3
+        m.z[1].value = 2
+        m.z[2].value = -1
+        m.z[3].value = 1
+        for val, e in zip(ans, m.exprs):
+            self.assertAlmostEqual(val, value(e))
+        # Mutable parameter values are evaluated with the tape
+        m.p = 5
+        for val, e in zip(f.evaluate(), m.exprs):
+            self.assertAlmostEqual(val, value(e))
+
+    def test_shared_subexpressions(self):
+        m = self.build_model()
+        f = compile_expressions([m.e, m.e + 1, 2 * m.e])
+        # exp(x) and exp(x)*p are only recorded once
+        self.assertEqual(sum(1 for op, _, _ in f.tape if op == 'unary'), 1)
+        self.assertEqual(sum(1 for op, _, _ in f.tape if op == 'mul'), 2)
+        self.assertEqual(f.outputs[0], f.tape[f.outputs[1]][1][0])
+        self.assertEqual(f.evaluate(), [value(m.e), value(m.e) + 1, 2 * value(m.e)])
+
+    def test_variable_order(self):
+        m = self.build_model()
+        f = compile_expressions([m.x + m.y * m.z[2]], variables=[m.z[2], m.z[1]])
+        self.assertEqual([v.name for v in f.variables], ['z[2]', 'z[1]', 'x', 'y'])
+        self.assertEqual(f.evaluate([1, 7, 2, 3]), [5])
+        with self.assertRaisesRegex(ValueError, r"Expected a point with 4 values"):
+            f.evaluate([1, 2, 3])
+        with self.assertRaisesRegex(
+            ValueError, r"Variable 'x' appears more than once in the variables"
+        ):
+            compile_expressions([m.x], variables=[m.x, m.y, m.x])
+
+    def test_constants(self):
+        m = ConcreteModel()
+        m.x = Var(initialize=1)
+        f = compile_expressions([5, m.x, m.x + float('inf'), 2.5 * m.x])
+        self.assertEqual(f.evaluate(), [5, 1, float('inf'), 2.5])
+        self.assertEqual(sum(1 for op, _, _ in f.tape if op == 'const'), 3)
+        # Negative constants are protected from operator precedence
+        f = compile_expressions([(-2) ** m.x, m.x ** (-2) + 2])
+        self.assertEqual(f.evaluate([2]), [4, 2.25])
+
+    def test_uninitialized_variable(self):
+        m = ConcreteModel()
+        m.x = Var()
+        f = compile_expressions([m.x + 1])
+        with self.assertRaisesRegex(
+            ValueError, "No value for uninitialized NumericValue object x"
+        ):
+            f.evaluate()
+        self.assertEqual(f.evaluate([1]), [2])
+
+    def test_evaluation_errors(self):
+        m = ConcreteModel()
+        m.x = Var(initialize=0)
+        f = compile_expressions([1 / m.x])
+        with self.assertRaises(ZeroDivisionError):
+            f.evaluate()
+        f = compile_expressions([log(m.x)])
+        with self.assertRaisesRegex(ValueError, "math domain error"):
+            f.evaluate()
+
+    def test_deep_expression(self):
+        m = ConcreteModel()
+        m.x = Var(initialize=0.5)
+        e = m.x
+        for i in range(500):
+            e = (e + 1) * m.x
+        f = compile_expressions([e])
+        self.assertAlmostEqual(f.evaluate()[0], value(e))
+
+    def test_wide_sum(self):
+        m = ConcreteModel()
+        m.x = Var(range(5000), initialize=lambda m, i: i)
+        e = quicksum(m.x[i] for i in range(5000))
+        f = compile_expressions([e, e * m.x[1]])
+        self.assertEqual(f.evaluate(), [value(e)] * 2)
+        if numpy_available:
+            ans = f.evaluate_batch([range(5000), [1] * 5000])
+            self.assertEqual(ans.tolist(), [[value(e)] * 2, [5000] * 2])
+
+    def test_many_expressions(self):
+        # The generated code is split into multiple functions
+        m = ConcreteModel()
+        m.x = Var(range(3000), initialize=lambda m, i: i / 1000)
+        m.e = Expression(expr=exp(m.x[0] + 1))
+        exprs = [m.e * m.x[i] + m.x[i] ** 2 for i in range(3000)]
+        f = compile_expressions(exprs)
+        self.assertStructuredAlmostEqual(f.evaluate(), [value(e) for e in exprs])
+        if numpy_available:
+            ans = f.evaluate_batch([[0.5] * 3000])
+            self.assertStructuredAlmostEqual(
+                ans[0].tolist(), [0.5 * math.exp(1.5) + 0.25] * 3000
+            )
+
+    @unittest.skipUnless(numpy_available, "numpy is not available")
+    def test_evaluate_batch(self):
+        m = self.build_model()
+        f = compile_expressions(m.exprs)
+        points = np.array(
+            [[0.5, 2, 1, 3, -2], [0.25, 3, 2, 1, -1], [0.75, 0.5, -1, 2, 0.5]]
+        )
+        ans = f.evaluate_batch(points)
+        self.assertEqual(ans.shape, (3, len(m.exprs)))
+        for i, pt in enumerate(points):
+            self.assertStructuredAlmostEqual(list(ans[i]), f.evaluate(list(pt)))
+        with self.assertRaisesRegex(
+            ValueError, r"Expected a 2-D array of points with 5 columns"
+        ):
+            f.evaluate_batch(points[:, :3])
+
+    @unittest.skipUnless(numpy_available, "numpy is not available")
+    def test_evaluate_batch_errors(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.f = ExternalFunction(math.sqrt)
+        f = compile_expressions(
+            [1 / m.x, log(m.x), m.x**0.5, m.f(m.x), Expr_if(m.x > 0, log(m.x), 0)]
+        )
+        with LoggingIntercept() as LOG:
+            ans = f.evaluate_batch([[0], [-1], [4]])
+        nan = float('nan')
+        self.assertStructuredAlmostEqual(
+            ans.tolist(),
+            [
+                [nan, nan, 0, 0, 0],
+                [-1, nan, nan, nan, 0],
+                [0.25, math.log(4), 2, 2, math.log(4)],
+            ],
+        )
+        self.assertIn(
+            "Floating point error encountered evaluating expression at 1 point(s)\n"
+            "\tmessage: divide by zero, invalid value\n"
+            "\texpression: 1/x\n",
+            LOG.getvalue(),
+        )
+        self.assertIn("at 2 point(s)", LOG.getvalue())
+        self.assertIn("expression: log(x)", LOG.getvalue())
+        self.assertIn("expression: x**0.5", LOG.getvalue())
+        self.assertIn("Exception encountered evaluating expression", LOG.getvalue())
+        self.assertNotIn("Expr_if", LOG.getvalue())
+
+        _halt = repn_util.HALT_ON_EVALUATION_ERROR
+        try:
+            repn_util.HALT_ON_EVALUATION_ERROR = True
+            with self.assertRaisesRegex(
+                InvalidValueError, "Floating point error encountered"
+            ):
+                f.evaluate_batch([[0]])
+            self.assertEqual(list(f.evaluate_batch([[1]])[0]), [1, 0, 1, 1, 0])
+        finally:
+            repn_util.HALT_ON_EVALUATION_ERROR = _halt
+
+    @unittest.skipUnless(numpy_available, "numpy is not available")
+    def test_parameter_values(self):
+        m = self.build_model()
+        f = compile_expressions([m.x * m.p, m.e], [m.x])
+        ans = f.evaluate_batch(
+            [[1], [2], [3]], parameter_values=ComponentMap([(m.p, [1, 2, 3]), (m.y, 5)])
+        )
+        self.assertStructuredAlmostEqual(
+            ans.tolist(), [[1, math.exp(1)], [4, 2 * math.exp(2)], [9, 3 * math.exp(3)]]
+        )
+        ans = f.evaluate_batch([[1]], parameter_values=ComponentMap([(m.p, 2)]))
+        self.assertStructuredAlmostEqual(ans.tolist(), [[2, 2 * math.exp(1)]])
+        self.assertEqual(m.p.value, 3)
+        with self.assertRaisesRegex(
+            ValueError, r"Expected 1 values for parameter 'p' \(found shape \(2,\)\)"
+        ):
+            f.evaluate_batch([[1]], parameter_values=ComponentMap([(m.p, [1, 2])]))
+
+    @unittest.skipUnless(numpy_available, "numpy is not available")
+    def test_evaluate_at_points(self):
+        m = self.build_model()
+        ans = evaluate_at_points([m.x + m.y, m.x * m.y], [[1, 2], [3, 4]], [m.y, m.x])
+        self.assertEqual(ans.tolist(), [[3, 2], [7, 12]])
+        self.assertEqual((m.x.value, m.y.value), (0.5, 2))
+        with self.assertRaisesRegex(
+            ValueError,
+            "The expressions reference variables that are not in the "
+            r"variables list: z\[1\]",
+        ):
+            evaluate_at_points([m.x + m.z[1]], [[1]], [m.x])
+
+    @unittest.skipUnless(numpy_available, "numpy is not available")
+    def test_constraint_residuals_at_points(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.y = Var()
+        m.p = Param(initialize=1, mutable=True)
+        m.c = Constraint(expr=m.x + m.y <= 2)
+        m.d = Constraint(expr=m.x - m.y == m.p)
+        m.e = Constraint(expr=inequality(-1, m.x * m.y, 1))
+        m.f = Constraint(expr=m.x >= m.p)
+        assertExpressionsEqual(
+            self, constraint_residual(m.c), MaxExpression((0, m.x + m.y - 2))
+        )
+        assertExpressionsEqual(self, constraint_residual(m.d), abs(m.x - m.y - m.p))
+        points = [[0, 0], [2, 1], [-2, 3]]
+        cons = [m.c, m.d, m.e, m.f]
+        ans = constraint_residuals_at_points(cons, points, [m.x, m.y])
+        self.assertEqual(ans.tolist(), [[0, 1, 0, 1], [1, 0, 1, 0], [0, 6, 5, 3]])
+        ans = constraint_residuals_at_points(
+            cons, points, [m.x, m.y], parameter_values=ComponentMap([(m.p, [0, 1, -5])])
+        )
+        self.assertEqual(ans.tolist(), [[0, 0, 0, 0], [1, 0, 1, 0], [0, 0, 5, 0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
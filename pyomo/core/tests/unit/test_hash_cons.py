@@ -0,0 +1,123 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyomo.common.unittest as unittest
+
+from pyomo.environ import (
+    ConcreteModel,
+    Expression,
+    ExternalFunction,
+    Param,
+    Var,
+    cos,
+    exp,
+    inequality,
+    sin,
+)
+from pyomo.core.expr.compare import assertExpressionsEqual
+from pyomo.core.expr.hash_cons import SubexpressionTable, hash_cons
+
+
+def _square(a):
+    return a**2
+
+
+class TestHashCons(unittest.TestCase):
+    def test_shared_subexpressions(self):
+        m = ConcreteModel()
+        m.T = Var([1, 2])
+        m.x = Var()
+        m.E = Param(initialize=100, mutable=True)
+        exprs = [
+            exp(-m.E / (8.314 * m.T[t])) * m.x + m.x**2 + exp(-m.E / (8.314 * m.T[t]))
+            for t in (1, 2, 1)
+        ]
+        ans = hash_cons(exprs)
+        for new, orig in zip(ans, exprs):
+            assertExpressionsEqual(self, new, orig)
+        self.assertIs(ans[0], ans[2])
+        self.assertIsNot(ans[0], ans[1])
+        # The repeated exp() within (and across) expressions is shared
+        self.assertIs(ans[0].arg(0).arg(0), ans[0].arg(2))
+        self.assertIs(ans[0].arg(1), ans[1].arg(1))
+        self.assertIsNot(ans[0].arg(2), ans[1].arg(2))
+        # ...and the original expressions are not modified
+        self.assertIsNot(exprs[0].arg(0).arg(0), exprs[0].arg(2))
+
+    def test_local_data(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.y = Var()
+        m.f = ExternalFunction(_square)
+        m.g = ExternalFunction(_square)
+        ans = hash_cons(
+            [
+                sin(m.x),
+                cos(m.x),
+                sin(m.x),
+                m.f(m.x),
+                m.g(m.x),
+                m.f(m.x),
+                m.x <= m.y,
+                m.x < m.y,
+                m.x <= m.y,
+                inequality(0, m.x, 1),
+                inequality(0, m.x, 1, strict=True),
+                m.x + 1,
+                m.x + 1.0,
+            ]
+        )
+        self.assertIs(ans[0], ans[2])
+        self.assertIsNot(ans[0], ans[1])
+        self.assertIs(ans[3], ans[5])
+        self.assertIsNot(ans[3], ans[4])
+        self.assertIs(ans[6], ans[8])
+        self.assertIsNot(ans[6], ans[7])
+        self.assertIsNot(ans[9], ans[10])
+        # The constant types are part of the structure
+        self.assertIsNot(ans[11], ans[12])
+
+    def test_table(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.y = Var()
+        m.p = Param(mutable=True)
+        m.e = Expression(expr=m.x * m.y)
+        table = SubexpressionTable()
+        self.assertEqual(table.add(m.x), 0)
+        i = table.add((m.x + m.p) ** 2 + m.e)
+        j = table.add(m.e + (m.x + m.p) ** 2)
+        self.assertEqual(table.add((m.x + m.p) ** 2 + m.e), i)
+        self.assertNotEqual(i, j)
+        # x, p, x + p, 2, (x + p)**2, e, sum, sum
+        self.assertEqual(len(table), 8)
+        self.assertIs(table.nodes[5], m.e)
+        self.assertEqual(table.args[i], (4, 5))
+        self.assertEqual(table.args[j], (5, 4))
+        self.assertEqual(table.uses, [2, 1, 1, 1, 2, 2, 2, 1])
+        self.assertEqual(table.degree, [1, 0, 1, 0, 2, 2, 2, 2])
+
+    def test_deep_expression(self):
+        m = ConcreteModel()
+        m.x = Var()
+        exprs = []
+        for k in range(2):
+            e = m.x
+            for i in range(1000):
+                e = (e + 1) * m.x
+            exprs.append(e)
+        ans = hash_cons(exprs)
+        self.assertIs(ans[0], ans[1])
+        self.assertIs(ans[0], exprs[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
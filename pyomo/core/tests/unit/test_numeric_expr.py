@@ -13,6 +13,7 @@
 #
 
 import copy
+import gc
 import pickle
 import math
 import os
@@ -24,6 +25,7 @@ currdir = dirname(abspath(__file__)) + os.sep
 
 from filecmp import cmp
 import pyomo.common.unittest as unittest
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.common.log import LoggingIntercept
 from io import StringIO
 
@@ -4843,6 +4845,32 @@ class TestLinearExpression(unittest.TestCase):
         self.assertEqual(e.linear_vars, [m.y, m.x])
         self.assertEqual(e.linear_coefs, [4, 5])
 
+    @unittest.skipUnless(numpy_available, "numpy is not available")
+    def test_init_from_arrays(self):
+        m = ConcreteModel()
+        m.x = Var(range(4))
+        e = LinearExpression(
+            constant=1, linear_coefs=np.arange(4.0), linear_vars=list(m.x.values())
+        )
+        self.assertTrue(gc.isenabled())
+        self.assertIs(e.__class__, LinearExpression)
+        self.assertEqual(e.nargs(), 5)
+        self.assertExpressionsEqual(
+            e,
+            LinearExpression(
+                [1] + [MonomialTermExpression((float(i), m.x[i])) for i in range(4)]
+            ),
+        )
+        self.assertEqual(e.constant, 1)
+        self.assertEqual(e.linear_vars, list(m.x.values()))
+        self.assertEqual(e.linear_coefs, [0, 1, 2, 3])
+        with self.assertRaisesRegex(
+            ValueError, r"linear_vars \(.*\) is not compatible with linear_coefs"
+        ):
+            LinearExpression(
+                linear_coefs=np.arange(3.0), linear_vars=list(m.x.values())
+            )
+
     def test_to_string(self):
         m = ConcreteModel()
         m.x = Var()
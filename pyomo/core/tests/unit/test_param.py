@@ -24,6 +24,8 @@ import os
 import sys
 
 import pyomo.common.unittest as unittest
+from pyomo.common.dependencies import numpy as np, numpy_available
+from pyomo.common.dependencies import pandas as pd, pandas_available
 
 from pyomo.environ import (
     Set,
@@ -1849,6 +1851,17 @@ class MiscNonIndexedParamBehaviorTests(unittest.TestCase):
 
         self.assertEqual(3.0, value(model.CON[None].lower))
 
+    def test_store_values_dict_non_numeric(self):
+        m = ConcreteModel()
+        m.p = Param([1, 2, 3], mutable=True, within=Any, initialize=0)
+        m.p.store_values({1: (1, 2), 2: (3,)})
+        self.assertEqual(m.p.extract_values(), {1: (1, 2), 2: (3,), 3: 0})
+        m.p.store_values({1: (1, 2), 3: (3, 4)})
+        self.assertEqual(m.p.extract_values(), {1: (1, 2), 2: (3,), 3: (3, 4)})
+        m.q = Param([1, 2], mutable=True, within=Reals, initialize=0)
+        with self.assertRaisesRegex(ValueError, "Value not in parameter domain"):
+            m.q.store_values({1: (1, 2), 2: (3, 4)})
+
 
 # Add test methods for all intrinsic functions
 assignTestsNonIndexedParamTests(MiscNonIndexedParamBehaviorTests, intrinsic_test_list)
@@ -2295,6 +2308,43 @@ class MiscIndexedParamBehaviorTests(unittest.TestCase):
         self.assertEqual(len(m.p), 2)
         self.assertEqual(len(m.p._data), 0)
 
+    @unittest.skipUnless(numpy_available, "bulk array storage requires numpy")
+    def test_store_values_array(self):
+        m = ConcreteModel()
+        m.p = Param([1, 3, 2], mutable=True, within=NonNegativeReals)
+        m.p.store_values(np.array([1, 2, 3.5]))
+        self.assertEqual(m.p.extract_values(), {1: 1, 3: 2, 2: 3.5})
+        m.p.store_values(np.array([1, 2, 3]))
+        self.assertIs(type(m.p[1].value), int)
+        with self.assertRaisesRegex(ValueError, "Value not in parameter domain"):
+            m.p.store_values(np.array([1, -2, 3]))
+        with self.assertRaisesRegex(ValueError, "expected a 1-D array with 3"):
+            m.p.store_values(np.array([1, 2]))
+        m.p.store_values(np.array([4, 5, 6]), check=False)
+        self.assertEqual(m.p.extract_values(), {1: 4, 3: 5, 2: 6})
+
+        m.q = Param([1, 2], mutable=True, validate=lambda m, v, i: v < 10)
+        m.q.store_values(np.array([1.5, 2.5]))
+        self.assertEqual(m.q.extract_values(), {1: 1.5, 2: 2.5})
+        with self.assertRaisesRegex(ValueError, "failed parameter validation"):
+            m.q.store_values(np.array([1, 20]))
+
+    @unittest.skipUnless(numpy_available, "bulk storage requires numpy")
+    def test_store_values_dict(self):
+        m = ConcreteModel()
+        m.p = Param([1, 2, 3], mutable=True, within=Integers, initialize=0)
+        m.p.store_values({1: 5, 3: 7})
+        self.assertEqual(m.p.extract_values(), {1: 5, 2: 0, 3: 7})
+        m.p.store_values({2: m.p[1]})
+        self.assertEqual(m.p.extract_values(), {1: 5, 2: 5, 3: 7})
+        with self.assertRaisesRegex(ValueError, "Value not in parameter domain"):
+            m.p.store_values({1: 1.5})
+        with self.assertRaisesRegex(KeyError, "Index '4' is not valid"):
+            m.p.store_values({4: 1})
+        if pandas_available:
+            m.p.store_values(pd.Series({1: 1, 2: 2}))
+            self.assertEqual(m.p.extract_values(), {1: 1, 2: 2, 3: 7})
+
 
 # Add test methods for all intrinsic functions
 assignTestsIndexedParamTests(MiscIndexedParamBehaviorTests, intrinsic_test_list)
@@ -439,6 +439,51 @@ class TestReferenceDict(unittest.TestCase):
             LOG.getvalue(),
         )
 
+    def test_lookup_index(self):
+        m = self.m
+        m.s = Var([1, 2, 3], [4, 5], dense=False)
+        m.s[1, 4]
+        m.s[2, 4]
+        rd = _ReferenceDict(m.s[:, 4])
+        self.assertIs(rd[1], m.s[1, 4])
+        self.assertEqual(rd._index, {1: m.s[1, 4]})
+        self.assertEqual(list(rd.items()), [(1, m.s[1, 4]), (2, m.s[2, 4])])
+        self.assertEqual(rd._index, {1: m.s[1, 4], 2: m.s[2, 4]})
+        self.assertEqual(len(rd), 2)
+        # Cached iterations are invalidated by new (sparse) data
+        m.s[3, 4]
+        self.assertEqual(len(rd), 3)
+        self.assertEqual(list(rd), [1, 2, 3])
+        # ... and the index is invalidated by removing data
+        s_2_4 = m.s[2, 4]
+        del m.s[2, 4]
+        self.assertNotIn(2, rd)
+        self.assertEqual(list(rd.values()), [m.s[1, 4], m.s[3, 4]])
+        self.assertIsNot(rd[2], s_2_4)
+        # ... or replacing components
+        x = m.b[1, 4].x[7, 10]
+        rd = _ReferenceDict(m.b[:, 4].x[7, :])
+        self.assertIs(rd[1, 10], x)
+        m.b[1, 4].del_component('x')
+        m.b[1, 4].x = Var([7], [10])
+        self.assertIs(rd[1, 10], m.b[1, 4].x[7, 10])
+        self.assertIsNot(rd[1, 10], x)
+        # Values that are not component data are not indexed
+        rd = _ReferenceDict(m.b[:, 4].z.value)
+        self.assertEqual(list(rd.values()), [None, None])
+        self.assertEqual(rd[1], None)
+        self.assertEqual((rd._index, rd._iterations), ({}, {}))
+        m.b[1, 4].z = 5
+        self.assertEqual(rd[1], 5)
+        self.assertEqual(list(rd.values()), [5, None])
+        # Iterations through explicit indices are not cached, but
+        # lookups are
+        rd = _ReferenceDict(m.b[:, 4].y[8])
+        self.assertIs(rd[2], m.b[2, 4].y[8])
+        self.assertEqual(len(rd), 2)
+        self.assertEqual(rd._index, {2: m.b[2, 4].y[8]})
+        self.assertEqual(rd._iterations, {})
+
 
 class TestReferenceSet(unittest.TestCase):
     def test_str(self):
@@ -98,6 +98,7 @@ from pyomo.core.base.set import (
     RealSet,
     simple_set_rule,
     set_options,
+    array_in_domain,
 )
 from pyomo.environ import (
     AbstractModel,
@@ -3465,6 +3466,70 @@ J : Size=1, Index=None, Ordered=False
         self.assertIn((2, 5), m.Z)
         self.assertNotIn((2, 5, 3), m.Z)
 
+    def test_nested_setproduct(self):
+        m = ConcreteModel()
+        m.A = RangeSet(3)
+        m.B = Set(initialize=['a', 'b'])
+        m.D = Set(initialize=[(1, 2), (2, 3)])
+        m.P = m.A * m.B * m.D
+        self.assertEqual(len(m.P), 12)
+        self.assertEqual(m.P.dimen, 4)
+        ref = [
+            (a, b) + d
+            for a in m.A.ordered_data()
+            for b in m.B.ordered_data()
+            for d in m.D
+        ]
+        self.assertEqual(list(m.P), ref)
+        for i, v in enumerate(ref):
+            self.assertEqual(m.P.at(i + 1), v)
+            self.assertEqual(m.P.ord(v), i + 1)
+        self.assertEqual(m.P.at(-1), (3, 'b', 2, 3))
+        with self.assertRaisesRegex(IndexError, "P index out of range"):
+            m.P.at(13)
+        self.assertEqual(m.P.ord((2, 'a', (2, 3))), 6)
+        with self.assertRaisesRegex(IndexError, "item not in Set"):
+            m.P.ord((2, 'a', 2, 4))
+        self.assertIn((2, 'a', 2, 3), m.P)
+        self.assertIn(((2, 'a'), (2, 3)), m.P)
+        self.assertNotIn((2, 'c', 2, 3), m.P)
+        self.assertNotIn((2, 'a', 2, 3, 4), m.P)
+
+        m.Q = m.A * m.D
+        self.assertEqual(m.Q.ord((2, 1, 2)), 3)
+        self.assertEqual(m.Q.at(3), (2, 1, 2))
+
+    @unittest.skipUnless(numpy_available, "isin() requires numpy")
+    def test_setproduct_isin(self):
+        m = ConcreteModel()
+        m.A = RangeSet(100)
+        m.B = Set(initialize=['b%s' % i for i in range(10)])
+        m.C = Set(initialize=[1, 3, 5.5])
+        m.D = Set(initialize=[(i, i + 1) for i in range(10)])
+        m.P = m.A * m.B * m.C * m.D
+        vals = [
+            (1, 'b1', 3, 4, 5),
+            (1, 'b1', 3, 4, 6),
+            (101, 'b1', 3, 4, 5),
+            (2, 'x', 5.5, 0, 1),
+            (2, 'b2', 5.5, 0, 1),
+            (2, 'b2', 2, 0, 1),
+        ]
+        ref = [v in m.P for v in vals]
+        self.assertEqual(ref, [True, False, False, False, True, False])
+        self.assertEqual(m.P.isin(vals).tolist(), ref)
+
+        m.Q = m.A * m.C
+        vals = np.array([[1, 1], [2, 2], [3, 5.5], [0.5, 3], [np.nan, 1]])
+        self.assertEqual(m.Q.isin(vals).tolist(), [True, False, True, False, False])
+        self.assertEqual((m.A * Reals).isin(vals).tolist(), [True] * 3 + [False] * 2)
+        self.assertEqual((m.B * m.A).isin(np.array([['b1', '3']])).tolist(), [False])
+        self.assertEqual(m.Q.isin([]).tolist(), [])
+        with self.assertRaisesRegex(ValueError, "expects a 2-D array with 2 columns"):
+            m.Q.isin([(1, 2, 3)])
+        with self.assertRaisesRegex(ValueError, "requires factor sets with known"):
+            (m.A * Any).isin(vals)
+
 
 class TestGlobalSets(unittest.TestCase):
     def test_globals(self):
@@ -4040,6 +4105,58 @@ class TestSet(unittest.TestCase):
             self.assertEqual(output.getvalue(), "")
             _verify(m.I, [5, 6])
 
+    def test_incremental_ordered_updates(self):
+        # Adding / removing values maintains the ordered values in place
+        # (without rebuilding them)
+        for ordered in (Set.InsertionOrder, Set.SortedOrder):
+            m = ConcreteModel()
+            m.I = Set(ordered=ordered, initialize=range(0, 20, 2))
+            ref = list(m.I)
+            self.assertEqual(m.I.next(4), 6)
+            _ordered = m.I._ordered_values
+            for i, v in enumerate((7, 21, -1, 3, 13)):
+                m.I.add(v)
+                ref.append(v)
+                if ordered is Set.SortedOrder:
+                    ref.sort()
+                self.assertIs(m.I._ordered_values, _ordered)
+                self.assertEqual(list(m.I), ref)
+                self.assertEqual(
+                    [m.I.ord(v) for v in ref], list(range(1, len(ref) + 1))
+                )
+                self.assertEqual(m.I.ord((v,)), ref.index(v) + 1)
+                self.assertEqual(m.I.prev(ref[-1]), ref[-2])
+            for v in (ref[-1], ref[0], 7):
+                m.I.remove(v)
+                ref.remove(v)
+                self.assertEqual(list(m.I), ref)
+                self.assertEqual(
+                    [m.I.ord(v) for v in ref], list(range(1, len(ref) + 1))
+                )
+                self.assertEqual([m.I.at(i + 1) for i in range(len(ref))], ref)
+            self.assertEqual(m.I.pop(), ref.pop())
+            self.assertEqual([m.I.ord(v) for v in ref], list(range(1, len(ref) + 1)))
+
+        # Values that are not comparable fall back on the robust sort
+        m = ConcreteModel()
+        m.I = Set(ordered=Set.SortedOrder, initialize=[3, 1, 2])
+        self.assertEqual(m.I.ord(3), 3)
+        m.I.add('a')
+        self.assertEqual(list(m.I), [1, 2, 3, 'a'])
+        self.assertIsNone(m.I._valid_positions)
+        self.assertEqual(m.I.ord('a'), 4)
+        m.I.add(0)
+        self.assertEqual(list(m.I), [0, 1, 2, 3, 'a'])
+        m.I.remove('a')
+        self.assertEqual(m.I.ord(3), 4)
+
+        # User-provided sort functions rebuild the ordered values
+        m.J = Set(ordered=lambda x: sorted(x, reverse=True), initialize=[1, 3])
+        self.assertEqual(m.J.ord(3), 1)
+        m.J.add(2)
+        self.assertEqual(list(m.J), [3, 2, 1])
+        self.assertEqual(m.J.ord(1), 3)
+
     def test_unordered_insertion_deletion(self):
         def _verify(_s, _l):
             self.assertFalse(_s.isordered())
@@ -6000,6 +6117,30 @@ class TestSetUtils(unittest.TestCase):
         a.construct()
         self.assertEqual(a.get_interval(), (1, 1, 0))
 
+    @unittest.skipUnless(numpy_available, "array_in_domain requires numpy")
+    def test_array_in_domain(self):
+        vals = np.array([0, 1, 0.5, -1, np.nan, np.inf, 2])
+        self.assertEqual(array_in_domain(Reals, vals).tolist(), [1, 1, 1, 1, 0, 1, 1])
+        self.assertEqual(
+            array_in_domain(NonNegativeReals, vals).tolist(), [1, 1, 1, 0, 0, 1, 1]
+        )
+        self.assertEqual(
+            array_in_domain(Integers, vals).tolist(), [1, 1, 0, 1, 0, 0, 1]
+        )
+        self.assertEqual(array_in_domain(Binary, vals).tolist(), [1, 1, 0, 0, 0, 0, 0])
+        self.assertEqual(array_in_domain(Any, vals).tolist(), [1, 1, 1, 1, 0, 1, 1])
+        self.assertEqual(
+            array_in_domain(Binary, np.array([True, False])).tolist(), [1, 1]
+        )
+        # Domains (and values) that cannot be checked vectorially
+        a = Set(initialize=[0, 5, 7])
+        a.construct()
+        self.assertEqual(array_in_domain(a, vals).tolist(), [0] * 7)
+        a = RangeSet(0.5, 3, 1)
+        self.assertEqual(array_in_domain(a, vals).tolist(), [0] * 7)
+        self.assertEqual(array_in_domain(Any, np.array(['a'])).tolist(), [0])
+        self.assertEqual(array_in_domain(Any, [(1, 2), (3,)]).tolist(), [0, 0])
+
 
 class TestDeprecation(unittest.TestCase):
     def test_filter(self):
@@ -23,6 +23,7 @@ currdir = dirname(abspath(__file__)) + os.sep
 from io import StringIO
 
 import pyomo.common.unittest as unittest
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.common.log import LoggingIntercept
 
 from pyomo.core.base import IntegerSet
@@ -1347,6 +1348,36 @@ class TestVarComplexArray(PyomoModel):
         self.assertEqual(self.instance.B[1, 2, False].value, -4)
 
 
+@unittest.skipUnless(numpy_available, "numpy is not available")
+class TestVarSetValuesArray(unittest.TestCase):
+    def test_set_values(self):
+        m = ConcreteModel()
+        m.x = Var([1, 3, 2], bounds=(0, 3), within=Integers)
+        with LoggingIntercept() as LOG:
+            m.x.set_values(np.array([1, 2, 3]))
+        self.assertEqual(LOG.getvalue(), "")
+        self.assertEqual(m.x.get_values(), {1: 1, 3: 2, 2: 3})
+        self.assertFalse(any(v.stale for v in m.x.values()))
+
+        with LoggingIntercept() as LOG:
+            m.x.set_values(np.array([4, 1.5, 2]))
+        self.assertIn("Setting Var 'x[1]' to a numeric value `4.0`", LOG.getvalue())
+        self.assertIn("Setting Var 'x[3]' to a value `1.5`", LOG.getvalue())
+        self.assertEqual(m.x.get_values(), {1: 4, 3: 1.5, 2: 2})
+
+        # Arrays are ordered as the index_set (not the VarData order)
+        del m.x[3]
+        m.x[3] = 0
+        m.x.set_values(np.array([1, 2, 3]))
+        self.assertEqual(m.x.get_values(), {1: 1, 2: 3, 3: 2})
+
+        m.y = Var([1, 2])
+        m.y.set_values(np.array([1.5, 2.5]))
+        self.assertEqual(m.y.get_values(), {1: 1.5, 2: 2.5})
+        with self.assertRaisesRegex(ValueError, "expected a 1-D array with 2"):
+            m.y.set_values(np.array([1, 2, 3]))
+
+
 class MiscVarTests(unittest.TestCase):
     def test_error1(self):
         a = Var(name="a")
@@ -46,7 +46,10 @@ def quicksum(args, start=0, linear=None):
     The behavior of :func:`quicksum` is similar to the builtin
     :func:`sum` function, but this function can avoid the generation and
     disposal of intermediate objects, and thus is slightly more
-    performant.
+    performant.  For very large linear sums where the coefficients and
+    variables are already available as sequences, building a
+    :class:`~pyomo.core.expr.numeric_expr.LinearExpression` directly
+    from ``linear_coefs`` and ``linear_vars`` is faster still.
 
     Parameters
     ----------
@@ -37,7 +37,12 @@ from pyomo.core.expr.relational_expr import (
     InequalityExpression,
     RangedExpression,
 )
-from pyomo.core.expr.visitor import StreamBasedExpressionVisitor, _EvaluationVisitor
+from pyomo.core.expr.visitor import (
+    RECURSION_LIMIT,
+    RevertToNonrecursive,
+    StreamBasedExpressionVisitor,
+    _EvaluationVisitor,
+)
 from pyomo.core.expr import is_fixed, value
 from pyomo.core.base.expression import Expression
 import pyomo.core.kernel as kernel
@@ -803,6 +808,154 @@ class LinearBeforeChildDispatcher(BeforeChildDispatcher):
         return False, (_GENERAL, ans)
 
 
+class ExpressionShapeCache(object):
+    """Cache of compiled "replay" programs for recurring expression shapes
+
+    Models commonly generate many constraints from a single rule, so the
+    expressions passed to a visitor are frequently structurally
+    identical: the same operator tree with different leaves.  For each
+    root expression type, this cache holds a straight-line program
+    generated from a recently observed shape.  The program first
+    verifies that the expression matches the shape (node types and
+    argument counts) and then calls exactly the same ``enterNode``,
+    before-child dispatcher, and ``exitNode`` handlers, in the same
+    order, as the stack-based walker would.  This bypasses the walker's
+    per-node bookkeeping and dispatcher lookups while producing
+    identical results.  Expressions that do not match the cached shape
+    are processed by the standard walker.
+
+    """
+
+    # Maximum number of nodes in a compiled shape
+    max_nodes = 100
+    # Number of consecutive misses before regenerating a program
+    miss_limit = 2
+    # Number of programs that may be generated for each root type
+    # before additional programs must be "paid for" by cache hits
+    free_compiles = 4
+    hits_per_compile = 16
+
+    def __init__(self, visitor):
+        self.visitor = visitor
+        # map root type to [program, hits, consecutive misses, compiles]
+        # (or None if expressions with this root type are not cached)
+        self.programs = {}
+
+    def walk_expression(self, expr):
+        visitor = self.visitor
+        entry = self.programs.get(expr.__class__, self)
+        if entry is None:
+            return StreamBasedExpressionVisitor.walk_expression(visitor, expr)
+        if entry is not self and entry[0] is not None:
+            try:
+                result = entry[0](expr)
+            except RevertToNonrecursive:
+                visitor.recursion_stack = None
+                result = None
+            if result is not None:
+                entry[1] += 1
+                entry[2] = 0
+                return visitor.finalizeResult(result)
+        ans = StreamBasedExpressionVisitor.walk_expression(visitor, expr)
+        if entry is self:
+            if (
+                visitor.before_child_dispatcher.get(expr.__class__)
+                is not BeforeChildDispatcher._before_general_expression
+            ):
+                # The walker never descends into this root type
+                self.programs[expr.__class__] = None
+            else:
+                self.programs[expr.__class__] = [self.compile(expr), 0, 0, 1]
+            return ans
+        entry[2] += 1
+        if entry[2] >= self.miss_limit:
+            entry[2] = 0
+            if (
+                entry[3] < self.free_compiles
+                or entry[1] >= self.hits_per_compile * entry[3]
+            ):
+                entry[0] = self.compile(expr)
+                entry[3] += 1
+            else:
+                # The shapes with this root type are too varied to
+                # benefit from caching
+                entry[0] = None
+        return ans
+
+    def compile(self, expr):
+        """Generate the replay program for the shape of `expr`
+
+        Returns None if the shape cannot be compiled.  This assumes
+        that `expr` was just processed by the walker (so the before
+        child dispatcher has entries for every node type in `expr`).
+
+        """
+        visitor = self.visitor
+        dispatcher = visitor.before_child_dispatcher
+        general = BeforeChildDispatcher._before_general_expression
+        env = {
+            'enterNode': visitor.enterNode,
+            'exitNode': visitor.exitNode,
+            'process': visitor._process_node,
+            'limit': RECURSION_LIMIT,
+            'visitor': visitor,
+        }
+        names = {}
+        guards = []
+        code = []
+        n_nodes = [0]
+
+        def _name(obj, prefix):
+            if obj not in names:
+                names[obj] = f'{prefix}{len(names)}'
+                env[names[obj]] = obj
+            return names[obj]
+
+        def _compile_node(node, name):
+            n_nodes[0] += 1
+            if n_nodes[0] > self.max_nodes:
+                return None
+            handler = dispatcher.get(node.__class__)
+            if handler is None:
+                return None
+            guards.append(f'if {name}.__class__ is not {_name(node.__class__, "T")}:')
+            guards.append('    return None')
+            if handler is not general:
+                # Leaf nodes: the handler may still request that the
+                # walker descend into the node (e.g., uncached named
+                # expressions), in which case we defer to the walker.
+                code.append(
+                    f'descend, r_{name} = {_name(handler, "H")}(visitor, {name})'
+                )
+                code.append('if descend:')
+                code.append(f'    r_{name} = process({name}, limit)')
+                return f'r_{name}'
+            args, data = visitor.enterNode(node)
+            if args.__class__ not in (list, tuple):
+                return None
+            guards.append(f'args, d_{name} = enterNode({name})')
+            guards.append(f'if len(args) != {len(args)}:')
+            guards.append('    return None')
+            if args:
+                guards.append(
+                    ''.join(f'{name}_{i}, ' for i in range(len(args))) + '= args'
+                )
+            for i, child in enumerate(args):
+                ans = _compile_node(child, f'{name}_{i}')
+                if ans is None:
+                    return None
+                code.append(f'd_{name}.append({ans})')
+            code.append(f'r_{name} = exitNode({name}, d_{name})')
+            return f'r_{name}'
+
+        ans = _compile_node(expr, 'n')
+        if ans is None:
+            return None
+        src = '\n    '.join(['def replay(n):'] + guards + code + [f'return {ans}'])
+        exec(src, env)
+        return env['replay']
+
+
 class LinearRepnVisitor(StreamBasedExpressionVisitor):
     Result = LinearRepn
     before_child_dispatcher = LinearBeforeChildDispatcher()
@@ -842,6 +995,10 @@ class LinearRepnVisitor(StreamBasedExpressionVisitor):
         self.var_map = var_recorder.var_map
         self._eval_expr_visitor = _EvaluationVisitor(True)
         self.evaluate = self._eval_expr_visitor.dfs_postorder_stack
+        self.shape_cache = ExpressionShapeCache(self)
+
+    def walk_expression(self, expr):
+        return self.shape_cache.walk_expression(expr)
 
     def check_constant(self, ans, obj):
         if ans.__class__ not in native_numeric_types:
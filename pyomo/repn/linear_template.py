@@ -372,16 +372,16 @@ class LinearTemplateRepnVisitor(linear.LinearRepnVisitor):
         else:
             return node.args, []
 
-    def expand_expression(self, obj, template_info):
+    def _compile_template(self, obj, template_info):
         env = self.env
         try:
-            body, lb, ub = self.expanded_templates[id(template_info)]
+            return self.expanded_templates[id(template_info)]
         except KeyError:
             smap = self.symbolmap
             expr, indices = template_info
             args = [smap.getSymbol(i) for i in indices]
             if expr.is_expression_type(ExpressionType.RELATIONAL):
-                lb, body, ub = obj.to_bounded_expression()
+                lb, body, ub = obj.template_bounded_expression()
                 if body is not None:
                     body = self.walk_expression(body).compile(
                         env, smap, self.expr_cache, args, False
@@ -402,15 +402,23 @@ class LinearTemplateRepnVisitor(linear.LinearRepnVisitor):
             else:
                 body = lb = ub = None
             self.expanded_templates[id(template_info)] = body, lb, ub
+        return body, lb, ub
 
-        linear_indices = []
-        linear_data = []
+    @staticmethod
+    def _template_index(obj):
         index = obj.index()
         if index.__class__ is not tuple:
             if index is None and not obj.parent_component().is_indexed():
                 index = ()
             else:
                 index = (index,)
+        return index
+
+    def expand_expression(self, obj, template_info):
+        body, lb, ub = self._compile_template(obj, template_info)
+        linear_indices = []
+        linear_data = []
+        index = self._template_index(obj)
         if lb.__class__ is code_type:
             lb = lb(linear_indices, linear_data, *index)
             if linear_indices:
@@ -426,3 +434,68 @@ class LinearTemplateRepnVisitor(linear.LinearRepnVisitor):
             lb,
             ub,
         )
+
+    def expand_block(self, objs, template_info):
+        """Expand a template for a list of component data objects
+
+        This is the bulk analog to :py:meth:`expand_expression`: all
+        objects in `objs` must share the same `template_info`.  The
+        compiled template is evaluated for each object, accumulating the
+        linear terms for all objects into a single set of flat (COO-like)
+        index / data lists.
+
+        Returns
+        -------
+        offsets: List[float]
+            The constant offset for each object
+
+        linear_indices: List[int]
+            The variable (column) index for every linear term
+
+        linear_data: List[float]
+            The coefficient for every linear term
+
+        index_ptr: List[int]
+            The (CSR-style) pointers into `linear_indices` and
+            `linear_data`: the terms for `objs[i]` are in
+            ``index_ptr[i]:index_ptr[i+1]``
+
+        lb: List[float] or None
+            The lower bound for each object (or None if the template
+            has no lower bound)
+
+        ub: List[float] or None
+            The upper bound for each object (or None if the template
+            has no upper bound)
+
+        """
+        body, lb, ub = self._compile_template(objs[0], template_info)
+        linear_indices = []
+        linear_data = []
+        index_ptr = [0]
+        offsets = []
+        indices = list(map(self._template_index, objs))
+        if body is None:
+            offsets = [None] * len(objs)
+            index_ptr = [0] * (len(objs) + 1)
+        else:
+            for index in indices:
+                offsets.append(body(linear_indices, linear_data, *index))
+                index_ptr.append(len(linear_indices))
+        bounds = []
+        for bnd, name in ((lb, 'lower'), (ub, 'upper')):
+            if bnd.__class__ is code_type:
+                bnd_indices = []
+                bnd_data = []
+                vals = [bnd(bnd_indices, bnd_data, *index) for index in indices]
+                if bnd_indices:
+                    raise RuntimeError(
+                        f"Constraint {objs[0].parent_component()} has "
+                        f"non-fixed {name} bound"
+                    )
+                bounds.append(vals)
+            elif bnd is None:
+                bounds.append(None)
+            else:
+                bounds.append([bnd] * len(objs))
+        return offsets, linear_indices, linear_data, index_ptr, bounds[0], bounds[1]
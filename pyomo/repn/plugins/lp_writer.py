@@ -10,17 +10,21 @@
 #  ___________________________________________________________________________
 
 import logging
+from functools import partial
 from io import StringIO
 from operator import itemgetter, attrgetter
 
+from pyomo.common.collections import MutableMapping
 from pyomo.common.config import (
     ConfigBlock,
     ConfigValue,
     InEnum,
+    NonNegativeInt,
     document_kwargs_from_configdict,
 )
 from pyomo.common.deprecation import deprecation_warning
 from pyomo.common.gc_manager import PauseGC
+from pyomo.common.numeric_types import native_numeric_types
 from pyomo.common.timing import TicTocTimer
 
 from pyomo.core.base import (
@@ -38,15 +42,20 @@ from pyomo.core.base import (
 from pyomo.core.base.label import LPFileLabeler, NumericLabeler
 from pyomo.opt import WriterFactory
 from pyomo.repn.linear import LinearRepnVisitor
+from pyomo.repn.linear_template import LinearTemplateRepnVisitor
 from pyomo.repn.quadratic import QuadraticRepnVisitor
 from pyomo.repn.util import (
     FileDeterminism,
     FileDeterminism_to_SortComponents,
     OrderedVarRecorder,
+    TemplateVarRecorder,
     categorize_valid_components,
+    collect_chunk_results,
+    group_template_blocks,
     initialize_var_map_from_column_order,
     int_float,
     ordered_active_constraints,
+    parallel_chunk_map,
     row_order2row_map,
 )
 
@@ -187,6 +196,23 @@ class LPWriter(object):
             description='If True, allow quadratic terms in the model constraints',
         ),
     )
+    CONFIG.declare(
+        'processes',
+        ConfigValue(
+            default=1,
+            domain=NonNegativeInt,
+            description='Number of processes to use to compile constraints',
+            doc="""
+            Number of (forked) worker processes to use to compile the
+            constraint expressions.  0 uses all available CPUs.  The
+            constraints are partitioned into consecutive blocks that are
+            compiled by the workers and written (in order) by the main
+            process, so the resulting LP file is identical to the file
+            generated serially.  Small models, and platforms that do not
+            support the 'fork' process start method, are always written
+            serially.""",
+        ),
+    )
 
     def __init__(self):
         self.config = self.CONFIG()
@@ -242,6 +268,165 @@ class LPWriter(object):
             return _LPWriter_impl(ostream, config).write(model)
 
 
+def _numeric_symbol_index(symb):
+    """Return the number in an LP writer symbol (or None)
+
+    With numeric labels, the LP writer symbols are the
+    :py:class:`NumericLabeler` label (e.g., 'x12'), optionally decorated
+    with the row type (e.g., 'c_l_x12_').  Other strings may also map
+    to a number: callers must verify the symbol stored at the index.
+
+    """
+    try:
+        if symb[0] == 'x':
+            i = int(symb[1:])
+        else:
+            i = int(symb[5:-1])
+    except (ValueError, IndexError):
+        return None
+    return i if i >= 0 else None
+
+
+class _NumericSymbolDict(MutableMapping):
+    """``bySymbol`` mapping for the numeric labels used by the LP writer
+
+    The LP writer generates a label for every row and column in the
+    model.  With numeric labels, every symbol embeds a unique number
+    (the :py:class:`NumericLabeler` count), so rather than hashing the
+    symbols into a second dictionary, this stores the symbols and
+    objects in lists indexed by that number.  Symbols that do not fit
+    that scheme are stored in a regular dict.
+
+    """
+
+    __slots__ = ('_symbols', '_objects', '_other', '_len')
+
+    def __init__(self):
+        self._symbols = []
+        self._objects = []
+        self._other = {}
+        self._len = 0
+
+    def add(self, symb, obj):
+        """Add a new symbol (returning False if `symb` is already present)"""
+        i = _numeric_symbol_index(symb)
+        if i is not None:
+            symbols = self._symbols
+            if i >= len(symbols):
+                n = i + 1 - len(symbols)
+                symbols.extend([None] * n)
+                self._objects.extend([None] * n)
+            old = symbols[i]
+            if old is None:
+                symbols[i] = symb
+                self._objects[i] = obj
+                self._len += 1
+                return True
+            if old == symb:
+                return False
+        if symb in self._other:
+            return False
+        self._other[symb] = obj
+        return True
+
+    def __getitem__(self, symb):
+        i = _numeric_symbol_index(symb)
+        if i is not None and i < len(self._symbols) and self._symbols[i] == symb:
+            return self._objects[i]
+        return self._other[symb]
+
+    def __contains__(self, symb):
+        i = _numeric_symbol_index(symb)
+        if i is not None and i < len(self._symbols) and self._symbols[i] == symb:
+            return True
+        return symb in self._other
+
+    def __setitem__(self, symb, obj):
+        if not self.add(symb, obj):
+            i = _numeric_symbol_index(symb)
+            if i is not None and i < len(self._symbols) and self._symbols[i] == symb:
+                self._objects[i] = obj
+            else:
+                self._other[symb] = obj
+
+    def __delitem__(self, symb):
+        i = _numeric_symbol_index(symb)
+        if i is not None and i < len(self._symbols) and self._symbols[i] == symb:
+            self._symbols[i] = self._objects[i] = None
+            self._len -= 1
+        else:
+            del self._other[symb]
+
+    def __iter__(self):
+        for symb in self._symbols:
+            if symb is not None:
+                yield symb
+        yield from self._other
+
+    def __len__(self):
+        return self._len + len(self._other)
+
+
+class _LPSymbolMap(SymbolMap):
+    """SymbolMap for the numeric labels generated by the LP writer
+
+    This is a regular :py:class:`SymbolMap` (including the duplicate
+    symbol / object checks), except that ``bySymbol`` is a
+    :py:class:`_NumericSymbolDict`, which stores the symbols in lists
+    instead of a second dictionary.
+
+    """
+
+    def __init__(self, labeler):
+        super().__init__(labeler)
+        self.bySymbol = _NumericSymbolDict()
+
+    def addSymbol(self, obj, symb):
+        obj_id = id(obj)
+        if obj_id in self.byObject:
+            raise RuntimeError(
+                "SymbolMap.addSymbol(): duplicate object.  "
+                "SymbolMap likely in an inconsistent state"
+            )
+        if not self.bySymbol.add(symb, obj):
+            raise RuntimeError(
+                "SymbolMap.addSymbol(): duplicate symbol.  "
+                "SymbolMap likely in an inconsistent state"
+            )
+        self.byObject[obj_id] = symb
+
+    def getSymbol(self, obj, labeler=None, *args):
+        obj_id = id(obj)
+        byObject = self.byObject
+        if obj_id in byObject:
+            return byObject[obj_id]
+        symbol = (labeler or self.default_labeler or str)(obj, *args)
+        if not self.bySymbol.add(symbol, obj):
+            # The labeler can have side-effects, including registering
+            # this symbol in the symbol map
+            if obj is self.bySymbol[symbol]:
+                return symbol
+            raise RuntimeError(
+                "Duplicate symbol '%s' already associated with "
+                "component '%s' (conflicting component: '%s')"
+                % (symbol, self.bySymbol[symbol].name, obj.name)
+            )
+        byObject[obj_id] = symbol
+        return symbol
+
+
+class _RecordingVarRecorder(OrderedVarRecorder):
+    """OrderedVarRecorder that records the variables passed to add()"""
+
+    def __init__(self, var_map, var_order, sorter):
+        super().__init__(var_map, var_order, sorter)
+        self.added = []
+
+    def add(self, var):
+        self.added.append(var)
+        super().add(var)
+
+
 class _LPWriter_impl(object):
     def __init__(self, ostream, config):
         self.ostream = ostream
@@ -261,9 +446,14 @@ class _LPWriter_impl(object):
         if labeler is None:
             if self.config.symbolic_solver_labels:
                 labeler = LPFileLabeler()
+                self.symbol_map = SymbolMap(labeler)
             else:
+                # Numeric labels are guaranteed to be unique, so we can
+                # use the (more compact) LP symbol map
                 labeler = NumericLabeler('x')
-        self.symbol_map = SymbolMap(labeler)
+                self.symbol_map = _LPSymbolMap(labeler)
+        else:
+            self.symbol_map = SymbolMap(labeler)
         addSymbol = self.symbol_map.addSymbol
         aliasSymbol = self.symbol_map.alias
         getSymbol = self.symbol_map.getSymbol
@@ -406,90 +596,132 @@ class _LPWriter_impl(object):
         skip_trivial_constraints = self.config.skip_trivial_constraints
         have_nontrivial = False
         last_parent = None
-        for con in ordered_active_constraints(model, self.config):
-            if with_debug_timing and con.parent_component() is not last_parent:
-                timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
-                last_parent = con.parent_component()
-            # Note: Constraint.to_bounded_expression(evaluate_bounds=True)
-            # guarantee a return value that is either a (finite)
-            # native_numeric_type, or None
-            lb, body, ub = con.to_bounded_expression(True)
-
-            if lb is None and ub is None:
-                # Note: you *cannot* output trivial (unbounded)
-                # constraints in LP format.  I suppose we could add a
-                # slack variable if skip_trivial_constraints is False,
-                # but that seems rather silly.
-                continue
-            repn = constraint_visitor.walk_expression(body)
-            if repn.nonlinear is not None:
-                raise ValueError(
-                    f"Model constraint ({con.name}) contains nonlinear terms that "
-                    "cannot be written to LP format"
+        template_visitor = None
+        constraints = ordered_active_constraints(model, self.config)
+        # Constraint expressions compiled by worker processes (only
+        # populated when writing in parallel)
+        compiled = {}
+        if self.config.processes != 1:
+            constraints = list(constraints)
+            # Worker processes report the variables they encounter by
+            # (id(component), index)
+            self.var_components = {
+                id(comp): comp
+                for comp in model.component_objects(Var, descend_into=True)
+            }
+            results = parallel_chunk_map(
+                partial(self._compile_constraints, constraint_visitor.__class__),
+                constraints,
+                self.config.processes,
+            )
+            if results is not None:
+                constraints = collect_chunk_results(constraints, results, compiled)
+        for con in group_template_blocks(constraints):
+            if con.__class__ is list:
+                # A run of templatized constraints that share a
+                # template: compile the template once and expand it for
+                # every constraint in the run
+                if with_debug_timing and con[0].parent_component() is not last_parent:
+                    timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
+                    last_parent = con[0].parent_component()
+                if template_visitor is None:
+                    template_visitor = LinearTemplateRepnVisitor(
+                        {}, var_recorder=TemplateVarRecorder({}, sorter)
+                    )
+                rows = self._expand_template_block(
+                    con, template_visitor, constraint_visitor.Result
                 )
-
-            # Pull out the constant: we will move it to the bounds
-            offset = repn.constant
-            repn.constant = 0
-
-            if repn.linear or getattr(repn, 'quadratic', None):
-                have_nontrivial = True
             else:
-                if (
-                    skip_trivial_constraints
-                    and (lb is None or lb <= offset)
-                    and (ub is None or ub >= offset)
-                ):
-                    continue
-                # This is a trivially infeasible model.  We could raise
-                # an exception, or we could allow the solver to return
-                # infeasible.  There are fewer logic paths (in
-                # particular related to mapping solver result status) if
-                # we just defer to the solver.
-                #
-                # Add a dummy (fixed) variable to the constraint,
-                # because some solvers (including versions of GLPK)
-                # cannot parse an LP file without a variable on the left
-                # hand side.
-                repn.linear[id(ONE_VAR_CONSTANT)] = 0
-
-            symbol = labeler(con)
-            if lb is not None:
-                if ub is None:
-                    label = f'c_l_{symbol}_'
-                    addSymbol(con, label)
-                    ostream.write(f'\n{label}:\n')
-                    self.write_expression(ostream, repn, False)
-                    ostream.write(f'>= {(lb - offset)!s}\n')
-                elif lb == ub:
-                    label = f'c_e_{symbol}_'
-                    addSymbol(con, label)
-                    ostream.write(f'\n{label}:\n')
-                    self.write_expression(ostream, repn, False)
-                    ostream.write(f'= {(lb - offset)!s}\n')
+                if with_debug_timing and con.parent_component() is not last_parent:
+                    timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
+                    last_parent = con.parent_component()
+                info = compiled.pop(id(con), None)
+                if info is not None:
+                    # This constraint was compiled by a worker process
+                    rows = (self._restore_compiled(con, info, constraint_visitor),)
+                else:
+                    # Note: Constraint.to_bounded_expression(evaluate_bounds=True)
+                    # guarantee a return value that is either a (finite)
+                    # native_numeric_type, or None
+                    lb, body, ub = con.to_bounded_expression(True)
+
+                    if lb is None and ub is None:
+                        # Note: you *cannot* output trivial (unbounded)
+                        # constraints in LP format.  I suppose we could add a
+                        # slack variable if skip_trivial_constraints is False,
+                        # but that seems rather silly.
+                        continue
+                    repn = constraint_visitor.walk_expression(body)
+                    if repn.nonlinear is not None:
+                        raise ValueError(
+                            f"Model constraint ({con.name}) contains nonlinear "
+                            "terms that cannot be written to LP format"
+                        )
+                    rows = ((con, lb, repn, ub),)
+
+            for con, lb, repn, ub in rows:
+                # Pull out the constant: we will move it to the bounds
+                offset = repn.constant
+                repn.constant = 0
+
+                if repn.linear or getattr(repn, 'quadratic', None):
+                    have_nontrivial = True
                 else:
-                    # We will need the constraint body twice.  Generate
-                    # in a buffer so we only have to do that once.
-                    buf = StringIO()
-                    self.write_expression(buf, repn, False)
-                    buf = buf.getvalue()
+                    if (
+                        skip_trivial_constraints
+                        and (lb is None or lb <= offset)
+                        and (ub is None or ub >= offset)
+                    ):
+                        continue
+                    # This is a trivially infeasible model.  We could raise
+                    # an exception, or we could allow the solver to return
+                    # infeasible.  There are fewer logic paths (in
+                    # particular related to mapping solver result status) if
+                    # we just defer to the solver.
                     #
-                    label = f'r_l_{symbol}_'
+                    # Add a dummy (fixed) variable to the constraint,
+                    # because some solvers (including versions of GLPK)
+                    # cannot parse an LP file without a variable on the left
+                    # hand side.
+                    repn.linear[id(ONE_VAR_CONSTANT)] = 0
+
+                symbol = labeler(con)
+                if lb is not None:
+                    if ub is None:
+                        label = f'c_l_{symbol}_'
+                        addSymbol(con, label)
+                        ostream.write(f'\n{label}:\n')
+                        self.write_expression(ostream, repn, False)
+                        ostream.write(f'>= {(lb - offset)!s}\n')
+                    elif lb == ub:
+                        label = f'c_e_{symbol}_'
+                        addSymbol(con, label)
+                        ostream.write(f'\n{label}:\n')
+                        self.write_expression(ostream, repn, False)
+                        ostream.write(f'= {(lb - offset)!s}\n')
+                    else:
+                        # We will need the constraint body twice.  Generate
+                        # in a buffer so we only have to do that once.
+                        buf = StringIO()
+                        self.write_expression(buf, repn, False)
+                        buf = buf.getvalue()
+                        #
+                        label = f'r_l_{symbol}_'
+                        addSymbol(con, label)
+                        ostream.write(f'\n{label}:\n')
+                        ostream.write(buf)
+                        ostream.write(f'>= {(lb - offset)!s}\n')
+                        label = f'r_u_{symbol}_'
+                        aliasSymbol(con, label)
+                        ostream.write(f'\n{label}:\n')
+                        ostream.write(buf)
+                        ostream.write(f'<= {(ub - offset)!s}\n')
+                elif ub is not None:
+                    label = f'c_u_{symbol}_'
                     addSymbol(con, label)
                     ostream.write(f'\n{label}:\n')
-                    ostream.write(buf)
-                    ostream.write(f'>= {(lb - offset)!s}\n')
-                    label = f'r_u_{symbol}_'
-                    aliasSymbol(con, label)
-                    ostream.write(f'\n{label}:\n')
-                    ostream.write(buf)
+                    self.write_expression(ostream, repn, False)
                     ostream.write(f'<= {(ub - offset)!s}\n')
-            elif ub is not None:
-                label = f'c_u_{symbol}_'
-                addSymbol(con, label)
-                ostream.write(f'\n{label}:\n')
-                self.write_expression(ostream, repn, False)
-                ostream.write(f'<= {(ub - offset)!s}\n')
 
         if with_debug_timing:
             # report the last constraint
@@ -573,6 +805,128 @@ class _LPWriter_impl(object):
         timer.toc("Generated LP representation", delta=False)
         return info
 
+    def _compile_constraints(self, visitor_class, constraints):
+        """Compile constraint bodies (in a worker process)
+
+        Returns a list with the (picklable) compiled data for each
+        constraint, or None for constraints that must be processed by
+        the main process (templatized, trivial, or nonlinear
+        constraints, constraints that raise exceptions, and constraints
+        that reference variables that we cannot identify by
+        component).
+
+        """
+        var_recorder = _RecordingVarRecorder({}, {}, self.sorter)
+        visitor = visitor_class({}, var_recorder=var_recorder)
+        added = var_recorder.added
+        var_components = self.var_components
+        ans = []
+        for con in constraints:
+            if hasattr(con, 'template_expr'):
+                ans.append(None)
+                continue
+            added.clear()
+            try:
+                lb, body, ub = con.to_bounded_expression(True)
+                if lb is None and ub is None:
+                    ans.append(None)
+                    continue
+                repn = visitor.walk_expression(body)
+                # The variables (in the order passed to the recorder)
+                # that were added to the var_map by this constraint
+                new_vars = []
+                for v in added:
+                    comp = v.parent_component()
+                    if id(comp) not in var_components:
+                        raise KeyError(comp)
+                    new_vars.append((id(comp), v.index()))
+            except Exception:
+                # Let the main process (re)generate any exceptions
+                ans.append(None)
+                continue
+            linear = list(repn.linear.items())
+            quadratic = getattr(repn, 'quadratic', None)
+            if quadratic:
+                quadratic = list(quadratic.items())
+            if (
+                repn.nonlinear is not None
+                or repn.constant.__class__ not in native_numeric_types
+                or any(c.__class__ not in native_numeric_types for _, c in linear)
+                or (
+                    quadratic
+                    and any(
+                        c.__class__ not in native_numeric_types for _, c in quadratic
+                    )
+                )
+            ):
+                ans.append(None)
+                continue
+            ans.append((lb, ub, repn.constant, linear, quadratic, new_vars))
+        return ans
+
+    def _restore_compiled(self, con, info, visitor):
+        """Convert worker results back to (con, lb, repn, ub)"""
+        lb, ub, constant, linear, quadratic, new_vars = info
+        # Record the variables in the var_map in the same order that the
+        # walker would have encountered them
+        var_map = self.var_map
+        var_components = self.var_components
+        record_var = self.var_recorder.add
+        for comp_id, idx in new_vars:
+            v = var_components[comp_id][idx]
+            if id(v) not in var_map:
+                record_var(v)
+        repn = visitor.Result()
+        repn.constant = constant
+        repn.linear = dict(linear)
+        if quadratic:
+            repn.quadratic = dict(quadratic)
+        return con, lb, repn, ub
+
+    def _expand_template_block(self, cons, template_visitor, Result):
+        """Generate (con, lb, repn, ub) for a run of templatized constraints
+
+        The shared template is compiled (once) by the template visitor
+        and evaluated for every constraint in `cons`.  The resulting
+        (template) column indices are mapped back to the Var objects and
+        recorded in this writer's var_map / var_order, so that the rows
+        are identical to what walking the expanded constraint would have
+        produced.
+
+        """
+        offsets, indices, data, index_ptr, lbs, ubs = template_visitor.expand_block(
+            cons, cons[0].template_expr()
+        )
+        template_vars = list(template_visitor.var_recorder.var_map.values())
+        var_order = self.var_order
+        record_var = self.var_recorder.add
+        for i, con in enumerate(cons):
+            lb = None if lbs is None else con._evaluate_bound(lbs[i], neg_inf)
+            ub = None if ubs is None else con._evaluate_bound(ubs[i], inf)
+            if lb is None and ub is None:
+                # Note: you *cannot* output trivial (unbounded)
+                # constraints in LP format.
+                continue
+            repn = Result()
+            repn.constant = offsets[i] or 0
+            linear = repn.linear
+            for j in range(index_ptr[i], index_ptr[i + 1]):
+                coef = data[j]
+                v = template_vars[indices[j]]
+                if v.fixed:
+                    repn.constant += coef * v.value
+                    continue
+                vid = id(v)
+                if vid not in var_order:
+                    record_var(v)
+                if vid in linear:
+                    linear[vid] += coef
+                else:
+                    linear[vid] = coef
+            for vid in [vid for vid, coef in linear.items() if not coef]:
+                del linear[vid]
+            yield con, lb, repn, ub
+
     def write_expression(self, ostream, expr, is_objective):
         assert not expr.constant
         getSymbol = self.symbol_map.getSymbol
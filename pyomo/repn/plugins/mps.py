@@ -33,7 +33,10 @@ from pyomo.core.base import (
     ComponentMap,
     is_fixed,
 )
-from pyomo.repn import generate_standard_repn
+from pyomo.core.expr import EqualityExpression, RangedExpression
+from pyomo.repn import StandardRepn, generate_standard_repn
+from pyomo.repn.linear_template import LinearTemplateRepnVisitor
+from pyomo.repn.util import TemplateVarRecorder, group_template_blocks
 
 logger = logging.getLogger('pyomo.core')
 
@@ -207,6 +210,56 @@ class ProblemWriter_mps(AbstractProblemWriter):
         #
         return repn.constant
 
+    def _expand_template_block(self, cons, template_visitor):
+        """Generate (con, repn, lb, ub, equality) for templatized constraints
+
+        The shared template is compiled (once) by the template visitor
+        and evaluated for every constraint in `cons`, without generating
+        (and walking) the expression for each constraint.  Fixed
+        variables are moved into the constant, matching
+        :func:`generate_standard_repn`.
+
+        """
+        template = cons[0].template_expr()
+        offsets, indices, data, index_ptr, lbs, ubs = template_visitor.expand_block(
+            cons, template
+        )
+        # All constraints in the run share the template, so they share
+        # the (structural) equality flag: apply the test from
+        # ConstraintData.equality to the template expression
+        expr = template[0]
+        if expr.__class__ is EqualityExpression:
+            equality = True
+        elif expr.__class__ is RangedExpression:
+            equality = expr.arg(0) is not None and expr.arg(0) is expr.arg(2)
+        else:
+            equality = False
+        template_vars = list(template_visitor.var_recorder.var_map.values())
+        for i, con in enumerate(cons):
+            lb = None if lbs is None else con._evaluate_bound(lbs[i], float('-inf'))
+            ub = None if ubs is None else con._evaluate_bound(ubs[i], float('inf'))
+            if lb is None and ub is None:
+                continue  # non-binding, so skip
+            constant = offsets[i] or 0
+            linear = {}
+            for j in range(index_ptr[i], index_ptr[i + 1]):
+                coef = data[j]
+                v = template_vars[indices[j]]
+                if v.fixed:
+                    constant += coef * v.value
+                elif id(v) in linear:
+                    linear[id(v)][1] += coef
+                else:
+                    linear[id(v)] = [v, coef]
+            linear = [term for term in linear.values() if term[1]]
+            repn = StandardRepn()
+            repn.constant = constant
+            repn.linear_vars = tuple(v for v, coef in linear)
+            repn.linear_coefs = tuple(coef for v, coef in linear)
+            if equality:
+                assert lb == ub
+            yield con, repn, lb, ub, equality
+
     def _printSOS(
         self, symbol_map, labeler, variable_symbol_map, soscondata, output_file
     ):
@@ -407,6 +460,7 @@ class ProblemWriter_mps(AbstractProblemWriter):
 
         # Constraints
         def constraint_generator():
+            template_visitor = None
             for block in all_blocks:
                 gen_con_repn = getattr(block, "_gen_con_repn", True)
 
@@ -415,9 +469,25 @@ class ProblemWriter_mps(AbstractProblemWriter):
                     block._repn = ComponentMap()
                 block_repn = block._repn
 
-                for constraint_data in block.component_data_objects(
+                constraints = block.component_data_objects(
                     Constraint, active=True, sort=sortOrder, descend_into=False
-                ):
+                )
+                if gen_con_repn:
+                    constraints = group_template_blocks(constraints)
+                for constraint_data in constraints:
+                    if constraint_data.__class__ is list:
+                        # A run of templatized constraints that share a
+                        # template: compile the template once and
+                        # expand it for every constraint in the run
+                        if template_visitor is None:
+                            template_visitor = LinearTemplateRepnVisitor(
+                                {}, var_recorder=TemplateVarRecorder({}, sortOrder)
+                            )
+                        yield from self._expand_template_block(
+                            constraint_data, template_visitor
+                        )
+                        continue
+
                     if (not constraint_data.has_lb()) and (
                         not constraint_data.has_ub()
                     ):
@@ -432,20 +502,27 @@ class ProblemWriter_mps(AbstractProblemWriter):
                     else:
                         repn = block_repn[constraint_data]
 
-                    yield constraint_data, repn
+                    lb = ub = None
+                    if constraint_data.has_lb():
+                        lb = _get_bound(constraint_data.lower)
+                    if constraint_data.has_ub():
+                        ub = _get_bound(constraint_data.upper)
+                    if constraint_data.equality:
+                        assert lb == ub
+                    yield constraint_data, repn, lb, ub, constraint_data.equality
 
         if row_order is not None:
             sorted_constraint_list = list(constraint_generator())
             sorted_constraint_list.sort(key=lambda x: row_order[x[0]])
 
             def yield_all_constraints():
-                for constraint_data, repn in sorted_constraint_list:
-                    yield constraint_data, repn
+                for row in sorted_constraint_list:
+                    yield row
 
         else:
             yield_all_constraints = constraint_generator
 
-        for constraint_data, repn in yield_all_constraints():
+        for constraint_data, repn, lb, ub, equality in yield_all_constraints():
             degree = repn.polynomial_degree()
 
             # Write constraint
@@ -461,20 +538,17 @@ class ProblemWriter_mps(AbstractProblemWriter):
             # Create symbol
             con_symbol = create_symbol_func(symbol_map, constraint_data, labeler)
 
-            if constraint_data.equality:
-                assert value(constraint_data.lower) == value(constraint_data.upper)
+            if equality:
                 label = 'c_e_' + con_symbol + '_'
                 alias_symbol_func(symbol_map, constraint_data, label)
                 output_file.write(" E  %s\n" % (label))
                 offset = extract_variable_coefficients(
                     label, repn, column_data, quadmatrix_data, variable_to_column
                 )
-                bound = constraint_data.lower
-                bound = _get_bound(bound) - offset
-                rhs_data.append((label, _no_negative_zero(bound)))
+                rhs_data.append((label, _no_negative_zero(lb - offset)))
             else:
-                if constraint_data.has_lb():
-                    if constraint_data.has_ub():
+                if lb is not None:
+                    if ub is not None:
                         label = 'r_l_' + con_symbol + '_'
                     else:
                         label = 'c_l_' + con_symbol + '_'
@@ -483,14 +557,12 @@ class ProblemWriter_mps(AbstractProblemWriter):
                     offset = extract_variable_coefficients(
                         label, repn, column_data, quadmatrix_data, variable_to_column
                     )
-                    bound = constraint_data.lower
-                    bound = _get_bound(bound) - offset
-                    rhs_data.append((label, _no_negative_zero(bound)))
+                    rhs_data.append((label, _no_negative_zero(lb - offset)))
                 else:
-                    assert constraint_data.has_ub()
+                    assert ub is not None
 
-                if constraint_data.has_ub():
-                    if constraint_data.has_lb():
+                if ub is not None:
+                    if lb is not None:
                         label = 'r_u_' + con_symbol + '_'
                     else:
                         label = 'c_u_' + con_symbol + '_'
@@ -499,11 +571,9 @@ class ProblemWriter_mps(AbstractProblemWriter):
                     offset = extract_variable_coefficients(
                         label, repn, column_data, quadmatrix_data, variable_to_column
                     )
-                    bound = constraint_data.upper
-                    bound = _get_bound(bound) - offset
-                    rhs_data.append((label, _no_negative_zero(bound)))
+                    rhs_data.append((label, _no_negative_zero(ub - offset)))
                 else:
-                    assert constraint_data.has_lb()
+                    assert lb is not None
 
         if len(column_data[-1]) > 0:
             # ONE_VAR_CONSTANT = 1
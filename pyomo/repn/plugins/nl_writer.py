@@ -11,17 +11,28 @@
 
 import logging
 import os
+import struct
+import sys
 from collections import defaultdict, namedtuple
 from contextlib import nullcontext
-from itertools import filterfalse, product
+from functools import partial
+from io import BytesIO, StringIO
+from itertools import accumulate, filterfalse, product
 from math import log10 as _log10
 from operator import itemgetter, attrgetter
 
 from pyomo.common.collections import ComponentMap, ComponentSet
-from pyomo.common.config import ConfigDict, ConfigValue, InEnum, document_class_CONFIG
+from pyomo.common.config import (
+    ConfigDict,
+    ConfigValue,
+    InEnum,
+    NonNegativeInt,
+    document_class_CONFIG,
+)
 from pyomo.common.deprecation import relocated_module_attribute
 from pyomo.common.errors import DeveloperError, InfeasibleConstraintException
 from pyomo.common.gc_manager import PauseGC
+from pyomo.common.numeric_types import native_numeric_types
 from pyomo.common.timing import TicTocTimer
 
 from pyomo.core.base import (
@@ -45,18 +56,26 @@ from pyomo.core.base.expression import ScalarExpression, ExpressionData
 from pyomo.core.base.objective import ScalarObjective, ObjectiveData
 from pyomo.core.base.suffix import SuffixFinder
 from pyomo.core.base.var import VarData
+from pyomo.core.expr.visitor import identify_mutable_parameters, identify_variables
 import pyomo.core.kernel as kernel
 from pyomo.core.pyomoobject import PyomoObject
 from pyomo.opt import WriterFactory
 
-from pyomo.repn.ampl import AMPLRepnVisitor, evaluate_ampl_nl_expression, TOL
+from pyomo.repn.ampl import (
+    AMPLBeforeChildDispatcher,
+    AMPLRepnVisitor,
+    evaluate_ampl_nl_expression,
+    TOL,
+)
 from pyomo.repn.util import (
     FileDeterminism,
     FileDeterminism_to_SortComponents,
     categorize_valid_components,
+    collect_chunk_results,
     initialize_var_map_from_column_order,
     int_float,
     ordered_active_constraints,
+    parallel_chunk_map,
 )
 from pyomo.repn.plugins.ampl.ampl_ import set_pyomo_amplfunc_env
 
@@ -75,6 +94,85 @@ inf = float('inf')
 minus_inf = -inf
 allowable_binary_var_bounds = {(0, 0), (0, 1), (1, 1)}
 
+# Binary ("b" format) NL files use the same (text) header as the text
+# ("g" format) files.  The segments that follow use the same structure
+# as the text format, except that the segment keys (and expression node
+# types) are single characters, integers are written as native 4-byte
+# ints, floating point values as native 8-byte doubles, and strings as
+# the (int) length followed by the encoded characters.
+#
+# References (the format is specified in [Gay05]; the notes below
+# point at the relevant parts of that report):
+#
+# [Gay05] D. M. Gay, "Writing .nl Files", Sandia National Laboratories
+#    Technical Report SAND2005-7907P (2005).
+_bin_int = struct.Struct('=i').pack
+_bin_int2 = struct.Struct('=ii').pack
+_bin_int3 = struct.Struct('=iii').pack
+_bin_double = struct.Struct('=d').pack
+_bin_double2 = struct.Struct('=dd').pack
+# (int, double) pairs (used for linear terms, initial values, and
+# float-valued suffixes)
+_bin_pair = struct.Struct('=id').pack
+# The arithmetic type of the binary data, recorded in the "arith" field
+# of the sixth header line ([Gay05], description of the header): 0 for
+# text files, otherwise the ASL Arith_Kind_ASL of the machine that wrote
+# the file (1 for IEEE little-endian, 2 for IEEE big-endian), which
+# lets the reader detect (and swap) foreign byte orders.
+_bin_arith = 1 if sys.byteorder == 'little' else 2
+
+
+def _bin_str(val):
+    # Strings (the function name in "F" segments, the suffix name in
+    # "S" segments, and "h" string constants) are written as the int
+    # length followed by the characters, in place of the text format's
+    # whitespace-delimited token / "h<len>:<chars>" ([Gay05], binary
+    # format notes)
+    val = val.encode('utf-8')
+    return _bin_int(len(val)) + val
+
+
+def _nl_text_to_binary(nl):
+    """Convert NL text expression lines to the binary NL format"""
+    ans = []
+    pos = 0
+    while pos < len(nl):
+        key = nl[pos]
+        if key == 'h':
+            # String constants can contain newlines, so we must rely on
+            # the string length ("h<len>:<string>")
+            sep = nl.index(':', pos)
+            end = sep + 1 + int(nl[pos + 1 : sep])
+            ans.append(b'h' + _bin_str(nl[sep + 1 : end]))
+            pos = end + 1
+            continue
+        end = nl.index('\n', pos)
+        line = nl[pos:end].split('\t', 1)[0]
+        pos = end + 1
+        if key == 'n':
+            ans.append(b'n' + _bin_double(float(line[1:])))
+        elif key == 'o' or key == 'v':
+            ans.append(key.encode() + _bin_int(int(line[1:])))
+        elif key == 'f':
+            ans.append(b'f' + _bin_int2(*map(int, line[1:].split())))
+        else:
+            # The argument count for n-ary operators
+            ans.append(_bin_int(int(line)))
+    return b''.join(ans)
+
+
+def _bin_bound(line):
+    """Convert a text "r" / "b" segment line to the binary NL format"""
+    # Each line starts with the bound type ([Gay05], "r" and "b"
+    # segments): 0 (lb, ub), 1 (ub), 2 (lb), 3 (free), 4 (== value), and
+    # (for "r" only) 5 (complementarity: two ints).  The type is the
+    # single (ASCII) character, followed by the binary values.
+    line = line.split('\t', 1)[0].split()
+    if line[0] == '5':
+        return b'5' + _bin_int2(int(line[1]), int(line[2]))
+    return line[0].encode() + b''.join(_bin_double(float(v)) for v in line[1:])
+
+
 ScalingFactors = namedtuple(
     'ScalingFactors', ['variables', 'constraints', 'objectives']
 )
@@ -205,6 +303,19 @@ class NLWriter(object):
             description='Write the corresponding .row and .col files',
         ),
     )
+    CONFIG.declare(
+        'binary',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Write the NL file in binary ("b") format',
+            doc="""
+            If True, the writer will generate the binary NL format
+            (which solvers can read without parsing numeric text).  The
+            output stream must be opened in binary mode.  The .row and .col files are always
+            text files.""",
+        ),
+    )
     CONFIG.declare(
         'scale_model',
         ConfigValue(
@@ -279,11 +390,53 @@ class NLWriter(object):
         variable elimination (without fill-in).""",
         ),
     )
+    CONFIG.declare(
+        'incremental',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Reuse compiled expressions from previous writes',
+            doc="""
+        If True, the writer will cache the compiled representation of
+        each constraint and objective expression and reuse it in
+        subsequent calls to :py:meth:`write` (on this writer instance)
+        as long as the expression object, its scaling factor, and the
+        values of the mutable Params and fixed Vars that it references
+        have not changed.  Only expressions that have changed are
+        re-walked.  Expressions that reference named Expressions or
+        ExternalFunctions are always re-walked.  If all expressions
+        were reused and the model structure (active components, column
+        order, objective senses, and variable scaling) is unchanged,
+        the variable categorization and the structural segments of the
+        NL file are also reused.  Solver interfaces that keep a writer
+        instance (e.g., ``ipopt``) reuse the cache across solves.""",
+        ),
+    )
+    CONFIG.declare(
+        'processes',
+        ConfigValue(
+            default=1,
+            domain=NonNegativeInt,
+            description='Number of processes to use to compile constraints',
+            doc="""
+        Number of (forked) worker processes to use to compile the
+        constraint expressions.  0 uses all available CPUs.  The
+        constraints are partitioned into consecutive blocks that are
+        compiled by the workers and collected (in order) by the main
+        process, so the resulting NL file is identical to the file
+        generated serially.  Constraints that reference named
+        Expressions or ExternalFunctions are compiled by the main
+        process.  Small models, incremental writes, and platforms that
+        do not support the 'fork' process start method are always
+        processed serially.""",
+        ),
+    )
 
     def __init__(self):
         #: Instance configuration;
         #: see :ref:`pyomo.repn.plugins.nl_writer.NLWriter::CONFIG`.
         self.config = self.CONFIG()
+        self._fragment_cache = None
 
     def __call__(self, model, filename, solver_capability, io_options):
         if filename is None:
@@ -309,8 +462,12 @@ class NLWriter(object):
             _open = lambda fname: open(fname, 'w')
         else:
             _open = nullcontext
+        if config.binary:
+            _nl_open = lambda fname: open(fname, 'wb')
+        else:
+            _nl_open = lambda fname: open(fname, 'w', newline='')
         with (
-            open(filename, 'w', newline='') as FILE,
+            _nl_open(filename) as FILE,
             _open(row_fname) as ROWFILE,
             _open(col_fname) as COLFILE,
         ):
@@ -353,7 +510,9 @@ class NLWriter(object):
 
         ostream: io.TextIOBase
             The text output stream where the NL "file" will be written.
-            Could be an opened file or a io.StringIO.
+            Could be an opened file or a io.StringIO.  If `binary` is
+            True, this must be a binary stream (e.g., a file opened in
+            binary mode or an io.BytesIO).
 
         rowstream: io.TextIOBase
             A text output stream to write the ASL "row file" (list of
@@ -367,10 +526,19 @@ class NLWriter(object):
         """
         config = options.pop('config', self.config)(options)
 
+        if config.incremental:
+            if self._fragment_cache is None:
+                self._fragment_cache = NLFragmentCache()
+            fragment_cache = self._fragment_cache
+        else:
+            fragment_cache = None
+
         # Pause the GC, as the walker that generates the compiled NL
         # representation generates (and disposes of) a large number of
         # small objects.
-        with _NLWriter_impl(ostream, rowstream, colstream, config) as impl:
+        with _NLWriter_impl(
+            ostream, rowstream, colstream, config, fragment_cache
+        ) as impl:
             return impl.write(model)
 
     def _generate_symbol_map(self, info):
@@ -498,13 +666,185 @@ class _NoScalingFactor(object):
         return 1
 
 
+class _NLFragment(object):
+    """A cached compiled expression (see :py:class:`NLFragmentCache`)"""
+
+    __slots__ = ('comp', 'expr', 'scale', 'repn', 'vars', 'fixed', 'params')
+
+    def __init__(self, comp, expr, scale, repn, vars_, fixed, params):
+        self.comp = comp
+        self.expr = expr
+        self.scale = scale
+        self.repn = repn
+        # Unfixed variables checked against the var_map by the walker
+        # (in walker order; see :py:class:`_VarVisitRecorder`)
+        self.vars = vars_
+        # (VarData, fixed, value) for all variables in the expression
+        self.fixed = fixed
+        # (ParamData, value) for all mutable parameters in the expression
+        self.params = params
+
+    def is_current(self, comp, expr, scale):
+        if self.comp is not comp or self.expr is not expr or self.scale != scale:
+            return False
+        for v, fixed, val in self.fixed:
+            if v.fixed is not fixed or (fixed and v.value != val):
+                return False
+        for p, val in self.params:
+            if p.value != val:
+                return False
+        return True
+
+
+class NLFragmentCache(object):
+    """Cache of compiled constraint / objective expressions
+
+    This cache persists the :py:class:`AMPLRepn` generated for each
+    constraint and objective between calls to :py:meth:`NLWriter.write`
+    (when the writer is run with ``incremental=True``).  Each entry
+    records the expression object that was compiled, the scaling factor
+    that was applied, and the values of all mutable Params and fixed
+    Vars that were folded into the compiled representation.  An entry
+    is only reused if all of those are unchanged.
+
+    Entries for components that were not encountered in the most recent
+    (successful) write are discarded.
+
+    When every expression in a write is reused from the cache, the
+    writer also records the structure of the model (see
+    :py:class:`_NLLayout`): if the next write finds the same structure,
+    the previous variable categorization and the structural (``C``,
+    ``O``, ``k``, ``J``, and ``G``) segments of the NL file are reused.
+
+    """
+
+    def __init__(self):
+        self.template = None
+        self.fragments = {}
+        self.layout = None
+        self._active = None
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        self.fragments = {}
+        self.layout = None
+        self._active = None
+
+    def begin(self, template):
+        if template is not self.template:
+            # The NL text format (e.g., symbolic_solver_labels) changed:
+            # none of the cached fragments are reusable
+            self.clear()
+            self.template = template
+        self._active = {}
+        self.hits = self.misses = 0
+
+    def end(self):
+        self.fragments = self._active
+        self._active = None
+
+    def lookup(self, comp, expr, scale):
+        _id = id(comp)
+        entry = self.fragments.get(_id, None)
+        if entry is not None and entry.is_current(comp, expr, scale):
+            self._active[_id] = entry
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    def store(self, comp, expr, scale, repn, visited):
+        fixed = []
+        var_ids = {}
+        for v in identify_variables(expr, include_fixed=True):
+            fixed.append((v, v.fixed, v.value))
+            var_ids[id(v)] = v
+        # Only the first check of each variable can update the var_map,
+        # and fixed variables are never added to it (the fragment is
+        # only reused while the fixed flags are unchanged).  Note that
+        # this includes variables that do not appear in the final repn
+        # (e.g., terms that were multiplied by 0).
+        vars_ = [
+            v for v in map(var_ids.__getitem__, dict.fromkeys(visited)) if not v.fixed
+        ]
+        params = [(p, p.value) for p in identify_mutable_parameters(expr)]
+        self._active[id(comp)] = _NLFragment(
+            comp, expr, scale, repn.duplicate(), vars_, fixed, params
+        )
+
+
+class _NLLayout(object):
+    """The structure of the most recently written model
+
+    The ``key`` is the structural fingerprint of the model (see
+    :py:meth:`_NLWriter_impl._structure_fingerprint`).  ``categories``
+    holds the results of categorizing the objective and constraint
+    variables, ``variables`` the final column order, and ``segments``
+    the text (or bytes) of the C/O and k/J/G sections of the NL file.
+
+    """
+
+    __slots__ = ('key', 'categories', 'variables', 'segments')
+
+    def __init__(self, key, categories, variables, segments):
+        self.key = key
+        self.categories = categories
+        self.variables = variables
+        self.segments = segments
+
+
+class _VarVisitRecorder(object):
+    """var_map proxy that records the variables checked by the walker
+
+    The AMPL walker checks the var_map for every variable that it
+    encounters (adding the variable, along with the rest of its
+    component, if it is not already there).  Recording the checks lets
+    the :py:class:`NLFragmentCache` replay exactly the var_map updates
+    that walking the expression would have made.
+
+    """
+
+    __slots__ = ('var_map', 'visited')
+
+    def __init__(self, var_map):
+        self.var_map = var_map
+        self.visited = []
+
+    def __contains__(self, key):
+        self.visited.append(key)
+        return key in self.var_map
+
+    def __getitem__(self, key):
+        return self.var_map[key]
+
+    def __setitem__(self, key, val):
+        self.var_map[key] = val
+
+
+class _RecordingVarMap(dict):
+    """var_map that records the variables added to it (in order)"""
+
+    __slots__ = ('added',)
+
+    def __init__(self):
+        super().__init__()
+        self.added = []
+
+    def __setitem__(self, key, val):
+        if key not in self:
+            self.added.append(val)
+        super().__setitem__(key, val)
+
+
 class _NLWriter_impl(object):
-    def __init__(self, ostream, rowstream, colstream, config):
+    def __init__(self, ostream, rowstream, colstream, config, fragment_cache=None):
         self.ostream = ostream
         self.rowstream = rowstream
         self.colstream = colstream
         self.config = config
         self.symbolic_solver_labels = config.symbolic_solver_labels
+        self.binary = config.binary
         self.subexpression_cache = {}
         self.subexpression_order = None  # set to [] later
         self.external_functions = {}
@@ -524,6 +864,7 @@ class _NLWriter_impl(object):
         self.next_V_line_id = 0
         self.pause_gc = None
         self.template = self.visitor.Result.template
+        self.fragment_cache = fragment_cache
 
     def __enter__(self):
         self.pause_gc = PauseGC()
@@ -576,9 +917,13 @@ class _NLWriter_impl(object):
 
         # Caching some frequently-used objects into the locals()
         symbolic_solver_labels = self.symbolic_solver_labels
+        binary = self.binary
         visitor = self.visitor
         ostream = self.ostream
         linear_presolve = self.config.linear_presolve
+        fragment_cache = self.fragment_cache
+        if fragment_cache is not None:
+            fragment_cache.begin(visitor.Result)
 
         nl_map = self.var_id_to_nl_map
         var_map = self.var_map
@@ -639,7 +984,7 @@ class _NLWriter_impl(object):
                 else:
                     timer.toc('Objective %s', last_parent, level=logging.DEBUG)
                 last_parent = obj.parent_component()
-            expr_info = visitor.walk_expression((obj.expr, obj, 1, scaling_factor(obj)))
+            expr_info = self._compile_expression(obj.expr, obj, 1, scaling_factor(obj))
             if expr_info.named_exprs:
                 self._record_named_expression_usage(expr_info.named_exprs, obj, 1)
             if expr_info.nonlinear:
@@ -674,7 +1019,26 @@ class _NLWriter_impl(object):
         n_complementarity_nz_var_lb = 0
         #
         last_parent = None
-        for con in ordered_active_constraints(model, self.config):
+        constraints = ordered_active_constraints(model, self.config)
+        # Constraint expressions compiled by worker processes (only
+        # populated when compiling in parallel)
+        compiled = {}
+        if self.config.processes != 1 and fragment_cache is None:
+            constraints = list(constraints)
+            # Worker processes report the variables they encounter by
+            # (id(component), index)
+            self.var_components = {
+                id(comp): comp
+                for comp in model.component_objects(Var, descend_into=True)
+            }
+            results = parallel_chunk_map(
+                partial(self._compile_constraints, scaling_factor),
+                constraints,
+                self.config.processes,
+            )
+            if results is not None:
+                constraints = collect_chunk_results(constraints, results, compiled)
+        for con in constraints:
             if with_debug_timing and con.parent_component() is not last_parent:
                 if last_parent is None:
                     timer.toc(None)
@@ -682,11 +1046,16 @@ class _NLWriter_impl(object):
                     timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
                 last_parent = con.parent_component()
             scale = scaling_factor(con)
-            # Note: Constraint.to_bounded_expression(evaluate_bounds=True)
-            # guarantee a return value that is either a (finite)
-            # native_numeric_type, or None
-            lb, body, ub = con.to_bounded_expression(True)
-            expr_info = visitor.walk_expression((body, con, 0, scale))
+            info = compiled.pop(id(con), None)
+            if info is not None:
+                # This constraint was compiled by a worker process
+                lb, ub, expr_info = self._restore_compiled(info)
+            else:
+                # Note: Constraint.to_bounded_expression(evaluate_bounds=True)
+                # guarantee a return value that is either a (finite)
+                # native_numeric_type, or None
+                lb, body, ub = con.to_bounded_expression(True)
+                expr_info = self._compile_expression(body, con, 0, scale)
             if expr_info.named_exprs:
                 self._record_named_expression_usage(expr_info.named_exprs, con, 0)
 
@@ -803,17 +1172,48 @@ class _NLWriter_impl(object):
         # be revisited.
         linear_by_comp = {_id: info.linear for _id, info in eliminated_vars.items()}
 
-        # We need to categorize the named subexpressions first so that
-        # we know their linear / nonlinear vars when we encounter them
-        # in constraints / objectives
-        self._categorize_vars(self.subexpression_cache.values(), linear_by_comp)
-        n_subexpressions = self._count_subexpression_occurrences()
-        obj_vars_linear, obj_vars_nonlinear, obj_nnz_by_var = self._categorize_vars(
-            objectives, linear_by_comp
-        )
-        con_vars_linear, con_vars_nonlinear, con_nnz_by_var = self._categorize_vars(
-            constraints, linear_by_comp
-        )
+        # If every expression was reused from the fragment cache (and
+        # the presolve did not alter the model), then we can compare the
+        # model structure to the previous write.  If it is unchanged, we
+        # will reuse the previous variable categorization and the
+        # structural segments of the NL file.
+        layout_key = layout = None
+        if (
+            fragment_cache is not None
+            and not fragment_cache.misses
+            and not (eliminated_cons or eliminated_vars)
+            and not self.subexpression_cache
+            and not self.external_functions
+            and not component_map[SOSConstraint]
+            and not self.config.export_nonlinear_variables
+        ):
+            layout_key = self._structure_fingerprint(
+                objectives, constraints, scaling_factor
+            )
+            layout = fragment_cache.layout
+            if layout is not None and layout.key != layout_key:
+                layout = None
+
+        if layout is not None:
+            categories = layout.categories
+            n_subexpressions = [0] * 5
+        else:
+            # We need to categorize the named subexpressions first so
+            # that we know their linear / nonlinear vars when we
+            # encounter them in constraints / objectives
+            self._categorize_vars(self.subexpression_cache.values(), linear_by_comp)
+            n_subexpressions = self._count_subexpression_occurrences()
+            categories = self._categorize_vars(
+                objectives, linear_by_comp
+            ) + self._categorize_vars(constraints, linear_by_comp)
+        (
+            obj_vars_linear,
+            obj_vars_nonlinear,
+            obj_nnz_by_var,
+            con_vars_linear,
+            con_vars_nonlinear,
+            con_nnz_by_var,
+        ) = categories
 
         if self.config.export_nonlinear_variables:
             for v in self.config.export_nonlinear_variables:
@@ -939,6 +1339,14 @@ class _NLWriter_impl(object):
         else:
             linear_binary_vars = linear_integer_vars = set()
         assert len(variables) == n_vars
+        if layout is not None and layout.variables != variables:
+            # The column order changed (e.g., because of a change in
+            # variable domains), so the cached segments are not valid.
+            # Categorize the expressions so that the Jacobian will
+            # include all the nonzeros.
+            self._categorize_vars(objectives, linear_by_comp)
+            self._categorize_vars(constraints, linear_by_comp)
+            layout = None
         timer.toc(
             'Set row / column ordering: %s var [%s, %s, %s R/B/Z], '
             '%s con [%s, %s L/NL]',
@@ -1142,10 +1550,18 @@ class _NLWriter_impl(object):
         #
         # Print Header
         #
+        if binary:
+            # The header is text (even in binary files): we will
+            # generate the header and then write it to the (binary)
+            # output stream
+            header = ostream = StringIO()
+        #
         # LINE 1
         #
-        if visitor.encountered_string_arguments and 'b' not in getattr(
-            ostream, 'mode', ''
+        if (
+            visitor.encountered_string_arguments
+            and not binary
+            and 'b' not in getattr(ostream, 'mode', '')
         ):
             # Not all streams support tell()
             try:
@@ -1153,7 +1569,7 @@ class _NLWriter_impl(object):
             except IOError:
                 _written_bytes = None
 
-        line_1_txt = f"g3 1 1 0\t# problem {model.name}\n"
+        line_1_txt = f"{'b' if binary else 'g'}3 1 1 0\t# problem {model.name}\n"
         ostream.write(line_1_txt)
 
         # If there were any string arguments, then we need to ensure
@@ -1161,8 +1577,10 @@ class _NLWriter_impl(object):
         # than '\n'.  Binary files do not perform newline mapping (of
         # course, we will also need to map all the str to bytes for
         # binary-mode I/O).
-        if visitor.encountered_string_arguments and 'b' not in getattr(
-            ostream, 'mode', ''
+        if (
+            visitor.encountered_string_arguments
+            and not binary
+            and 'b' not in getattr(ostream, 'mode', '')
         ):
             if _written_bytes is None:
                 _written_bytes = 0
@@ -1251,9 +1669,9 @@ class _NLWriter_impl(object):
         # LINE 6
         #
         ostream.write(
-            " 0 %d 0 1\t"
+            " 0 %d %d 1\t"
             "# linear network variables; functions; arith, flags\n"
-            % (len(self.external_functions),)
+            % (len(self.external_functions), _bin_arith if binary else 0)
         )
         #
         # LINE 7
@@ -1293,6 +1711,11 @@ class _NLWriter_impl(object):
         ostream.write(
             " %d %d %d %d %d\t# common exprs: b,c,o,c1,o1\n" % tuple(n_subexpressions)
         )
+        if binary:
+            ostream = self.ostream
+            ostream.write(header.getvalue().encode('utf-8'))
+
+        output_stream = ostream
 
         #
         # "F" lines (external function definitions)
@@ -1300,7 +1723,10 @@ class _NLWriter_impl(object):
         amplfunc_libraries = set()
         for fid, fcn in self.external_functions:
             amplfunc_libraries.add(fcn._library)
-            ostream.write("F%d 1 -1 %s\n" % (fid, fcn._function))
+            if binary:
+                ostream.write(b'F' + _bin_int3(fid, 1, -1) + _bin_str(fcn._function))
+            else:
+                ostream.write("F%d 1 -1 %s\n" % (fid, fcn._function))
 
         #
         # "S" lines (suffixes)
@@ -1331,6 +1757,20 @@ class _NLWriter_impl(object):
             ):
                 if not _vals:
                     continue
+                if binary:
+                    if _float:
+                        _vals = [_bin_pair(_id, _vals[_id]) for _id in sorted(_vals)]
+                    else:
+                        _vals = [
+                            _bin_int2(_id, int(_vals[_id])) for _id in sorted(_vals)
+                        ]
+                    ostream.write(
+                        b'S'
+                        + _bin_int2(_field | _float, len(_vals))
+                        + _bin_str(name)
+                        + b''.join(_vals)
+                    )
+                    continue
                 ostream.write(f"S{_field|_float} {len(_vals)} {name}\n")
                 # Note: _SuffixData.compile() guarantees the value is int/float
                 ostream.write(
@@ -1367,55 +1807,87 @@ class _NLWriter_impl(object):
                     single_use_subexpressions[target_expr] = []
                 single_use_subexpressions[target_expr].append(_id)
 
-        #
-        # "C" lines (constraints: nonlinear expression)
-        #
-        for row_idx, info in enumerate(constraints):
-            if info[1].nonlinear is None:
-                # Because we have moved the nonlinear constraints to the
-                # beginning, we can very quickly write all the linear
-                # constraints at the end (as their nonlinear expressions
-                # are the constant 0).
-                _expr = self.template.const % 0
-                if symbolic_solver_labels:
-                    ostream.write(
-                        _expr.join(
-                            f'C{i}{row_comments[i]}\n'
-                            for i in range(row_idx, len(constraints))
+        if layout is not None:
+            ostream.write(layout.segments[0])
+        else:
+            if layout_key is not None:
+                # Capture the structural segments so that they can be
+                # reused by the next write
+                segments = []
+                self.ostream = ostream = BytesIO() if binary else StringIO()
+            #
+            # "C" lines (constraints: nonlinear expression)
+            #
+            for row_idx, info in enumerate(constraints):
+                if info[1].nonlinear is None:
+                    # Because we have moved the nonlinear constraints to the
+                    # beginning, we can very quickly write all the linear
+                    # constraints at the end (as their nonlinear expressions
+                    # are the constant 0).
+                    _expr = self.template.const % 0
+                    if binary:
+                        _expr = _nl_text_to_binary(_expr)
+                        ostream.write(
+                            b''.join(
+                                b'C' + _bin_int(i) + _expr
+                                for i in range(row_idx, len(constraints))
+                            )
+                        )
+                        break
+                    if symbolic_solver_labels:
+                        ostream.write(
+                            _expr.join(
+                                f'C{i}{row_comments[i]}\n'
+                                for i in range(row_idx, len(constraints))
+                            )
+                        )
+                    else:
+                        ostream.write(
+                            _expr.join(
+                                f'C{i}\n' for i in range(row_idx, len(constraints))
+                            )
                         )
-                    )
-                else:
-                    ostream.write(
-                        _expr.join(f'C{i}\n' for i in range(row_idx, len(constraints)))
-                    )
 
-                # We know that there is at least one linear expression
-                # (row_idx), so we can unconditionally emit the last "0
-                # expression":
-                ostream.write(_expr)
-                break
-            if single_use_subexpressions:
-                for _id in single_use_subexpressions.get(id(info[0]), ()):
-                    self._write_v_line(_id, row_idx + 1, scale_model, scaling_cache)
-            ostream.write(f'C{row_idx}{row_comments[row_idx]}\n')
-            self._write_nl_expression(info[1], False)
+                    # We know that there is at least one linear expression
+                    # (row_idx), so we can unconditionally emit the last "0
+                    # expression":
+                    ostream.write(_expr)
+                    break
+                if single_use_subexpressions:
+                    for _id in single_use_subexpressions.get(id(info[0]), ()):
+                        self._write_v_line(_id, row_idx + 1, scale_model, scaling_cache)
+                if binary:
+                    ostream.write(b'C' + _bin_int(row_idx))
+                else:
+                    ostream.write(f'C{row_idx}{row_comments[row_idx]}\n')
+                self._write_nl_expression(info[1], False)
 
-        #
-        # "O" lines (objectives: nonlinear expression)
-        #
-        for obj_idx, info in enumerate(objectives):
-            if single_use_subexpressions:
-                for _id in single_use_subexpressions.get(id(info[0]), ()):
-                    # Note that "Writing .nl files" (2005) is incorrectly
-                    # missing the "+ 1" in the description of V lines
-                    # appearing in only Objectives (bottom of page 9).
-                    self._write_v_line(
-                        _id, n_cons + n_lcons + obj_idx + 1, scale_model, scaling_cache
-                    )
-            lbl = row_comments[n_cons + obj_idx]
-            sense = 0 if info[0].sense == minimize else 1
-            ostream.write(f'O{obj_idx} {sense}{lbl}\n')
-            self._write_nl_expression(info[1], True)
+            #
+            # "O" lines (objectives: nonlinear expression)
+            #
+            for obj_idx, info in enumerate(objectives):
+                if single_use_subexpressions:
+                    for _id in single_use_subexpressions.get(id(info[0]), ()):
+                        # Note that "Writing .nl files" (2005) is incorrectly
+                        # missing the "+ 1" in the description of V lines
+                        # appearing in only Objectives (bottom of page 9).
+                        self._write_v_line(
+                            _id,
+                            n_cons + n_lcons + obj_idx + 1,
+                            scale_model,
+                            scaling_cache,
+                        )
+                lbl = row_comments[n_cons + obj_idx]
+                sense = 0 if info[0].sense == minimize else 1
+                if binary:
+                    ostream.write(b'O' + _bin_int2(obj_idx, sense))
+                else:
+                    ostream.write(f'O{obj_idx} {sense}{lbl}\n')
+                self._write_nl_expression(info[1], True)
+            if layout_key is not None:
+                segments.append(ostream.getvalue())
+                self.ostream = ostream = output_stream
+                ostream.write(segments[-1])
 
         #
         # "d" lines (dual initialization)
@@ -1442,7 +1914,15 @@ class _NLWriter_impl(object):
                 logger.warning("ignoring 'dual' suffix for Objective types")
             if data.prob:
                 logger.warning("ignoring 'dual' suffix for Model")
-            if data.con:
+            if data.con and binary:
+                ostream.write(
+                    b'd'
+                    + _bin_int(len(data.con))
+                    + b''.join(
+                        _bin_pair(_id, data.con[_id]) for _id in sorted(data.con)
+                    )
+                )
+            elif data.con:
                 ostream.write(f"d{len(data.con)}\n")
                 # Note: _SuffixData.compile() guarantees the value is int/float
                 ostream.write(
@@ -1462,111 +1942,185 @@ class _NLWriter_impl(object):
                 (var_idx, val * variable_scaling[var_idx])
                 for var_idx, val in _init_lines
             ]
-        ostream.write(
-            'x%d%s\n'
-            % (len(_init_lines), "\t# initial guess" if symbolic_solver_labels else '')
-        )
-        ostream.write(
-            ''.join(
-                f'{var_idx} {val!s}{col_comments[var_idx]}\n'
-                for var_idx, val in _init_lines
+        if binary:
+            ostream.write(
+                b'x'
+                + _bin_int(len(_init_lines))
+                + b''.join(_bin_pair(var_idx, val) for var_idx, val in _init_lines)
+            )
+        else:
+            ostream.write(
+                'x%d%s\n'
+                % (
+                    len(_init_lines),
+                    "\t# initial guess" if symbolic_solver_labels else '',
+                )
+            )
+            ostream.write(
+                ''.join(
+                    f'{var_idx} {val!s}{col_comments[var_idx]}\n'
+                    for var_idx, val in _init_lines
+                )
             )
-        )
 
         #
         # "r" lines (constraint bounds)
         #
-        ostream.write(
-            'r%s\n'
-            % (
-                (
-                    "\t#%d ranges (rhs's)" % len(constraints)
-                    if symbolic_solver_labels
-                    else ''
-                ),
+        if binary:
+            ostream.write(b'r' + b''.join(map(_bin_bound, r_lines)))
+        else:
+            ostream.write(
+                'r%s\n'
+                % (
+                    (
+                        "\t#%d ranges (rhs's)" % len(constraints)
+                        if symbolic_solver_labels
+                        else ''
+                    ),
+                )
             )
-        )
-        ostream.write("\n".join(r_lines))
-        if r_lines:
-            ostream.write("\n")
+            ostream.write("\n".join(r_lines))
+            if r_lines:
+                ostream.write("\n")
 
         #
         # "b" lines (variable bounds)
         #
-        ostream.write(
-            'b%s\n'
-            % (
-                (
-                    "\t#%d bounds (on variables)" % len(variables)
-                    if symbolic_solver_labels
-                    else ''
-                ),
-            )
-        )
-        for var_idx, _id in enumerate(variables):
-            lb, ub = var_bounds[_id]
-            if lb == ub:
-                if lb is None:  # unbounded
-                    ostream.write(f"3{col_comments[var_idx]}\n")
-                else:  # ==
-                    ostream.write(f"4 {lb!s}{col_comments[var_idx]}\n")
-            elif lb is None:  # var <= ub
-                ostream.write(f"1 {ub!s}{col_comments[var_idx]}\n")
-            elif ub is None:  # lb <= body
-                ostream.write(f"2 {lb!s}{col_comments[var_idx]}\n")
-            else:  # lb <= body <= ub
-                ostream.write(f"0 {lb!s} {ub!s}{col_comments[var_idx]}\n")
-
-        #
-        # "k" lines (column offsets in Jacobian NNZ)
-        #
-        ostream.write(
-            'k%d%s\n'
-            % (
-                len(variables) - 1,
-                (
-                    "\t#intermediate Jacobian column lengths"
-                    if symbolic_solver_labels
-                    else ''
-                ),
+        if binary:
+            _bounds = [b'b']
+            for _id in variables:
+                lb, ub = var_bounds[_id]
+                if lb == ub:
+                    if lb is None:  # unbounded
+                        _bounds.append(b'3')
+                    else:  # ==
+                        _bounds.append(b'4' + _bin_double(lb))
+                elif lb is None:  # var <= ub
+                    _bounds.append(b'1' + _bin_double(ub))
+                elif ub is None:  # lb <= body
+                    _bounds.append(b'2' + _bin_double(lb))
+                else:  # lb <= body <= ub
+                    _bounds.append(b'0' + _bin_double2(lb, ub))
+            ostream.write(b''.join(_bounds))
+        else:
+            ostream.write(
+                'b%s\n'
+                % (
+                    (
+                        "\t#%d bounds (on variables)" % len(variables)
+                        if symbolic_solver_labels
+                        else ''
+                    ),
+                )
             )
-        )
-        ktot = 0
-        for var_idx, _id in enumerate(variables[:-1]):
-            ktot += con_nnz_by_var.get(_id, 0)
-            ostream.write(f"{ktot}\n")
+            for var_idx, _id in enumerate(variables):
+                lb, ub = var_bounds[_id]
+                if lb == ub:
+                    if lb is None:  # unbounded
+                        ostream.write(f"3{col_comments[var_idx]}\n")
+                    else:  # ==
+                        ostream.write(f"4 {lb!s}{col_comments[var_idx]}\n")
+                elif lb is None:  # var <= ub
+                    ostream.write(f"1 {ub!s}{col_comments[var_idx]}\n")
+                elif ub is None:  # lb <= body
+                    ostream.write(f"2 {lb!s}{col_comments[var_idx]}\n")
+                else:  # lb <= body <= ub
+                    ostream.write(f"0 {lb!s} {ub!s}{col_comments[var_idx]}\n")
+
+        if layout is not None:
+            ostream.write(layout.segments[1])
+        else:
+            if layout_key is not None:
+                self.ostream = ostream = BytesIO() if binary else StringIO()
+            #
+            # "k" lines (column offsets in Jacobian NNZ)
+            #
+            if binary:
+                # [Gay05], "k" segment: the count (n_vars - 1) followed
+                # by the cumulative Jacobian column lengths of all but
+                # the last variable, all as ints
+                _k = list(
+                    accumulate(con_nnz_by_var.get(_id, 0) for _id in variables[:-1])
+                )
+                ostream.write(
+                    b'k'
+                    + _bin_int(len(variables) - 1)
+                    + struct.pack(f'={len(_k)}i', *_k)
+                )
+            else:
+                ostream.write(
+                    'k%d%s\n'
+                    % (
+                        len(variables) - 1,
+                        (
+                            "\t#intermediate Jacobian column lengths"
+                            if symbolic_solver_labels
+                            else ''
+                        ),
+                    )
+                )
+                ktot = 0
+                for var_idx, _id in enumerate(variables[:-1]):
+                    ktot += con_nnz_by_var.get(_id, 0)
+                    ostream.write(f"{ktot}\n")
 
-        #
-        # "J" lines (non-empty terms in the Jacobian)
-        #
-        for row_idx, info in enumerate(constraints):
-            linear = info[1].linear
-            # ASL will fail on "J<N> 0", so if there are no coefficients
-            # (e.g., a nonlinear-only constraint), then skip this entry
-            if not linear:
-                continue
-            if scale_model:
-                for _id, val in linear.items():
-                    linear[_id] /= scaling_cache[_id]
-            ostream.write(f'J{row_idx} {len(linear)}{row_comments[row_idx]}\n')
-            for _id in sorted(linear, key=column_order.__getitem__):
-                ostream.write(f'{column_order[_id]} {linear[_id]!s}\n')
+            #
+            # "J" lines (non-empty terms in the Jacobian)
+            #
+            for row_idx, info in enumerate(constraints):
+                linear = info[1].linear
+                # ASL will fail on "J<N> 0", so if there are no coefficients
+                # (e.g., a nonlinear-only constraint), then skip this entry
+                if not linear:
+                    continue
+                if scale_model:
+                    for _id, val in linear.items():
+                        linear[_id] /= scaling_cache[_id]
+                if binary:
+                    ostream.write(
+                        b'J'
+                        + _bin_int2(row_idx, len(linear))
+                        + b''.join(
+                            _bin_pair(column_order[_id], linear[_id])
+                            for _id in sorted(linear, key=column_order.__getitem__)
+                        )
+                    )
+                    continue
+                ostream.write(f'J{row_idx} {len(linear)}{row_comments[row_idx]}\n')
+                for _id in sorted(linear, key=column_order.__getitem__):
+                    ostream.write(f'{column_order[_id]} {linear[_id]!s}\n')
 
-        #
-        # "G" lines (non-empty terms in the Objective)
-        #
-        for obj_idx, info in enumerate(objectives):
-            linear = info[1].linear
-            # ASL will fail on "G<N> 0", so if there are no coefficients
-            # (e.g., a constant objective), then skip this entry
-            if not linear:
-                continue
-            if scale_model:
-                for _id, val in linear.items():
-                    linear[_id] /= scaling_cache[_id]
-            ostream.write(f'G{obj_idx} {len(linear)}{row_comments[obj_idx + n_cons]}\n')
-            for _id in sorted(linear, key=column_order.__getitem__):
-                ostream.write(f'{column_order[_id]} {linear[_id]!s}\n')
+            #
+            # "G" lines (non-empty terms in the Objective)
+            #
+            for obj_idx, info in enumerate(objectives):
+                linear = info[1].linear
+                # ASL will fail on "G<N> 0", so if there are no coefficients
+                # (e.g., a constant objective), then skip this entry
+                if not linear:
+                    continue
+                if scale_model:
+                    for _id, val in linear.items():
+                        linear[_id] /= scaling_cache[_id]
+                if binary:
+                    ostream.write(
+                        b'G'
+                        + _bin_int2(obj_idx, len(linear))
+                        + b''.join(
+                            _bin_pair(column_order[_id], linear[_id])
+                            for _id in sorted(linear, key=column_order.__getitem__)
+                        )
+                    )
+                    continue
+                ostream.write(
+                    f'G{obj_idx} {len(linear)}{row_comments[obj_idx + n_cons]}\n'
+                )
+                for _id in sorted(linear, key=column_order.__getitem__):
+                    ostream.write(f'{column_order[_id]} {linear[_id]!s}\n')
+            if layout_key is not None:
+                segments.append(ostream.getvalue())
+                self.ostream = ostream = output_stream
+                ostream.write(segments[-1])
 
         # Generate the return information
         eliminated_vars = [
@@ -1592,10 +2146,161 @@ class _NLWriter_impl(object):
             eliminated_vars=eliminated_vars,
             scaling=scaling,
         )
+        if fragment_cache is not None:
+            if layout_key is None:
+                fragment_cache.layout = None
+            elif layout is None:
+                fragment_cache.layout = _NLLayout(
+                    layout_key, categories, variables, segments
+                )
+            fragment_cache.end()
+            timer.toc(
+                "Reused %s of %s cached expressions",
+                fragment_cache.hits,
+                fragment_cache.hits + fragment_cache.misses,
+                level=logging.DEBUG,
+            )
         timer.toc("Wrote NL stream", level=logging.DEBUG)
         timer.toc("Generated NL representation", delta=False)
         return info
 
+    def _structure_fingerprint(self, objectives, constraints, scaling_factor):
+        """Return a key identifying the structure of the compiled model
+
+        This is only valid when all constraint and objective expressions
+        were reused from the fragment cache (so their compiled
+        representations are unchanged).  The remaining structure is
+        determined by the variables (and their order) in the var_map,
+        the (ordered) constraints and objectives, the objective senses,
+        and the variable scaling factors.
+
+        """
+        var_map = self.var_map
+        if scaling_factor.scale:
+            var_scaling = tuple(map(scaling_factor, var_map.values()))
+        else:
+            var_scaling = None
+        return (
+            self.binary,
+            tuple(var_map),
+            tuple(id(info[0]) for info in constraints),
+            tuple((id(info[0]), info[0].sense) for info in objectives),
+            var_scaling,
+        )
+
+    def _compile_expression(self, expr, comp, comp_type, scale):
+        """Compile (or retrieve from the fragment cache) an expression"""
+        cache = self.fragment_cache
+        if cache is None:
+            return self.visitor.walk_expression((expr, comp, comp_type, scale))
+        entry = cache.lookup(comp, expr, scale)
+        if entry is not None:
+            # Record the variables in the var_map in the same order
+            # that the walker would have encountered them
+            var_map = self.var_map
+            for v in entry.vars:
+                if id(v) not in var_map:
+                    AMPLBeforeChildDispatcher._record_var(self.visitor, v)
+            return entry.repn.duplicate()
+        n_subexpr = len(self.subexpression_cache)
+        n_external = len(self.external_functions)
+        visitor = self.visitor
+        var_map = visitor.var_map
+        visitor.var_map = recorder = _VarVisitRecorder(var_map)
+        try:
+            expr_info = visitor.walk_expression((expr, comp, comp_type, scale))
+        finally:
+            visitor.var_map = var_map
+        # Expressions that reference named subexpressions or external
+        # functions register shared state with the writer as a side
+        # effect of walking, and are not cached.
+        if (
+            not expr_info.named_exprs
+            and n_subexpr == len(self.subexpression_cache)
+            and n_external == len(self.external_functions)
+        ):
+            cache.store(comp, expr, scale, expr_info, recorder.visited)
+        return expr_info
+
+    def _compile_constraints(self, scaling_factor, constraints):
+        """Compile constraint bodies (in a worker process)
+
+        Returns a list with the (picklable) compiled data for each
+        constraint, or None for constraints that must be compiled by the
+        main process (constraints that reference named Expressions or
+        ExternalFunctions, that raise exceptions, or that reference
+        variables that we cannot identify by component).
+
+        """
+        var_map = _RecordingVarMap()
+        subexpression_cache = {}
+        external_functions = {}
+        visitor = AMPLRepnVisitor(
+            subexpression_cache,
+            external_functions,
+            var_map,
+            set(),
+            self.symbolic_solver_labels,
+            self.config.export_defined_variables,
+            self.sorter,
+        )
+        added = var_map.added
+        var_components = self.var_components
+        ans = []
+        for con in constraints:
+            added.clear()
+            try:
+                lb, body, ub = con.to_bounded_expression(True)
+                expr_info = visitor.walk_expression((body, con, 0, scaling_factor(con)))
+                # The first variable from each component that was added
+                # to the var_map by this constraint (the visitor adds
+                # all variables in a component at once)
+                new_vars = []
+                last_comp = None
+                for v in added:
+                    comp = v.parent_component()
+                    if comp is last_comp:
+                        continue
+                    if id(comp) not in var_components:
+                        raise KeyError(comp)
+                    new_vars.append((id(comp), v.index()))
+                    last_comp = comp
+            except Exception:
+                # Let the main process (re)generate any exceptions
+                ans.append(None)
+                continue
+            if (
+                expr_info.named_exprs
+                or subexpression_cache
+                or external_functions
+                or expr_info.const.__class__ not in native_numeric_types
+                or any(
+                    c.__class__ not in native_numeric_types
+                    for c in expr_info.linear.values()
+                )
+            ):
+                # Named expressions and external functions register
+                # shared state with the writer: defer to the main process
+                subexpression_cache.clear()
+                external_functions.clear()
+                ans.append(None)
+                continue
+            ans.append((lb, ub, expr_info, new_vars))
+        return ans
+
+    def _restore_compiled(self, info):
+        """Convert worker results back to (lb, ub, expr_info)"""
+        lb, ub, expr_info, new_vars = info
+        # Record the variables in the var_map in the same order that the
+        # walker would have encountered them
+        var_map = self.var_map
+        var_components = self.var_components
+        for comp_id, idx in new_vars:
+            v = var_components[comp_id][idx]
+            if id(v) not in var_map:
+                AMPLBeforeChildDispatcher._record_var(self.visitor, v)
+        return lb, ub, expr_info
+
     def _categorize_vars(self, comp_list, linear_by_comp):
         """Categorize compiled expression vars into linear and nonlinear
 
@@ -1974,16 +2679,17 @@ class _NLWriter_impl(object):
                 # constant as the second argument, so we will too.
                 nl = self.template.binary_sum + nl + self.template.const % repn.const
             try:
-                self.ostream.write(
-                    nl % tuple(map(self.var_id_to_nl_map.__getitem__, args))
-                )
+                nl = nl % tuple(map(self.var_id_to_nl_map.__getitem__, args))
             except KeyError:
-                self.ostream.write(self._resolve_subexpression_args(nl, args))
+                nl = self._resolve_subexpression_args(nl, args)
 
         elif include_const:
-            self.ostream.write(self.template.const % repn.const)
+            nl = self.template.const % repn.const
         else:
-            self.ostream.write(self.template.const % 0)
+            nl = self.template.const % 0
+        if self.binary:
+            nl = _nl_text_to_binary(nl)
+        self.ostream.write(nl)
 
     def _write_v_line(self, expr_id, k, scale_model, scaling_cache):
         ostream = self.ostream
@@ -2003,8 +2709,18 @@ class _NLWriter_impl(object):
             for _id in linear_ids:
                 linear[_id] /= scaling_cache[_id]
         #
-        ostream.write(f'V{self.next_V_line_id} {len(linear_ids)} {k}{lbl}\n')
-        for _id in sorted(linear_ids, key=column_order.__getitem__):
-            ostream.write(f'{column_order[_id]} {linear[_id]!s}\n')
+        if self.binary:
+            ostream.write(
+                b'V'
+                + _bin_int3(self.next_V_line_id, len(linear_ids), k)
+                + b''.join(
+                    _bin_pair(column_order[_id], linear[_id])
+                    for _id in sorted(linear_ids, key=column_order.__getitem__)
+                )
+            )
+        else:
+            ostream.write(f'V{self.next_V_line_id} {len(linear_ids)} {k}{lbl}\n')
+            for _id in sorted(linear_ids, key=column_order.__getitem__):
+                ostream.write(f'{column_order[_id]} {linear[_id]!s}\n')
         self._write_nl_expression(info[1], True)
         self.next_V_line_id += 1
@@ -22,6 +22,7 @@ from pyomo.common.config import (
 )
 from pyomo.common.dependencies import scipy, numpy as np
 from pyomo.common.enums import ObjectiveSense
+from pyomo.common.errors import InfeasibleConstraintException
 from pyomo.common.gc_manager import PauseGC
 from pyomo.common.numeric_types import native_types, value
 from pyomo.common.timing import TicTocTimer
@@ -45,6 +46,7 @@ from pyomo.repn.util import (
     FileDeterminism_to_SortComponents,
     TemplateVarRecorder,
     categorize_valid_components,
+    group_template_blocks,
     initialize_var_map_from_column_order,
     ordered_active_constraints,
 )
@@ -420,7 +422,29 @@ class _LinearStandardFormCompiler_impl(object):
         con_index = []
         con_index_ptr = [0]
         last_parent = None
-        for con in ordered_active_constraints(model, self.config):
+        constraints = ordered_active_constraints(model, self.config)
+        if not slack_form:
+            # Runs of templatized constraints are compiled in bulk
+            constraints = group_template_blocks(constraints)
+        for con in constraints:
+            if con.__class__ is list:
+                if with_debug_timing and con[0]._component is not last_parent:
+                    if last_parent is not None:
+                        timer.toc('Constraint %s', last_parent(), level=logging.DEBUG)
+                    last_parent = con[0]._component
+                con_nnz = self._compile_template_block(
+                    con,
+                    template_visitor,
+                    mixed_form,
+                    rows,
+                    rhs,
+                    con_data,
+                    con_index,
+                    con_index_ptr,
+                    con_nnz,
+                )
+                continue
+
             if with_debug_timing and con._component is not last_parent:
                 if last_parent is not None:
                     timer.toc('Constraint %s', last_parent(), level=logging.DEBUG)
@@ -462,7 +486,7 @@ class _LinearStandardFormCompiler_impl(object):
                 # TODO: add a (configurable) feasibility tolerance
                 if (lb is None or lb <= offset) and (ub is None or ub >= offset):
                     continue
-                raise InfeasibleError(
+                raise InfeasibleConstraintException(
                     f"model contains a trivially infeasible constraint, '{con.name}'"
                 )
 
@@ -616,9 +640,105 @@ class _LinearStandardFormCompiler_impl(object):
         timer.toc("Generated linear standard form representation", delta=False)
         return info
 
+    def _compile_template_block(
+        self,
+        cons,
+        template_visitor,
+        mixed_form,
+        rows,
+        rhs,
+        con_data,
+        con_index,
+        con_index_ptr,
+        con_nnz,
+    ):
+        """Compile a run of constraints that share a common template
+
+        The template is expanded for all constraints at once
+        (see :py:meth:`LinearTemplateRepnVisitor.expand_block`) and the
+        resulting rows are appended to `con_data` / `con_index` as
+        single NumPy arrays (as opposed to one iterable per row).
+
+        Returns the updated number of nonzeros.
+        """
+        offsets, index, data, index_ptr, lbs, ubs = template_visitor.expand_block(
+            cons, cons[0].template_expr()
+        )
+        n = len(cons)
+        if lbs is None:
+            lbs = [None] * n
+        if ubs is None:
+            ubs = [None] * n
+        index_ptr = np.array(index_ptr, dtype=np.int64)
+        nnz_by_con = index_ptr[1:] - index_ptr[:-1]
+
+        # Generate the row entries (and note which constraint / sign
+        # provides the coefficients for each row)
+        row_src = []
+        row_sign = []
+        for i, (con, N, offset, lb, ub) in enumerate(
+            zip(cons, nnz_by_con.tolist(), offsets, lbs, ubs)
+        ):
+            if lb is None and ub is None:
+                continue
+            if not N and offset.__class__ in native_types:
+                # This is a constant constraint
+                if (lb is None or lb <= offset) and (ub is None or ub >= offset):
+                    continue
+                raise InfeasibleConstraintException(
+                    f"model contains a trivially infeasible constraint, '{con.name}'"
+                )
+            if mixed_form:
+                if lb == ub:
+                    rows.append(RowEntry(con, 0))
+                    rhs.append(ub - offset)
+                    row_src.append(i)
+                    row_sign.append(1)
+                    continue
+                if ub is not None:
+                    rows.append(RowEntry(con, 1))
+                    rhs.append(ub - offset)
+                    row_src.append(i)
+                    row_sign.append(1)
+                if lb is not None:
+                    rows.append(RowEntry(con, -1))
+                    rhs.append(lb - offset)
+                    row_src.append(i)
+                    row_sign.append(1)
+            else:
+                if ub is not None:
+                    rows.append(RowEntry(con, 1))
+                    rhs.append(ub - offset)
+                    row_src.append(i)
+                    row_sign.append(1)
+                if lb is not None:
+                    rows.append(RowEntry(con, -1))
+                    rhs.append(offset - lb)
+                    row_src.append(i)
+                    row_sign.append(-1)
+        if not row_src:
+            return con_nnz
+
+        # Gather the nonzeros for each row from the flat (per-constraint)
+        # arrays.  Each row copies the slice of terms for its source
+        # constraint.
+        row_src = np.array(row_src, dtype=np.int64)
+        row_nnz = nnz_by_con[row_src]
+        row_end = np.cumsum(row_nnz)
+        total = int(row_end[-1])
+        gather = np.repeat(index_ptr[row_src] - (row_end - row_nnz), row_nnz)
+        gather += np.arange(total, dtype=np.int64)
+        data = self._to_vector(data, np.float64, len(data))[gather]
+        if -1 in row_sign:
+            data *= np.repeat(np.array(row_sign, dtype=np.float64), row_nnz)
+        con_data.append(data)
+        con_index.append(self._to_vector(index, np.int32, len(index))[gather])
+        con_index_ptr.extend((row_end + con_nnz).tolist())
+        return con_nnz + total
+
     def _create_csc(self, data, index, index_ptr, nnz, n_cols):
-        data = self._to_vector(itertools.chain.from_iterable(data), np.float64, nnz)
-        index = self._to_vector(itertools.chain.from_iterable(index), np.int32, nnz)
+        data = self._flatten_to_vector(data, np.float64, nnz)
+        index = self._flatten_to_vector(index, np.int32, nnz)
         index_ptr = np.array(index_ptr, dtype=np.int32)
 
         if not nnz:
@@ -638,6 +758,27 @@ class _LinearStandardFormCompiler_impl(object):
         A.eliminate_zeros()
         return A
 
+    def _flatten_to_vector(self, data, dtype, nnz):
+        # data is a list of iterables; contiguous runs of general
+        # iterables are chained together, and NumPy arrays (e.g., from
+        # bulk-compiled template blocks) are concatenated directly
+        if not any(d.__class__ is np.ndarray for d in data):
+            return self._to_vector(itertools.chain.from_iterable(data), dtype, nnz)
+        chunks = []
+        for is_array, group in itertools.groupby(
+            data, key=lambda d: d.__class__ is np.ndarray
+        ):
+            if is_array:
+                chunks.extend(group)
+            else:
+                chunks.append(
+                    self._to_vector(itertools.chain.from_iterable(group), dtype, -1)
+                )
+        ans = np.concatenate(chunks)
+        if ans.dtype != dtype and ans.dtype != object:
+            ans = ans.astype(dtype)
+        return ans
+
     def _csc_to_nonnegative_vars(self, c, A, columns):
         eliminated_vars = []
         new_columns = []
@@ -17,13 +17,16 @@ import logging
 import math
 import os
 import re
+import struct
+import sys
 
 import pyomo.repn.util as repn_util
 import pyomo.repn.plugins.nl_writer as nl_writer
+from pyomo.repn.ampl import nl_operators
 from pyomo.repn.util import InvalidNumber
 from pyomo.repn.tests.nl_diff import nl_diff
 
-from pyomo.common.dependencies import numpy, numpy_available
+from pyomo.common.dependencies import multiprocessing, numpy, numpy_available
 from pyomo.common.errors import MouseTrap
 from pyomo.common.gsl import find_GSL
 from pyomo.common.log import LoggingIntercept
@@ -2883,3 +2886,419 @@ k-1
                 OUT.getvalue(),
             )
         )
+
+    def test_incremental_write(self):
+        m = ConcreteModel()
+        m.p = Param(initialize=2, mutable=True)
+        m.x = Var(range(3), bounds=(0, 10))
+        m.y = Var(initialize=1)
+        m.e = Expression(expr=m.y**2)
+        m.obj = Objective(expr=m.p * m.x[0] + log(m.y))
+        m.c1 = Constraint(expr=m.x[0] + m.p * m.x[1] >= 1)
+        m.c2 = Constraint(expr=m.x[1] * m.x[2] + m.y <= 4)
+        m.c3 = Constraint(expr=m.e + m.x[2] == 3)
+
+        def check(writer):
+            OUT = io.StringIO()
+            writer.write(m, OUT, incremental=True, linear_presolve=False)
+            REF = io.StringIO()
+            nl_writer.NLWriter().write(m, REF, linear_presolve=False)
+            self.assertEqual(*nl_diff(REF.getvalue(), OUT.getvalue()))
+            return writer._fragment_cache
+
+        writer = nl_writer.NLWriter()
+        cache = check(writer)
+        self.assertEqual((cache.hits, cache.misses), (0, 4))
+        # c3 references a named Expression and is not cached
+        self.assertEqual(len(cache.fragments), 3)
+
+        # Nothing changed
+        cache = check(writer)
+        self.assertEqual((cache.hits, cache.misses), (3, 1))
+
+        # Changing a mutable Param invalidates the components that use it
+        m.p = 5
+        m.x[1].setub(5)
+        cache = check(writer)
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+
+        # Fixing a variable invalidates the components that use it
+        m.x[2].fix(1)
+        cache = check(writer)
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+        m.x[2].set_value(2)
+        cache = check(writer)
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+
+        # Replacing a constraint expression / deactivating components
+        m.c1.set_value(m.x[0] - m.x[1] >= 0)
+        m.c2.deactivate()
+        cache = check(writer)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+        self.assertEqual(len(cache.fragments), 2)
+
+    def test_incremental_write_cancelled_terms(self):
+        m = ConcreteModel()
+        m.p = Param(initialize=0, mutable=True)
+        m.x = Var(range(2), bounds=(0, 10))
+        m.y = Var(bounds=(0, 5))
+        m.z = Var(bounds=(0, 5))
+        m.obj = Objective(expr=m.x[0])
+        # y and x[1] are visited by the walker, but do not appear in
+        # the compiled repn
+        m.c1 = Constraint(expr=m.x[0] + m.y * m.p + m.p * (m.x[1] + m.y) >= 1)
+        m.c2 = Constraint(expr=m.z + 2 * m.y + m.x[1] <= 4)
+
+        REF = io.StringIO()
+        nl_writer.NLWriter().write(
+            m, REF, symbolic_solver_labels=True, linear_presolve=False
+        )
+        writer = nl_writer.NLWriter()
+        for i in range(2):
+            OUT = io.StringIO()
+            writer.write(
+                m,
+                OUT,
+                incremental=True,
+                symbolic_solver_labels=True,
+                linear_presolve=False,
+            )
+            self.assertEqual(*nl_diff(REF.getvalue(), OUT.getvalue()))
+        self.assertEqual(writer._fragment_cache.hits, 3)
+
+    def test_incremental_layout(self):
+        m = ConcreteModel()
+        m.p = Param(initialize=2, mutable=True)
+        m.x = Var(range(3), bounds=(0, 10), initialize=1)
+        m.obj = Objective(expr=m.x[0] ** 2 + 2 * m.x[1])
+        m.c1 = Constraint(expr=m.x[0] + 3 * m.x[1] >= m.p)
+        m.c2 = Constraint(expr=m.x[1] * m.x[2] + m.x[0] <= 4)
+        m.scaling_factor = pyo.Suffix(direction=pyo.Suffix.EXPORT)
+
+        writer = nl_writer.NLWriter()
+
+        def check(binary=False, **options):
+            OUT = io.BytesIO() if binary else io.StringIO()
+            writer.write(
+                m,
+                OUT,
+                incremental=True,
+                linear_presolve=False,
+                binary=binary,
+                **options,
+            )
+            REF = io.BytesIO() if binary else io.StringIO()
+            nl_writer.NLWriter().write(
+                m, REF, linear_presolve=False, binary=binary, **options
+            )
+            if binary:
+                self.assertEqual(REF.getvalue(), OUT.getvalue())
+            else:
+                self.assertEqual(*nl_diff(REF.getvalue(), OUT.getvalue()))
+            return writer._fragment_cache.layout
+
+        # The layout is only recorded once all expressions come from
+        # the fragment cache
+        self.assertIsNone(check())
+        layout = check()
+        self.assertIsNotNone(layout)
+
+        # Values and (constant) bounds do not change the structure
+        m.p = 3
+        m.x[2].setub(5)
+        m.x[1].set_value(4)
+        self.assertIs(check(), layout)
+
+        # Changing the variable domains changes the column order
+        m.x[1].domain = pyo.Integers
+        new_layout = check()
+        self.assertIsNot(new_layout, layout)
+        self.assertIs(check(), new_layout)
+
+        # ... as do the objective sense, the variable scaling factors,
+        # binary output, and deactivating components
+        m.obj.sense = pyo.maximize
+        layout = check()
+        self.assertIsNot(layout, new_layout)
+        self.assertIs(check(), layout)
+
+        m.scaling_factor[m.x[0]] = 2
+        new_layout = check(scale_model=True)
+        self.assertIsNot(new_layout, layout)
+        self.assertIs(check(scale_model=True), new_layout)
+
+        layout = check(binary=True)
+        self.assertIsNot(layout, new_layout)
+        self.assertIs(check(binary=True), layout)
+
+        m.c2.deactivate()
+        new_layout = check()
+        self.assertIsNot(new_layout, layout)
+        self.assertIs(check(), new_layout)
+
+        # Changing an expression invalidates the layout
+        m.c1.set_value(m.x[0] + m.x[2] >= m.p)
+        self.assertIsNone(check())
+
+    @unittest.skipUnless(
+        'fork' in multiprocessing.get_all_start_methods(),
+        "parallel compilation requires the 'fork' start method",
+    )
+    def test_parallel_write(self):
+        m = ConcreteModel()
+        m.I = pyo.RangeSet(40)
+        m.p = Param(m.I, initialize=lambda m, i: i % 7 + 1, mutable=True)
+        m.x = Var(m.I, bounds=(0, 10))
+        m.y = Var(m.I, domain=Binary)
+        m.b = pyo.Block()
+        m.b.z = Var()
+        m.e = Expression(expr=pyo.sin(m.b.z))
+        m.obj = Objective(expr=m.x[1])
+
+        @m.Constraint(m.I)
+        def c(m, i):
+            return m.p[i] * m.x[i] + 2 * m.y[i] + (m.b.z if i > 20 else 0) <= m.p[i]
+
+        @m.Constraint(m.I)
+        def d(m, i):
+            # Every 10th constraint references a named Expression
+            return m.x[i] * m.y[i] + pyo.exp(m.x[i]) + (m.e if i % 10 == 0 else 0) >= -i
+
+        m.x[3].fix(1)
+        m.scaling_factor = Suffix(direction=Suffix.EXPORT)
+        m.scaling_factor[m.c[4]] = 3
+
+        orig = repn_util.PARALLEL_MIN_CHUNK_SIZE
+        try:
+            repn_util.PARALLEL_MIN_CHUNK_SIZE = 10
+            for symbolic_solver_labels in (False, True):
+                for linear_presolve in (False, True):
+                    options = dict(
+                        symbolic_solver_labels=symbolic_solver_labels,
+                        linear_presolve=linear_presolve,
+                        scale_model=True,
+                    )
+                    REF = io.StringIO()
+                    nl_writer.NLWriter().write(m, REF, **options)
+                    OUT = io.StringIO()
+                    with LoggingIntercept() as LOG:
+                        nl_writer.NLWriter().write(m, OUT, processes=3, **options)
+                    self.assertEqual(LOG.getvalue(), "")
+                    self.assertEqual(REF.getvalue(), OUT.getvalue())
+        finally:
+            repn_util.PARALLEL_MIN_CHUNK_SIZE = orig
+
+    def _binary_format_model(self):
+        m = ConcreteModel()
+        m.I = pyo.RangeSet(4)
+        m.x = Var(m.I, bounds=(-1, 5), initialize=lambda m, i: i / 2)
+        m.y = Var(domain=Binary)
+        m.z = Var(bounds=(None, 10))
+        m.w = Var()
+        m.e = Expression(expr=m.x[1] * m.x[2] + 3 * m.x[1])
+        m.obj = Objective(
+            expr=sum(pyo.sin(m.x[i]) for i in m.I) + m.e + 2 * m.y, sense=pyo.maximize
+        )
+        m.c = Constraint(m.I, rule=lambda m, i: (0, m.x[i] ** 2 + m.e + m.z, 4 + i))
+        m.d = Constraint(expr=m.x[1] + 2 * m.x[2] - m.y == 1)
+        m.f = Constraint(expr=pyo.exp(m.e) + m.w >= 1.5)
+        m.g = Constraint(expr=m.z - m.w <= 0.25)
+        m.sos = Suffix(direction=Suffix.EXPORT, datatype=Suffix.INT)
+        m.sos[m.x[1]] = 1
+        m.sos[m.x[3]] = 2
+        m.priority = Suffix(direction=Suffix.EXPORT)
+        m.priority[m.c[2]] = 0.5
+        m.dual = Suffix(direction=Suffix.IMPORT_EXPORT)
+        m.dual[m.d] = 1.5
+        return m
+
+    def test_binary_format(self):
+        m = self._binary_format_model()
+
+        def tokenize(lines):
+            ans = []
+            for line in lines:
+                for token in line.split('\t#', 1)[0].split():
+                    try:
+                        if token[0].isalpha() and len(token) > 1:
+                            token = token[0], float(token[1:])
+                        else:
+                            token = float(token)
+                    except ValueError:
+                        pass
+                    ans.append(token)
+            return ans
+
+        def decode(data):
+            # Decode the binary NL file to the equivalent text lines
+            pos = 0
+            for i in range(10):
+                pos = data.index(b'\n', pos) + 1
+            lines = data[:pos].decode().splitlines()
+            n_vars, n_cons = map(int, lines[1].split()[:2])
+
+            def read(fmt):
+                nonlocal pos
+                ans = struct.unpack_from('=' + fmt, data, pos)
+                pos += struct.calcsize('=' + fmt)
+                return ans
+
+            def read_str():
+                (n,) = read('i')
+                return read(f'{n}s')[0].decode()
+
+            def read_pairs(n, fmt='id'):
+                lines.extend(f'{a} {b!r}' for a, b in (read(fmt) for i in range(n)))
+
+            def read_expr():
+                key = read('c')[0].decode()
+                if key == 'n':
+                    lines.append(f'n{read("d")[0]!r}')
+                elif key == 'v':
+                    lines.append(f'v{read("i")[0]}')
+                else:
+                    self.assertEqual(key, 'o')
+                    (op,) = read('i')
+                    lines.append(f'o{op}')
+                    nargs = nl_operators[op][0]
+                    if nargs is None:
+                        (nargs,) = read('i')
+                        lines.append(str(nargs))
+                    for i in range(nargs):
+                        read_expr()
+
+            while pos < len(data):
+                key = read('c')[0].decode()
+                if key == 'S':
+                    kind, n = read('ii')
+                    lines.append(f'S{kind} {n} {read_str()}')
+                    read_pairs(n, 'id' if kind & 4 else 'ii')
+                elif key == 'V':
+                    i, n, k = read('iii')
+                    lines.append(f'V{i} {n} {k}')
+                    read_pairs(n)
+                    read_expr()
+                elif key == 'C':
+                    lines.append(f'C{read("i")[0]}')
+                    read_expr()
+                elif key == 'O':
+                    lines.append('O%s %s' % read('ii'))
+                    read_expr()
+                elif key in 'dx':
+                    (n,) = read('i')
+                    lines.append(f'{key}{n}')
+                    read_pairs(n)
+                elif key in 'rb':
+                    lines.append(key)
+                    for i in range(n_cons if key == 'r' else n_vars):
+                        kind = read('c')[0].decode()
+                        nvals = {'0': 2, '1': 1, '2': 1, '3': 0, '4': 1}[kind]
+                        lines.append(
+                            ' '.join((kind,) + tuple(map(repr, read('d' * nvals))))
+                        )
+                elif key == 'k':
+                    (n,) = read('i')
+                    lines.append(f'k{n}')
+                    lines.extend(map(str, read(f'{n}i')))
+                else:
+                    self.assertIn(key, 'JG')
+                    i, n = read('ii')
+                    lines.append(f'{key}{i} {n}')
+                    read_pairs(n)
+            return lines
+
+        for symbolic_solver_labels in (False, True):
+            REF = io.StringIO()
+            nl_writer.NLWriter().write(
+                m, REF, symbolic_solver_labels=symbolic_solver_labels
+            )
+            OUT = io.BytesIO()
+            ROW = io.StringIO()
+            COL = io.StringIO()
+            nl_writer.NLWriter().write(
+                m,
+                OUT,
+                ROW,
+                COL,
+                binary=True,
+                symbolic_solver_labels=symbolic_solver_labels,
+            )
+            ref = REF.getvalue().splitlines()
+            out = decode(OUT.getvalue())
+            # The header is the same, except for the format and the
+            # arithmetic type
+            self.assertEqual(out[0][0], 'b')
+            self.assertEqual(out[0][1:], ref[0][1:])
+            self.assertEqual(
+                out[5].split()[2], '1' if sys.byteorder == 'little' else '2'
+            )
+            self.assertEqual(ref[5].split()[2], '0')
+            self.assertEqual(tokenize(out[1:5] + out[6:]), tokenize(ref[1:5] + ref[6:]))
+            self.assertIn('S0 2 sos', out)
+            self.assertIn('S5 1 priority', out)
+            self.assertIn('d1', out)
+            self.assertIn('o54', out)
+            self.assertTrue(any(line.startswith('V') for line in out))
+            if symbolic_solver_labels:
+                self.assertEqual(
+                    ROW.getvalue().split(),
+                    ['c[1]', 'c[2]', 'c[3]', 'c[4]', 'f', 'd', 'g', 'obj'],
+                )
+
+    @unittest.skipUnless(numpy_available, "PyNumero ASL interface requires numpy")
+    def test_binary_format_asl(self):
+        # Round-trip the text and binary NL files through the ASL (using
+        # the PyNumero interface) and verify that the ASL reads the same
+        # problem from both
+        from pyomo.contrib.pynumero.asl import AmplInterface
+
+        if not AmplInterface.available():
+            self.skipTest("PyNumero ASL interface (pynumero_ASL) is not available")
+
+        m = self._binary_format_model()
+        with TempfileManager.new_context() as tempfile:
+            txt_fname = tempfile.create_tempfile(suffix='.nl')
+            bin_fname = tempfile.create_tempfile(suffix='.nl')
+            with open(txt_fname, 'w') as OUT:
+                nl_writer.NLWriter().write(m, OUT)
+            with open(bin_fname, 'wb') as OUT:
+                nl_writer.NLWriter().write(m, OUT, binary=True)
+            with open(bin_fname, 'rb') as FILE:
+                self.assertEqual(FILE.read(1), b'b')
+            txt_asl = AmplInterface(txt_fname)
+            bin_asl = AmplInterface(bin_fname)
+
+            for attr in ('get_n_vars', 'get_n_constraints', 'get_nnz_jac_g'):
+                self.assertEqual(getattr(bin_asl, attr)(), getattr(txt_asl, attr)())
+            nx = txt_asl.get_n_vars()
+            ng = txt_asl.get_n_constraints()
+            nnz = txt_asl.get_nnz_jac_g()
+            for attr, n in (
+                ('get_x_lower_bounds', nx),
+                ('get_x_upper_bounds', nx),
+                ('get_g_lower_bounds', ng),
+                ('get_g_upper_bounds', ng),
+                ('get_init_x', nx),
+                ('get_init_multipliers', ng),
+            ):
+                ref = numpy.zeros(n)
+                out = numpy.zeros(n)
+                getattr(txt_asl, attr)(ref)
+                getattr(bin_asl, attr)(out)
+                self.assertEqual(list(out), list(ref), attr)
+
+            x = numpy.zeros(nx)
+            txt_asl.get_init_x(x)
+            for point in (x, x + 0.25):
+                self.assertEqual(bin_asl.eval_f(point), txt_asl.eval_f(point))
+                for fcn, n in (
+                    ('eval_deriv_f', nx),
+                    ('eval_g', ng),
+                    ('eval_jac_g', nnz),
+                ):
+                    ref = numpy.zeros(n)
+                    out = numpy.zeros(n)
+                    getattr(txt_asl, fcn)(point, ref)
+                    getattr(bin_asl, fcn)(point, out)
+                    self.assertEqual(list(out), list(ref), fcn)
+            del txt_asl, bin_asl
@@ -9,15 +9,21 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import copy
 from io import StringIO
 
 import pyomo.common.unittest as unittest
 
+from pyomo.common.dependencies import multiprocessing
 from pyomo.common.log import LoggingIntercept
 
 import pyomo.environ as pyo
 
-from pyomo.repn.plugins.lp_writer import LPWriter
+from pyomo.core.base import constraint
+import pyomo.repn.util as repn_util
+
+from pyomo.core.base.label import NumericLabeler
+from pyomo.repn.plugins.lp_writer import LPWriter, _LPSymbolMap
 
 
 def create_sos_model():
@@ -345,3 +351,274 @@ end
 """,
             OUT.getvalue(),
         )
+
+    def test_templatized_constraints(self):
+        def build_model():
+            m = pyo.ConcreteModel()
+            m.I = pyo.RangeSet(3)
+            m.x = pyo.Var(m.I, bounds=(0, 10))
+            m.y = pyo.Var()
+            m.z = pyo.Var(m.I, within=pyo.Binary)
+            m.p = pyo.Param(m.I, initialize={1: 1, 2: 2, 3: 3}, mutable=True)
+
+            @m.Constraint(m.I)
+            def c(m, i):
+                return pyo.inequality(-m.p[i], m.p[i] * m.x[i] - m.y, 5)
+
+            @m.Constraint(m.I)
+            def d(m, i):
+                return m.x[i] + 2 * m.y + m.z[i] == m.p[i]
+
+            @m.Constraint(m.I)
+            def e(m, i):
+                return m.z[i] <= m.p[i] + 1
+
+            m.c[2].deactivate()
+            m.z[2].fix(1)
+            m.o = pyo.Objective(expr=m.y)
+            return m
+
+        ref = build_model()
+        orig = constraint.TEMPLATIZE_CONSTRAINTS
+        try:
+            constraint.TEMPLATIZE_CONSTRAINTS = True
+            m = build_model()
+        finally:
+            constraint.TEMPLATIZE_CONSTRAINTS = orig
+        self.assertTrue(hasattr(m.d[1], 'template_expr'))
+
+        for symbolic in (False, True):
+            REF = StringIO()
+            LPWriter().write(ref, REF, symbolic_solver_labels=symbolic)
+            OUT = StringIO()
+            LPWriter().write(m, OUT, symbolic_solver_labels=symbolic)
+            self.assertEqual(REF.getvalue(), OUT.getvalue())
+        # The LP writer did not need to expand the templates
+        self.assertTrue(hasattr(m.d[1], 'template_expr'))
+
+        self.assertEqual(
+            OUT.getvalue(),
+            r"""\* Source Pyomo model name=unknown *\
+
+min 
+o:
++1 y
+
+s.t.
+
+r_l_c(1)_:
+-1 y
++1 x(1)
+>= -1
+
+r_u_c(1)_:
+-1 y
++1 x(1)
+<= 5
+
+r_l_c(3)_:
+-1 y
++3 x(3)
+>= -3
+
+r_u_c(3)_:
+-1 y
++3 x(3)
+<= 5
+
+c_e_d(1)_:
++2 y
++1 x(1)
++1 z(1)
+= 1
+
+c_e_d(2)_:
++2 y
++1 x(2)
+= 1
+
+c_e_d(3)_:
++2 y
++1 x(3)
++1 z(3)
+= 3
+
+c_u_e(1)_:
++1 z(1)
+<= 2
+
+c_u_e(2)_:
++0 ONE_VAR_CONSTANT
+<= 2
+
+c_u_e(3)_:
++1 z(3)
+<= 4
+
+bounds
+   1 <= ONE_VAR_CONSTANT <= 1
+   -inf <= y <= +inf
+   0 <= x(1) <= 10
+   0 <= x(2) <= 10
+   0 <= x(3) <= 10
+   0 <= z(1) <= 1
+   0 <= z(3) <= 1
+binary
+  z(1)
+  z(3)
+end
+""",
+        )
+
+    @unittest.skipUnless(
+        'fork' in multiprocessing.get_all_start_methods(),
+        "parallel compilation requires the 'fork' start method",
+    )
+    def test_parallel_write(self):
+        m = pyo.ConcreteModel()
+        m.I = pyo.RangeSet(40)
+        m.p = pyo.Param(m.I, initialize=lambda m, i: i % 7 + 1, mutable=True)
+        m.x = pyo.Var(m.I, bounds=(0, 10))
+        m.y = pyo.Var(m.I, domain=pyo.Binary)
+        m.b = pyo.Block()
+        m.b.z = pyo.Var()
+        m.o = pyo.Objective(expr=m.x[1])
+
+        @m.Constraint(m.I)
+        def c(m, i):
+            return m.p[i] * m.x[i] + 2 * m.y[i] + (m.b.z if i > 20 else 0) <= m.p[i]
+
+        @m.Constraint(m.I)
+        def d(m, i):
+            return m.x[i] * m.y[i] + m.x[i] ** 2 >= -i
+
+        m.x[3].fix(1)
+        m.d[5].deactivate()
+
+        orig = repn_util.PARALLEL_MIN_CHUNK_SIZE
+        try:
+            repn_util.PARALLEL_MIN_CHUNK_SIZE = 10
+            for symbolic in (False, True):
+                REF = StringIO()
+                LPWriter().write(m, REF, symbolic_solver_labels=symbolic)
+                OUT = StringIO()
+                with LoggingIntercept() as LOG:
+                    LPWriter().write(
+                        m, OUT, symbolic_solver_labels=symbolic, processes=3
+                    )
+                self.assertEqual(LOG.getvalue(), "")
+                self.assertEqual(REF.getvalue(), OUT.getvalue())
+        finally:
+            repn_util.PARALLEL_MIN_CHUNK_SIZE = orig
+
+    def test_symbol_map(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var()
+        m.y = pyo.Var([1, 2])
+        m.o = pyo.Objective(expr=m.x + m.y[2])
+        m.c = pyo.Constraint(expr=m.x + m.y[1] >= 1)
+        m.d = pyo.Constraint(expr=(0, m.y[2] - m.y[1], 5))
+
+        OUT = StringIO()
+        info = LPWriter().write(m, OUT)
+        self.assertEqual(
+            *map(
+                lambda x: x.replace(' ', ''),
+                (
+                    OUT.getvalue(),
+                    """\\* Source Pyomo model name=unknown *\\
+
+min 
+x1:
++1 x2
++1 x3
+
+s.t.
+
+c_l_x4_:
++1 x2
++1 x5
+>= 1
+
+r_l_x6_:
+-1 x5
++1 x3
+>= 0
+
+r_u_x6_:
+-1 x5
++1 x3
+<= 5
+
+bounds
+   -inf <= x2 <= +inf
+   -inf <= x5 <= +inf
+   -inf <= x3 <= +inf
+end
+""",
+                ),
+            )
+        )
+        smap = info.symbol_map
+        self.assertEqual(
+            smap.bySymbol,
+            {
+                'x1': m.o,
+                'x2': m.x,
+                'x3': m.y[2],
+                'c_l_x4_': m.c,
+                'x5': m.y[1],
+                'r_l_x6_': m.d,
+            },
+        )
+        self.assertEqual(list(smap.bySymbol), list(smap.byObject.values()))
+        self.assertEqual(smap.byObject, {id(v): k for k, v in smap.bySymbol.items()})
+        self.assertEqual(smap.aliases, {'__default_objective__': m.o, 'r_u_x6_': m.d})
+        self.assertIsInstance(smap, pyo.SymbolMap)
+        self.assertEqual(smap.getSymbol(m.c), 'c_l_x4_')
+        self.assertEqual(smap.getObject('r_u_x6_'), m.d)
+
+        # Once generated, the symbol map is updated like a SymbolMap
+        m.z = pyo.Var()
+        self.assertEqual(smap.getSymbol(m.z), 'x7')
+        self.assertIs(smap.bySymbol['x7'], m.z)
+        smap.alias(m.z, 'z')
+        self.assertIs(smap.getObject('z'), m.z)
+
+        # Copies of the symbol map are consistent with the copied objects
+        smap2 = copy.deepcopy(smap)
+        x = smap2.getObject('x2')
+        self.assertIsNot(x, m.x)
+        self.assertEqual(x.name, 'x')
+        self.assertEqual(smap2.getSymbol(x), 'x2')
+        self.assertEqual(len(smap2.byObject), len(smap.byObject))
+        self.assertEqual(smap2.aliases.keys(), smap.aliases.keys())
+
+        # The symbol map still rejects duplicate symbols and objects
+        with self.assertRaisesRegex(RuntimeError, 'duplicate symbol'):
+            smap.addSymbol(pyo.Var(), 'x2')
+        with self.assertRaisesRegex(RuntimeError, 'duplicate object'):
+            smap.addSymbol(m.x, 'x10')
+        with self.assertRaisesRegex(RuntimeError, "Duplicate symbol 'x3'"):
+            smap.getSymbol(pyo.Var(), lambda obj: 'x3')
+
+    def test_symbol_map_nonnumeric_symbols(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([1, 2, 3])
+        smap = _LPSymbolMap(NumericLabeler('x'))
+        # Symbols that do not fit (or collide with) the numeric labels
+        for i, symb in enumerate(('x', 'x1_0', 'c_l_x-1_', 'objective')):
+            smap.addSymbol(m.x[1] if not i else pyo.Var(), symb)
+        self.assertIn('x1_0', smap.bySymbol)
+        self.assertNotIn('x10', smap.bySymbol)
+        smap.addSymbol(m.x[2], 'x10')
+        self.assertIs(smap.getObject('x10'), m.x[2])
+        self.assertIs(smap.getObject('x'), m.x[1])
+        self.assertEqual(
+            list(smap.bySymbol), ['x1_0', 'x', 'c_l_x-1_', 'objective', 'x10']
+        )
+        self.assertEqual(len(smap.bySymbol), 5)
+        del smap.bySymbol['x10']
+        del smap.bySymbol['x']
+        self.assertEqual(list(smap.bySymbol), ['x1_0', 'c_l_x-1_', 'objective'])
+        self.assertEqual(len(smap.bySymbol), 3)
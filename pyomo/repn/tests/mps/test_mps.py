@@ -18,8 +18,13 @@ import random
 from filecmp import cmp
 import pyomo.common.unittest as unittest
 
+from pyomo.common.tempfiles import TempfileManager
+from pyomo.core.base import constraint
 from pyomo.environ import (
     ConcreteModel,
+    Param,
+    RangeSet,
+    inequality,
     Var,
     Objective,
     Constraint,
@@ -245,6 +250,61 @@ class TestMPSOrdering(unittest.TestCase):
 
         self._check_baseline(model, int_marker=True)
 
+    def test_templatized_constraints(self):
+        def build_model():
+            m = ConcreteModel()
+            m.I = RangeSet(3)
+            m.x = Var(m.I, bounds=(0, 10))
+            m.y = Var()
+            m.z = Var(m.I, within=Binary)
+            m.p = Param(m.I, initialize={1: 1, 2: 2, 3: 3}, mutable=True)
+
+            @m.Constraint(m.I)
+            def c(m, i):
+                return inequality(-m.p[i], m.p[i] * m.x[i] - m.y, 5)
+
+            @m.Constraint(m.I)
+            def d(m, i):
+                return m.x[i] + 2 * m.y + m.z[i] == m.p[i]
+
+            @m.Constraint(m.I)
+            def e(m, i):
+                return m.z[i] <= m.p[i] + 1
+
+            # Ranged constraints whose bounds are equal (but are not
+            # structurally equality constraints)
+            m.q = Param(m.I, initialize={1: 1, 2: 2, 3: 3}, mutable=True)
+
+            @m.Constraint(m.I)
+            def f(m, i):
+                return inequality(m.p[i], m.x[i] - m.y, m.q[i])
+
+            m.c[2].deactivate()
+            m.z[2].fix(1)
+            m.o = Objective(expr=m.y)
+            return m
+
+        ref = build_model()
+        orig = constraint.TEMPLATIZE_CONSTRAINTS
+        try:
+            constraint.TEMPLATIZE_CONSTRAINTS = True
+            m = build_model()
+        finally:
+            constraint.TEMPLATIZE_CONSTRAINTS = orig
+        self.assertTrue(hasattr(m.d[1], 'template_expr'))
+
+        with TempfileManager.new_context() as tempfile:
+            ref_fname = tempfile.create_tempfile(suffix='.mps')
+            fname = tempfile.create_tempfile(suffix='.mps')
+            for symbolic in (False, True):
+                io_options = {'symbolic_solver_labels': symbolic}
+                ref.write(ref_fname, format='mps', io_options=io_options)
+                m.write(fname, format='mps', io_options=io_options)
+                with open(ref_fname) as REF, open(fname) as OUT:
+                    self.assertEqual(REF.read(), OUT.read())
+        # The MPS writer did not need to expand the templates
+        self.assertTrue(hasattr(m.d[1], 'template_expr'))
+
 
 if __name__ == "__main__":
     unittest.main()
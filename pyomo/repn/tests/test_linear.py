@@ -15,6 +15,7 @@ from pyomo.common.log import LoggingIntercept
 from pyomo.common.dependencies import numpy, numpy_available
 
 from pyomo.core.expr.compare import assertExpressionsEqual
+from pyomo.core.expr.visitor import StreamBasedExpressionVisitor
 from pyomo.core.expr.numeric_expr import LinearExpression, MonomialTermExpression
 from pyomo.core.expr import Expr_if, inequality, LinearExpression, NPV_SumExpression
 import pyomo.repn.linear as linear
@@ -1780,3 +1781,43 @@ class TestLinear(unittest.TestCase):
             repn.linear, {id(m.x[0]): 1, id(m.x[1]): 2, id(m.x[2]): 3, id(m.x[3]): 4}
         )
         self.assertEqual(repn.nonlinear, None)
+
+    def test_shape_cache(self):
+        m = ConcreteModel()
+        m.x = Var(range(6))
+        m.p = Param(range(6), mutable=True, initialize=lambda m, i: i + 0.5)
+        m.e = Expression(range(6), rule=lambda m, i: m.x[i] ** 2)
+
+        exprs = [
+            m.p[i] * m.x[i] + 3 * (m.x[i] - m.x[(i + 1) % 6]) + cos(m.x[i])
+            for i in range(6)
+        ]
+        # Different shapes with the same root type
+        exprs.append(m.x[0] + m.x[1] * m.x[2])
+        exprs.append(m.x[0] + 2 * (m.x[1] - m.x[2]) + cos(m.p[3]))
+        # Named expressions are descended into on first encounter
+        exprs.extend(m.x[i] + m.e[i] for i in range(6))
+        exprs.extend(m.x[i] + m.e[i] for i in range(6))
+        m.p[2] = 0
+
+        cfg = VisitorConfig()
+        visitor = LinearRepnVisitor(**cfg)
+        ref_cfg = VisitorConfig()
+        ref_visitor = LinearRepnVisitor(**ref_cfg)
+        for e in exprs:
+            repn = visitor.walk_expression(e)
+            ref = StreamBasedExpressionVisitor.walk_expression(ref_visitor, e)
+            self.assertEqual(str(repn), str(ref))
+        self.assertEqual(list(cfg.var_map), list(ref_cfg.var_map))
+        self.assertEqual(list(cfg.subexpr), list(ref_cfg.subexpr))
+
+        # The first 6 expressions share a shape (5 hits).  The next 2
+        # miss (triggering a recompile), as do the next 2.  The
+        # remaining 10 expressions match that shape (including the 4
+        # where the named expression is not yet cached).
+        program, hits, misses, compiles = visitor.shape_cache.programs[
+            exprs[0].__class__
+        ]
+        self.assertIsNotNone(program)
+        self.assertEqual(hits, 15)
+        self.assertEqual(compiles, 3)
@@ -116,6 +116,93 @@ class TestLinearStandardFormCompiler(unittest.TestCase):
         self.assertEqual(repn.rows, [(m.c, -1), (m.d, 1)])
         self.assertEqual(repn.columns, [m.x, m.y[1]])
 
+    def test_indexed_linear_model(self):
+        m = pyo.ConcreteModel()
+        m.I = pyo.RangeSet(3)
+        m.p = pyo.Param(m.I, initialize={1: 1, 2: 2, 3: 3})
+        m.x = pyo.Var(m.I)
+        m.y = pyo.Var()
+
+        @m.Constraint(m.I)
+        def c(m, i):
+            return pyo.inequality(-m.p[i], m.p[i] * m.x[i] - m.y, 5)
+
+        @m.Constraint(m.I)
+        def d(m, i):
+            return m.x[i] + 2 * m.y == m.p[i]
+
+        m.c[2].deactivate()
+
+        repn = LinearStandardFormCompiler().write(m)
+
+        self.assertTrue(
+            np.all(
+                repn.A
+                == np.array(
+                    [
+                        [1, 0, 0, -1],
+                        [-1, 0, 0, 1],
+                        [0, 0, 3, -1],
+                        [0, 0, -3, 1],
+                        [1, 0, 0, 2],
+                        [-1, 0, 0, -2],
+                        [0, 1, 0, 2],
+                        [0, -1, 0, -2],
+                        [0, 0, 1, 2],
+                        [0, 0, -1, -2],
+                    ]
+                )
+            )
+        )
+        self.assertTrue(np.all(repn.rhs == np.array([5, 1, 5, 3, 1, -1, 2, -2, 3, -3])))
+        self.assertEqual(
+            repn.rows,
+            [
+                (m.c[1], 1),
+                (m.c[1], -1),
+                (m.c[3], 1),
+                (m.c[3], -1),
+                (m.d[1], 1),
+                (m.d[1], -1),
+                (m.d[2], 1),
+                (m.d[2], -1),
+                (m.d[3], 1),
+                (m.d[3], -1),
+            ],
+        )
+        self.assertEqual(repn.columns, [m.x[1], m.x[2], m.x[3], m.y])
+
+        repn = LinearStandardFormCompiler().write(m, mixed_form=True)
+        self.assertTrue(
+            np.all(
+                repn.A
+                == np.array(
+                    [
+                        [1, 0, 0, -1],
+                        [1, 0, 0, -1],
+                        [0, 0, 3, -1],
+                        [0, 0, 3, -1],
+                        [1, 0, 0, 2],
+                        [0, 1, 0, 2],
+                        [0, 0, 1, 2],
+                    ]
+                )
+            )
+        )
+        self.assertTrue(np.all(repn.rhs == np.array([5, -1, 5, -3, 1, 2, 3])))
+        self.assertEqual(
+            repn.rows,
+            [
+                (m.c[1], 1),
+                (m.c[1], -1),
+                (m.c[3], 1),
+                (m.c[3], -1),
+                (m.d[1], 0),
+                (m.d[2], 0),
+                (m.d[3], 0),
+            ],
+        )
+
     def test_suffix_warning(self):
         m = pyo.ConcreteModel()
         m.x = pyo.Var()
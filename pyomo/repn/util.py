@@ -14,10 +14,13 @@ import functools
 import itertools
 import logging
 import operator
+import os
 import sys
+import threading
 
 from pyomo.common import enums
 from pyomo.common.collections import Sequence, ComponentMap, ComponentSet
+from pyomo.common.dependencies import multiprocessing
 from pyomo.common.deprecation import deprecation_warning
 from pyomo.common.errors import DeveloperError, InvalidValueError
 from pyomo.common.numeric_types import (
@@ -62,6 +65,9 @@ _named_subexpression_types = (
 )
 
 HALT_ON_EVALUATION_ERROR = False
+# The minimum number of constraints that parallel_chunk_map() will
+# send to a worker process in a single task
+PARALLEL_MIN_CHUNK_SIZE = 1000
 nan = float('nan')
 int_float = {int, float}
 
@@ -788,6 +794,131 @@ def ordered_active_constraints(model, config):
     return sorted(constraints, key=lambda x: _row_getter(id(x), _n))
 
 
+def parallel_chunk_map(fcn, data, processes):
+    """Apply `fcn` to consecutive chunks of `data` in forked processes
+
+    This partitions the sequence `data` into consecutive chunks and
+    calls ``fcn(data[start:end])`` for each chunk in a pool of worker
+    processes.  Results are returned in order.  This is intended for
+    compiling model expressions in parallel: the workers are started
+    with ``fork()``, so they inherit (a copy of) the model along with
+    `fcn` and `data` without pickling them, and ``id()`` values for
+    objects that existed when the pool was created are the same in the
+    parent and in the workers.  Only the chunk results are pickled.
+
+    If parallel processing is not worthwhile (fewer than two processes
+    or too little data) or not possible (``fork`` is not available, or
+    the parent process is multithreaded), this returns None and the
+    caller is expected to fall back on serial processing.
+
+    Parameters
+    ----------
+    fcn: Callable
+        Function that is called (in a worker process) with a slice of
+        `data` and returns a picklable result
+
+    data: Sequence
+        The data to process
+
+    processes: int
+        The number of worker processes (0 uses all available CPUs)
+
+    Returns
+    -------
+    Iterator[Tuple[int, int, Any]] or None
+        ``(start, end, fcn(data[start:end]))`` for each chunk (in order)
+
+    """
+    if not processes:
+        processes = os.cpu_count() or 1
+    n = len(data)
+    if processes < 2 or n <= PARALLEL_MIN_CHUNK_SIZE:
+        return None
+    if (
+        os.name == 'nt'
+        or 'fork' not in multiprocessing.get_all_start_methods()
+        or threading.active_count() > 1
+    ):
+        logger.warning(
+            "Parallel expression compilation requires the 'fork' process "
+            "start method and a single-threaded parent process.  "
+            "Compiling expressions serially."
+        )
+        return None
+    # Several chunks per process to help balance the load
+    chunk_size = max(PARALLEL_MIN_CHUNK_SIZE, -(-n // (4 * processes)))
+    chunks = [(i, min(i + chunk_size, n)) for i in range(0, n, chunk_size)]
+    return _parallel_chunk_map_impl(fcn, data, chunks, min(processes, len(chunks)))
+
+
+def collect_chunk_results(data, results, result_map):
+    """Yield the items in `data`, collecting :py:func:`parallel_chunk_map` results
+
+    Each chunk of items is yielded only after the results for that
+    chunk have been received; results that are not None are stored in
+    `result_map` (keyed by ``id(item)``).  This allows the caller to
+    consume the results as it iterates over the original data.
+
+    """
+    for start, end, chunk_results in results:
+        chunk = data[start:end]
+        for item, ans in zip(chunk, chunk_results):
+            if ans is not None:
+                result_map[id(item)] = ans
+        yield from chunk
+
+
+# The task for the current parallel_chunk_map() pool.  This is set in
+# the parent before the pool is created and is inherited by the
+# forked worker processes.
+_parallel_task = None
+
+
+def _run_parallel_task(chunk):
+    fcn, data = _parallel_task
+    start, end = chunk
+    return start, end, fcn(data[start:end])
+
+
+def _parallel_chunk_map_impl(fcn, data, chunks, processes):
+    global _parallel_task
+    _parallel_task = fcn, data
+    try:
+        with multiprocessing.get_context('fork').Pool(processes) as pool:
+            # Clear the task in the parent as soon as the workers have
+            # been forked
+            _parallel_task = None
+            yield from pool.imap(_run_parallel_task, chunks)
+    finally:
+        _parallel_task = None
+
+
+def group_template_blocks(constraints):
+    """Group consecutive templatized constraints that share a template
+
+    Yields either a (non-template) ConstraintData or a list of
+    templatized ConstraintData objects that all share the same template.
+
+    """
+    block = []
+    block_template = None
+    for con in constraints:
+        if hasattr(con, 'template_expr'):
+            template = con.template_expr()
+            if block and template is not block_template:
+                yield block
+                block = []
+            block.append(con)
+            block_template = template
+            continue
+        if block:
+            yield block
+            block = []
+        yield con
+    if block:
+        yield block
+
+
 class VarRecorder(object):
     def __init__(self, var_map, sorter):
         self.var_map = var_map
@@ -861,7 +992,7 @@ class TemplateVarRecorder(object):
                     for idx, vdata in var_comp.items():
                         vid = id(vdata)
                         if vid not in var_map:
-                            var_map[vid] = v
+                            var_map[vid] = vdata
                             ve[idx] = next_i
                             next_i += 1
                 ve[v.index()] = i
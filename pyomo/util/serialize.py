@@ -0,0 +1,1179 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""Binary serialization of constructed (concrete) Pyomo models
+
+This module provides :func:`save_model` and :func:`load_model`, which
+store a constructed model in a compact binary file and rebuild it.
+Unlike :mod:`pickle`, which goes through the generic
+``__getstate__`` / ``__setstate__`` on every component, component data
+and expression node, the binary format stores:
+
+  - the component hierarchy (names, types, index sets, and the
+    declaration order) in a small JSON header,
+  - the component keys and numeric data (values, bounds, flags) in
+    typed numpy arrays, and
+  - all expressions as a single DAG (shared subexpressions are stored
+    once) encoded in integer arrays.
+
+The arrays can be memory-mapped when loading (``mmap=True``), so only
+the pages that are actually needed are read from disk.  Component
+names and indices are preserved exactly, so :class:`ComponentUID`
+objects generated on the original model resolve to the corresponding
+objects on the loaded model.
+
+The format stores the *constructed state* of the model: construction
+rules, non-component block attributes, and other Python-level state
+are not saved.  Only the following component types are supported:
+Block, Set, RangeSet, Param, Var, Constraint, Objective, and
+Expression (including VarList and ConstraintList).  Saving a model that
+contains any other component type (or expression nodes that cannot be
+represented, like external functions or units) raises a
+:class:`ValueError`.
+
+"""
+
+import json
+import math
+import mmap as _mmap
+import struct
+
+from pyomo.common.dependencies import numpy as np
+from pyomo.common.gc_manager import PauseGC
+from pyomo.common.numeric_types import (
+    native_integer_types,
+    native_numeric_types,
+    native_types,
+)
+from pyomo.core.base.block import Block
+from pyomo.core.base.constraint import Constraint, ConstraintList
+from pyomo.core.base.expression import Expression
+from pyomo.core.base.global_set import GlobalSets
+from pyomo.core.base.objective import Objective, ObjectiveSense
+from pyomo.core.base.param import Param, ParamData, _ImplicitAny
+from pyomo.core.base.PyomoModel import ConcreteModel
+from pyomo.core.base.range import NumericRange
+from pyomo.core.base.set import RangeSet, Set, SetProduct, SortedSetData, sorted_robust
+from pyomo.core.base.var import Var, VarList
+import pyomo.core.expr as EXPR
+
+_MAGIC = b'PYOMOBIN'
+_VERSION = 1
+_ALIGN = 64
+
+# Expression DAG leaf types
+_LEAF_INT = 0
+_LEAF_FLOAT = 1
+_LEAF_DATA = 2
+# Integers outside the int64 range (stored as decimal strings)
+_LEAF_BIGINT = 3
+
+# Markers in the writer's (expression node class -> op) map
+_LEAF = -1
+_NEEDS_EXTRA = -2
+
+# Placeholder reference for missing expressions (e.g., Var bounds that
+# are not expressions)
+_NO_EXPR = 2**62
+
+# Tags for "mixed" columns of scalar values
+_TAG_INT = 0
+_TAG_FLOAT = 1
+_TAG_STR = 2
+_TAG_NONE = 3
+_TAG_BOOL = 4
+_TAG_NOVALUE = 5
+_TAG_BIGINT = 6
+
+_pack_double = struct.Struct('<d').pack
+_unpack_int64 = struct.Struct('<q').unpack
+
+
+def _build_sum(cls):
+    return lambda args, extra: cls(args)
+
+
+def _build_tuple(cls):
+    return lambda args, extra: cls(tuple(args))
+
+
+def _build_unary(cls):
+    return lambda args, extra: cls(tuple(args), extra, getattr(math, extra))
+
+
+def _build_strict(cls):
+    return lambda args, extra: cls(tuple(args), extra)
+
+
+def _build_ranged(cls):
+    return lambda args, extra: cls(tuple(args), tuple(extra))
+
+
+_expression_builders = {}
+for _cls in (
+    EXPR.NegationExpression,
+    EXPR.NPV_NegationExpression,
+    EXPR.PowExpression,
+    EXPR.NPV_PowExpression,
+    EXPR.MaxExpression,
+    EXPR.NPV_MaxExpression,
+    EXPR.MinExpression,
+    EXPR.NPV_MinExpression,
+    EXPR.ProductExpression,
+    EXPR.NPV_ProductExpression,
+    EXPR.MonomialTermExpression,
+    EXPR.DivisionExpression,
+    EXPR.NPV_DivisionExpression,
+    EXPR.Expr_ifExpression,
+    EXPR.NPV_Expr_ifExpression,
+    EXPR.AbsExpression,
+    EXPR.NPV_AbsExpression,
+    EXPR.EqualityExpression,
+):
+    _expression_builders[_cls.__name__] = _build_tuple(_cls)
+for _cls in (EXPR.SumExpression, EXPR.LinearExpression, EXPR.NPV_SumExpression):
+    _expression_builders[_cls.__name__] = _build_sum(_cls)
+for _cls in (EXPR.UnaryFunctionExpression, EXPR.NPV_UnaryFunctionExpression):
+    _expression_builders[_cls.__name__] = _build_unary(_cls)
+_expression_builders[EXPR.InequalityExpression.__name__] = _build_strict(
+    EXPR.InequalityExpression
+)
+_expression_builders[EXPR.RangedExpression.__name__] = _build_ranged(
+    EXPR.RangedExpression
+)
+_expression_classes = {
+    getattr(EXPR, name): name for name in _expression_builders if hasattr(EXPR, name)
+}
+# Expression types whose op needs additional (non-argument) data
+_expression_extras = {
+    EXPR.UnaryFunctionExpression: lambda node: node.getname(),
+    EXPR.NPV_UnaryFunctionExpression: lambda node: node.getname(),
+    EXPR.InequalityExpression: lambda node: bool(node.strict),
+    EXPR.RangedExpression: lambda node: [bool(s) for s in node.strict],
+}
+
+
+def _index_array(values):
+    """Return an array of ints using the smallest (32- or 64-bit) dtype"""
+    values = np.asarray(values, dtype=np.int64)
+    if not values.size or (values.min() >= -(2**31) and values.max() < 2**31):
+        return values.astype(np.int32)
+    return values
+
+
+# The (non-Set) component classes that can be saved
+_supported_components = {
+    Block: ('ScalarBlock', 'IndexedBlock'),
+    Var: ('ScalarVar', 'IndexedVar', 'VarList'),
+    Param: ('ScalarParam', 'IndexedParam'),
+    Constraint: ('ScalarConstraint', 'IndexedConstraint', 'ConstraintList'),
+    Objective: ('ScalarObjective', 'IndexedObjective'),
+    Expression: ('ScalarExpression', 'IndexedExpression'),
+}
+
+
+def _is_global_set(s):
+    return GlobalSets.get(getattr(s, 'local_name', None), None) is s
+
+
+def save_model(model, filename):
+    """Save a constructed model to a binary file
+
+    Parameters
+    ----------
+    model : BlockData
+        The (constructed) model or block to save
+
+    filename : str
+        The name of the file to write
+
+    """
+    with PauseGC():
+        _ModelWriter(model).write(filename)
+
+
+def load_model(filename, mmap=False):
+    """Load a model saved by :func:`save_model`
+
+    Parameters
+    ----------
+    filename : str
+        The name of the file to read
+
+    mmap : bool
+        If True, memory-map the file instead of reading it into memory
+
+    Returns
+    -------
+    ConcreteModel
+
+    """
+    with open(filename, 'rb') as FILE:
+        if mmap:
+            buf = _mmap.mmap(FILE.fileno(), 0, access=_mmap.ACCESS_READ)
+        else:
+            buf = FILE.read()
+    try:
+        # Loading creates many (long-lived) objects: pause the garbage
+        # collector
+        with PauseGC():
+            return _ModelReader(buf).read()
+    finally:
+        if mmap:
+            buf.close()
+
+
+class _ModelWriter(object):
+    def __init__(self, model):
+        self.model = model
+        self.components = []
+        self.arrays = {}
+        # id(component) -> component id (index into self.components)
+        self.cids = {}
+        # id(ComponentData) -> (component id, position)
+        self.data_refs = {}
+        self.strings = {}
+        self.ops = {}
+        self.op_table = []
+        # expression node class -> op id (or _NEEDS_EXTRA / _LEAF)
+        self.op_codes = {}
+        # id(node) -> node reference (see _ref())
+        self.refs = {}
+        self.const_refs = {}
+        self.consts = []
+        self.leaf_kind = []
+        self.leaf_a = []
+        self.leaf_b = []
+        self.node_op = []
+        self.node_nargs = []
+        self.node_args = []
+        # The encoded operator nodes (this keeps expressions generated
+        # on the fly alive so that their id()s are not reused)
+        self.operators = []
+        # (component id, field, [expressions]) to encode once all
+        # component data have been registered
+        self.deferred = []
+
+    def write(self, filename):
+        model = self.model
+        self.components.append(
+            {'name': model.name, 'ctype': 'Model', 'doc': model.doc, 'keys': None}
+        )
+        self.cids[id(model)] = 0
+        self._add_block_data(model, (0, 0))
+
+        # Now that all the component data are known, encode the
+        # expressions
+        expr_refs = [
+            (
+                'c%d.%s' % (cid, field),
+                [_NO_EXPR if e is None else self._ref(e) for e in exprs],
+            )
+            for cid, field, exprs in self.deferred
+        ]
+        # Note: the node table is only complete once all the
+        # expressions are encoded
+        for name, refs in expr_refs:
+            self.arrays[name] = self._ref_array(refs)
+        self.arrays['leaves.kind'] = np.array(self.leaf_kind, dtype=np.int8)
+        self.arrays['leaves.a'] = np.array(self.leaf_a, dtype=np.int64)
+        self.arrays['leaves.b'] = _index_array(self.leaf_b)
+        self.arrays['nodes.op'] = _index_array(self.node_op)
+        self.arrays['nodes.nargs'] = _index_array(self.node_nargs)
+        self.arrays['nodes.args'] = self._ref_array(self.node_args)
+        self.arrays['nodes.consts'] = np.array(self.consts, dtype=np.float64)
+        strings = [s.encode('utf-8') for s in self.strings]
+        self.arrays['strings.data'] = np.frombuffer(b''.join(strings), dtype=np.uint8)
+        self.arrays['strings.offsets'] = np.cumsum(
+            [0] + [len(s) for s in strings], dtype=np.int64
+        )
+
+        offset = 0
+        array_info = {}
+        for name, arr in self.arrays.items():
+            arr = self.arrays[name] = np.ascontiguousarray(arr)
+            array_info[name] = [arr.dtype.str, list(arr.shape), offset]
+            offset += -(-arr.nbytes // _ALIGN) * _ALIGN
+        header = json.dumps(
+            {
+                'version': _VERSION,
+                'components': self.components,
+                'ops': self.op_table,
+                'arrays': array_info,
+            }
+        ).encode('utf-8')
+        start = 8 + 12 + len(header)
+        pad = -start % _ALIGN
+        with open(filename, 'wb') as FILE:
+            FILE.write(_MAGIC)
+            FILE.write(struct.pack('<IQ', _VERSION, len(header) + pad))
+            FILE.write(header)
+            FILE.write(b' ' * pad)
+            for arr in self.arrays.values():
+                FILE.write(arr.data)
+                FILE.write(b'\0' * (-arr.nbytes % _ALIGN))
+
+    #
+    # Components
+    #
+
+    def _add_block_data(self, blk, parent):
+        for comp in blk.component_map().values():
+            self._add_component(comp, parent)
+
+    def _add_component(self, comp, parent):
+        if comp.is_reference():
+            raise ValueError(
+                "Cannot save component '%s': References are not supported "
+                "by the binary model format" % (comp.name,)
+            )
+        cid = len(self.components)
+        info = {
+            'name': comp.local_name,
+            'parent': list(parent),
+            'doc': comp.doc,
+            'active': comp.active if hasattr(comp, 'active') else True,
+        }
+        self.components.append(info)
+        self.cids[id(comp)] = cid
+        ctype = comp.ctype
+        if ctype is Set:
+            return self._add_set(cid, info, comp)
+        elif ctype is RangeSet:
+            info['ctype'] = 'RangeSet'
+            info['index'] = info['keys'] = None
+            info['ranges'] = self._ranges(comp)
+            return
+
+        if comp.__class__.__name__ not in _supported_components.get(ctype, ()):
+            raise ValueError(
+                "Cannot save component '%s': components of type %s are not "
+                "supported by the binary model format"
+                % (comp.name, comp.__class__.__name__)
+            )
+        if comp.is_indexed():
+            info['index'] = self._set_desc(comp.index_set(), 'c%d.index' % cid)
+        else:
+            info['index'] = None
+        # Note: we preserve the order of the component _data dict
+        keys = list(comp._data)
+
+        if ctype is Block:
+            info['ctype'] = 'Block'
+            datas = [comp._data[k] for k in keys]
+            self._add_keys(cid, info, keys)
+            self._add_data(cid, datas)
+            self.arrays['c%d.active' % cid] = np.array(
+                [b.active for b in datas], dtype=bool
+            )
+            for pos, blk in enumerate(datas):
+                self._add_block_data(blk, (cid, pos))
+        elif ctype is Var:
+            self._add_var(cid, info, comp, keys)
+        elif ctype is Param:
+            self._add_param(cid, info, comp)
+        elif ctype is Constraint:
+            info['ctype'] = 'Constraint'
+            info['list'] = isinstance(comp, ConstraintList)
+            datas = [comp._data[k] for k in keys]
+            self._add_keys(cid, info, keys)
+            self.arrays['c%d.active' % cid] = np.array(
+                [c.active for c in datas], dtype=bool
+            )
+            self.deferred.append((cid, 'expr', [c.expr for c in datas]))
+        elif ctype is Objective:
+            info['ctype'] = 'Objective'
+            datas = [comp._data[k] for k in keys]
+            self._add_keys(cid, info, keys)
+            self.arrays['c%d.active' % cid] = np.array(
+                [o.active for o in datas], dtype=bool
+            )
+            self.arrays['c%d.sense' % cid] = np.array(
+                [int(o.sense) for o in datas], dtype=np.int8
+            )
+            self.deferred.append((cid, 'expr', [o.expr for o in datas]))
+        else:
+            info['ctype'] = 'Expression'
+            datas = [comp._data[k] for k in keys]
+            self._add_keys(cid, info, keys)
+            self._add_data(cid, datas)
+            self.deferred.append((cid, 'expr', [e.expr for e in datas]))
+
+    def _add_data(self, cid, datas):
+        refs = self.data_refs
+        for pos, data in enumerate(datas):
+            refs[id(data)] = (cid, pos)
+
+    def _add_keys(self, cid, info, keys):
+        # Note: scalar components store None; an empty list of keys
+        # indicates a scalar component with no data (e.g., a skipped
+        # Constraint)
+        if keys == [None]:
+            info['keys'] = None
+        else:
+            info['keys'] = self._encode_keys('c%d.keys' % cid, keys)
+
+    def _add_set(self, cid, info, comp):
+        info['ctype'] = 'Set'
+        if comp.is_indexed():
+            info['index'] = self._set_desc(comp.index_set(), 'c%d.index' % cid)
+            keys = list(comp._data)
+            datas = [comp._data[k] for k in keys]
+            info['keys'] = self._encode_keys('c%d.keys' % cid, keys)
+        else:
+            info['index'] = None
+            info['keys'] = None
+            datas = [comp]
+        members = []
+        offsets = [0]
+        for s in datas:
+            if not s.isfinite():
+                raise ValueError(
+                    "Cannot save component '%s': non-finite Sets are not "
+                    "supported by the binary model format" % (comp.name,)
+                )
+            members.extend(s)
+            offsets.append(len(members))
+        sample = datas[0] if datas else comp
+        if not sample.isordered():
+            info['ordered'] = 'unordered'
+        elif isinstance(sample, SortedSetData) and comp._sort_fcn is sorted_robust:
+            info['ordered'] = 'sorted'
+        else:
+            # Note: Sets with a custom sort function are stored in
+            # their current order
+            info['ordered'] = 'insertion'
+        dimen = sample.dimen
+        info['dimen'] = dimen if dimen.__class__ is int or dimen is None else None
+        info['members'] = self._encode_keys('c%d.members' % cid, members)
+        self.arrays['c%d.offsets' % cid] = np.array(offsets, dtype=np.int64)
+
+    def _add_var(self, cid, info, comp, keys):
+        info['ctype'] = 'Var'
+        info['list'] = isinstance(comp, VarList)
+        # Dense Vars (with every VarData in index order) can be rebuilt
+        # through the (faster) dense construction
+        info['dense'] = (
+            comp.is_indexed()
+            and not info['list']
+            and comp.index_set().isfinite()
+            and len(keys) == len(comp.index_set())
+            and keys == list(comp.index_set())
+        )
+        if comp._units is not None:
+            raise ValueError(
+                "Cannot save component '%s': units are not supported by "
+                "the binary model format" % (comp.name,)
+            )
+        datas = [comp._data[k] for k in keys]
+        self._add_keys(cid, info, keys)
+        self._add_data(cid, datas)
+        prefix = 'c%d.' % cid
+        info['value'] = self._encode_column(prefix + 'value', [v._value for v in datas])
+        self.arrays[prefix + 'fixed'] = np.array([v._fixed for v in datas], dtype=bool)
+        self.arrays[prefix + 'stale'] = np.array([v.stale for v in datas], dtype=bool)
+        for bound in ('lb', 'ub'):
+            vals = [getattr(v, '_' + bound) for v in datas]
+            native = [
+                val if val is None or val.__class__ in (int, float) else None
+                for val in vals
+            ]
+            info[bound] = self._encode_column(prefix + bound, native)
+            if any(
+                val is not None and val.__class__ not in (int, float) for val in vals
+            ):
+                # Bounds can be (fixed) expressions, e.g., mutable Params
+                self.deferred.append(
+                    (
+                        cid,
+                        bound + '_expr',
+                        [
+                            val if val.__class__ not in (int, float) else None
+                            for val in vals
+                        ],
+                    )
+                )
+                info[bound + '_expr'] = True
+        domains = {}
+        domain_idx = [
+            domains.setdefault(id(v._domain), (len(domains), v._domain))[0]
+            for v in datas
+        ]
+        info['domains'] = [
+            self._set_desc(dom, prefix + 'domain%d' % i)
+            for i, dom in sorted(domains.values(), key=lambda x: x[0])
+        ]
+        if len(domains) > 1:
+            self.arrays[prefix + 'domain'] = np.array(domain_idx, dtype=np.int32)
+
+    def _add_param(self, cid, info, comp):
+        info['ctype'] = 'Param'
+        info['mutable'] = comp.mutable
+        if comp._units is not None:
+            raise ValueError(
+                "Cannot save component '%s': units are not supported by "
+                "the binary model format" % (comp.name,)
+            )
+        keys = list(comp._data)
+        if not comp.is_indexed():
+            # Expressions can reference a ScalarParam even if it does
+            # not have a value
+            self._add_data(cid, [comp])
+            vals = [comp._value] if keys else []
+        elif comp.mutable:
+            datas = list(comp._data.values())
+            vals = [d._value for d in datas]
+            self._add_data(cid, datas)
+        else:
+            vals = list(comp._data.values())
+        self._add_keys(cid, info, keys)
+        info['values'] = self._encode_column('c%d.values' % cid, vals)
+        default = comp._default_val
+        if default is Param.NoValue:
+            info['default'] = None
+        else:
+            info['default'] = self._encode_column('c%d.default' % cid, [default])
+        if comp.domain.__class__ is _ImplicitAny:
+            info['domain'] = None
+        else:
+            info['domain'] = self._set_desc(comp.domain, 'c%d.domain' % cid)
+
+    #
+    # Sets and keys
+    #
+
+    def _ranges(self, s):
+        ans = []
+        for r in s.ranges():
+            if r.__class__ is not NumericRange:
+                raise ValueError(
+                    "Cannot save Set '%s': only numeric ranges are supported "
+                    "by the binary model format" % (s.name,)
+                )
+            ans.append([r.start, r.end, r.step, list(r.closed)])
+        return ans
+
+    def _set_desc(self, s, prefix):
+        if _is_global_set(s):
+            return {'global': s.local_name}
+        if id(s) in self.cids:
+            return {'set': self.cids[id(s)]}
+        if isinstance(s, SetProduct):
+            factors = list(s.subsets(False))
+            return {
+                'product': [
+                    self._set_desc(f, '%s.%d' % (prefix, i))
+                    for i, f in enumerate(factors)
+                ]
+            }
+        if isinstance(s, RangeSet):
+            return {'ranges': self._ranges(s)}
+        if s.isfinite():
+            return {
+                'members': self._encode_keys(prefix, list(s)),
+                'ordered': s.isordered(),
+            }
+        raise ValueError(
+            "Cannot save Set '%s': it is not a model component, a global "
+            "Set, or a finite Set" % (s.name,)
+        )
+
+    def _encode_keys(self, prefix, keys):
+        lengths = [len(k) if k.__class__ is tuple else 1 for k in keys]
+        if not keys:
+            return {'dimen': 1, 'cols': [self._encode_column(prefix + '0', [])]}
+        if any(k.__class__ is tuple for k in keys):
+            dimen = lengths[0] if all(n == lengths[0] for n in lengths) else None
+        else:
+            dimen = 1
+        if dimen == 1:
+            return {'dimen': 1, 'cols': [self._encode_column(prefix + '0', keys)]}
+        if dimen is not None:
+            return {
+                'dimen': dimen,
+                'cols': [
+                    self._encode_column('%s%d' % (prefix, i), list(col))
+                    for i, col in enumerate(zip(*keys))
+                ],
+            }
+        # Keys of varying dimension: store the flattened keys and lengths
+        flat = []
+        for k in keys:
+            if k.__class__ is tuple:
+                flat.extend(k)
+            else:
+                flat.append(k)
+        self.arrays[prefix + '.len'] = np.array(lengths, dtype=np.int32)
+        return {'dimen': None, 'cols': [self._encode_column(prefix + '0', flat)]}
+
+    def _string_id(self, val):
+        return self.strings.setdefault(val, len(self.strings))
+
+    def _encode_column(self, name, values):
+        types = set(map(type, values))
+        if types.issubset((int,)):
+            try:
+                self.arrays[name] = _index_array(values)
+                return {'type': 'int', 'array': name}
+            except OverflowError:
+                pass
+        elif types.issubset((float,)):
+            self.arrays[name] = np.array(values, dtype=np.float64)
+            return {'type': 'float', 'array': name}
+        elif types.issubset((float, type(None))) and all(v == v for v in values):
+            # Floats and None (e.g., Var values or bounds): store None as NaN
+            self.arrays[name] = np.array(values, dtype=np.float64)
+            return {'type': 'float_or_none', 'array': name}
+        elif types.issubset((str,)):
+            self.arrays[name] = _index_array([self._string_id(v) for v in values])
+            return {'type': 'str', 'array': name}
+        # Mixed types: store a type tag and an int64 payload
+        tags = []
+        payload = []
+        for v in values:
+            if v.__class__ is bool:
+                tags.append(_TAG_BOOL)
+                payload.append(int(v))
+            elif v is None:
+                tags.append(_TAG_NONE)
+                payload.append(0)
+            elif v is Param.NoValue:
+                tags.append(_TAG_NOVALUE)
+                payload.append(0)
+            elif v.__class__ is str:
+                tags.append(_TAG_STR)
+                payload.append(self._string_id(v))
+            elif v.__class__ in native_integer_types:
+                if -(2**63) <= v < 2**63:
+                    tags.append(_TAG_INT)
+                    payload.append(int(v))
+                else:
+                    # Store integers that do not fit in int64 as
+                    # (decimal) strings so that they are not truncated
+                    tags.append(_TAG_BIGINT)
+                    payload.append(self._string_id(str(int(v))))
+            elif v.__class__ in native_numeric_types:
+                tags.append(_TAG_FLOAT)
+                payload.append(_unpack_int64(_pack_double(float(v)))[0])
+            else:
+                raise ValueError(
+                    "Cannot save value '%s' (type %s): only int, float, str, "
+                    "bool, and None values are supported by the binary model "
+                    "format" % (v, type(v).__name__)
+                )
+        self.arrays[name + '.tag'] = np.array(tags, dtype=np.int8)
+        self.arrays[name] = np.array(payload, dtype=np.int64)
+        return {'type': 'mixed', 'array': name}
+
+    #
+    # Expressions
+    #
+
+    def _ref_array(self, refs):
+        """Map node references onto the node table (leaves first)"""
+        refs = np.array(refs, dtype=np.int64)
+        ans = np.where(refs < 0, -1 - refs, refs + len(self.leaf_kind))
+        ans[refs == _NO_EXPR] = -1
+        return _index_array(ans)
+
+    def _op(self, name, extra):
+        key = (name, extra if extra.__class__ is not list else tuple(extra))
+        try:
+            return self.ops[key]
+        except KeyError:
+            ans = self.ops[key] = len(self.op_table)
+            self.op_table.append([name, extra])
+            return ans
+
+    def _op_code(self, node):
+        cls = node.__class__
+        if cls in _expression_classes:
+            if cls in _expression_extras:
+                ans = _NEEDS_EXTRA
+            else:
+                ans = self._op(_expression_classes[cls], None)
+        elif node.is_expression_type() and not node.is_named_expression_type():
+            raise ValueError(
+                "Cannot save expression node '%s' (type %s): it is not "
+                "supported by the binary model format" % (node, cls.__name__)
+            )
+        else:
+            ans = _LEAF
+        self.op_codes[cls] = ans
+        return ans
+
+    def _add_leaf(self, kind, a, b):
+        self.leaf_kind.append(kind)
+        self.leaf_a.append(a)
+        self.leaf_b.append(b)
+        return -len(self.leaf_kind)
+
+    def _const(self, val):
+        """Return the reference to a native numeric constant"""
+        # Note: the class is part of the key so that 1 and 1.0 (and
+        # 0.0 and -0.0) are not merged
+        key = (val.__class__, val, math.copysign(1, val) if val == 0 else 0)
+        ans = self.const_refs.get(key, None)
+        if ans is not None:
+            return ans
+        if val.__class__ not in native_numeric_types:
+            raise ValueError(
+                "Cannot save expression constant '%s' (type %s): only numeric "
+                "constants are supported by the binary model format"
+                % (val, type(val).__name__)
+            )
+        if val.__class__ in native_integer_types:
+            if -(2**63) <= val < 2**63:
+                ans = self._add_leaf(_LEAF_INT, int(val), 0)
+            else:
+                ans = self._add_leaf(_LEAF_BIGINT, self._string_id(str(int(val))), 0)
+        else:
+            self.consts.append(float(val))
+            ans = self._add_leaf(_LEAF_FLOAT, len(self.consts) - 1, 0)
+        self.const_refs[key] = ans
+        return ans
+
+    def _data_ref(self, node):
+        """Return the reference to a component data (leaf) node"""
+        ref = self.data_refs.get(id(node), None)
+        if ref is None:
+            raise ValueError(
+                "Cannot save expression: it references '%s' (type %s), which "
+                "is not a component of the saved model" % (node, type(node).__name__)
+            )
+        ans = self.refs[id(node)] = self._add_leaf(_LEAF_DATA, ref[0], ref[1])
+        return ans
+
+    def _ref(self, expr):
+        """Return the reference to an expression, encoding it if necessary
+
+        References to operator nodes are nonnegative (the node id);
+        references to leaves (constants and component data) are
+        negative (``-1 - leaf id``).
+
+        """
+        if expr.__class__ in native_types:
+            return self._const(expr)
+        refs = self.refs
+        ans = refs.get(id(expr), None)
+        if ans is not None:
+            return ans
+        op_codes = self.op_codes
+        code = op_codes.get(expr.__class__, None)
+        if code is None:
+            code = self._op_code(expr)
+        if code is _LEAF:
+            return self._data_ref(expr)
+        node_args = self.node_args
+        # Iterative post-order traversal (expressions can be deep)
+        stack = [expr]
+        while stack:
+            node = stack[-1]
+            if id(node) in refs:
+                # This node was pushed more than once
+                stack.pop()
+                continue
+            args = node.args
+            pending = False
+            for arg in args:
+                cls = arg.__class__
+                if cls in native_types or id(arg) in refs:
+                    continue
+                code = op_codes.get(cls, None)
+                if code is None:
+                    code = self._op_code(arg)
+                if code is _LEAF:
+                    self._data_ref(arg)
+                else:
+                    stack.append(arg)
+                    pending = True
+            if pending:
+                continue
+            stack.pop()
+            for arg in args:
+                if arg.__class__ in native_types:
+                    node_args.append(self._const(arg))
+                else:
+                    node_args.append(refs[id(arg)])
+            code = op_codes[node.__class__]
+            if code is _NEEDS_EXTRA:
+                code = self._op(
+                    _expression_classes[node.__class__],
+                    _expression_extras[node.__class__](node),
+                )
+            refs[id(node)] = len(self.node_op)
+            self.node_op.append(code)
+            self.node_nargs.append(len(args))
+            self.operators.append(node)
+        return refs[id(expr)]
+
+
+class _ModelReader(object):
+    def __init__(self, buf):
+        if bytes(buf[:8]) != _MAGIC:
+            raise ValueError("File is not a Pyomo binary model")
+        version, header_len = struct.unpack('<IQ', buf[8:20])
+        if version != _VERSION:
+            raise ValueError(
+                "Unsupported Pyomo binary model version (%s); expected %s"
+                % (version, _VERSION)
+            )
+        self.buf = buf
+        self.header = json.loads(bytes(buf[20 : 20 + header_len]).decode('utf-8'))
+        self.data_start = 20 + header_len
+        self.comps = []
+        self.datas = []
+        self.strings = None
+        self.deferred = []
+
+    def array(self, name):
+        dtype, shape, offset = self.header['arrays'][name]
+        dtype = np.dtype(dtype)
+        count = 1
+        for n in shape:
+            count *= n
+        return np.frombuffer(
+            self.buf, dtype=dtype, count=count, offset=self.data_start + offset
+        ).reshape(shape)
+
+    def read(self):
+        data = bytes(self.array('strings.data'))
+        offsets = self.array('strings.offsets').tolist()
+        self.strings = [
+            data[offsets[i] : offsets[i + 1]].decode('utf-8')
+            for i in range(len(offsets) - 1)
+        ]
+        components = self.header['components']
+        root = components[0]
+        model = ConcreteModel(name=root['name'])
+        model.doc = root['doc']
+        self.comps.append(model)
+        self.datas.append([model])
+        for cid, info in enumerate(components[1:], 1):
+            self._build_component(cid, info)
+        nodes = self._build_nodes()
+        for cid, field, keys in self.deferred:
+            ids = self.array('c%d.%s' % (cid, field)).tolist()
+            exprs = [None if i < 0 else nodes[i] for i in ids]
+            self._set_expressions(cid, field, keys, exprs)
+        return model
+
+    #
+    # Columns and keys
+    #
+
+    def _column(self, desc):
+        vals = self.array(desc['array'])
+        if desc['type'] in ('int', 'float'):
+            return vals.tolist()
+        if desc['type'] == 'float_or_none':
+            return [None if v != v else v for v in vals.tolist()]
+        if desc['type'] == 'str':
+            strings = self.strings
+            return [strings[i] for i in vals.tolist()]
+        tags = self.array(desc['array'] + '.tag').tolist()
+        ints = vals.tolist()
+        floats = vals.view(np.float64).tolist()
+        strings = self.strings
+        ans = []
+        for tag, i, f in zip(tags, ints, floats):
+            if tag == _TAG_INT:
+                ans.append(i)
+            elif tag == _TAG_FLOAT:
+                ans.append(f)
+            elif tag == _TAG_STR:
+                ans.append(strings[i])
+            elif tag == _TAG_BOOL:
+                ans.append(bool(i))
+            elif tag == _TAG_NOVALUE:
+                ans.append(Param.NoValue)
+            elif tag == _TAG_BIGINT:
+                ans.append(int(strings[i]))
+            else:
+                ans.append(None)
+        return ans
+
+    def _keys(self, desc):
+        if desc is None:
+            return [None]
+        cols = [self._column(c) for c in desc['cols']]
+        dimen = desc['dimen']
+        if dimen == 1:
+            return cols[0]
+        if dimen is not None:
+            return list(zip(*cols))
+        flat = cols[0]
+        lengths = self.array(desc['cols'][0]['array'][:-1] + '.len').tolist()
+        ans = []
+        i = 0
+        for n in lengths:
+            ans.append(flat[i] if n == 1 else tuple(flat[i : i + n]))
+            i += n
+        return ans
+
+    def _set(self, desc):
+        if 'global' in desc:
+            return GlobalSets[desc['global']]
+        if 'set' in desc:
+            return self.comps[desc['set']]
+        if 'ranges' in desc:
+            return RangeSet(ranges=self._ranges(desc['ranges']))
+        if 'product' in desc:
+            return SetProduct(*[self._set(d) for d in desc['product']])
+        return Set(
+            initialize=self._keys(desc['members']),
+            ordered=Set.InsertionOrder if desc['ordered'] else False,
+        )
+
+    def _index(self, desc):
+        """Return the positional (index) arguments for a component"""
+        if desc is None:
+            return ()
+        if 'product' in desc:
+            return tuple(self._set(d) for d in desc['product'])
+        return (self._set(desc),)
+
+    def _ranges(self, ranges):
+        return tuple(
+            NumericRange(start, end, step, tuple(closed))
+            for start, end, step, closed in ranges
+        )
+
+    #
+    # Components
+    #
+
+    def _build_component(self, cid, info):
+        ctype = info['ctype']
+        parent_cid, pos = info['parent']
+        block = self.datas[parent_cid][pos]
+        index = self._index(info['index'])
+        keys = self._keys(info['keys'])
+        kwds = {'doc': info['doc']}
+        if ctype == 'Set':
+            comp = self._build_set(cid, info, index, keys, kwds)
+        elif ctype == 'RangeSet':
+            comp = RangeSet(ranges=self._ranges(info['ranges']), **kwds)
+        elif ctype == 'Block':
+            comp = Block(*index, dense=False, **kwds)
+        elif ctype == 'Var':
+            comp = self._build_var(info, index, kwds)
+        elif ctype == 'Param':
+            comp = self._build_param(info, index, keys, kwds)
+        elif ctype == 'Constraint':
+            if info['list']:
+                comp = ConstraintList(**kwds)
+            else:
+                comp = Constraint(*index, **kwds)
+        elif ctype == 'Objective':
+            comp = Objective(*index, **kwds)
+        elif ctype == 'Expression':
+            comp = Expression(*index, **kwds)
+        else:
+            raise ValueError("Unknown component type '%s' in binary model" % (ctype,))
+        block.add_component(info['name'], comp)
+        self.comps.append(comp)
+
+        if ctype == 'Block':
+            datas = [comp[k] for k in keys]
+            self._set_active(cid, datas)
+        elif ctype == 'Var':
+            datas = self._load_var(cid, info, comp, keys)
+        elif ctype == 'Param':
+            datas = self._load_param(info, comp, keys)
+        elif ctype == 'Expression':
+            # Create the (empty) ExpressionData now, as they can be
+            # referenced by other expressions
+            if comp.is_indexed():
+                # Note: the keys were validated when the model was saved
+                datas = [comp._setitem_when_not_present(k, None) for k in keys]
+            else:
+                if keys:
+                    comp.set_value(None)
+                datas = [comp[k] for k in keys]
+            self.deferred.append((cid, 'expr', keys))
+        elif ctype in ('Constraint', 'Objective'):
+            # The component data are created once all the expressions
+            # have been rebuilt
+            datas = None
+            self.deferred.append((cid, 'expr', keys))
+        else:
+            datas = [comp]
+        self.datas.append(datas)
+        if not info['active']:
+            comp.deactivate()
+
+    def _set_active(self, cid, datas):
+        active = self.array('c%d.active' % cid).tolist()
+        for data, flag in zip(datas, active):
+            if not flag:
+                data.deactivate()
+
+    def _build_set(self, cid, info, index, keys, kwds):
+        members = self._keys(info['members'])
+        kwds['ordered'] = {
+            'insertion': Set.InsertionOrder,
+            'sorted': Set.SortedOrder,
+            'unordered': False,
+        }[info['ordered']]
+        kwds['dimen'] = info['dimen']
+        if not index:
+            return Set(initialize=members, **kwds)
+        offsets = self.array('c%d.offsets' % cid).tolist()
+        return Set(
+            *index,
+            initialize={
+                k: members[offsets[i] : offsets[i + 1]] for i, k in enumerate(keys)
+            },
+            **kwds,
+        )
+
+    def _build_var(self, info, index, kwds):
+        domains = [self._set(d) for d in info['domains']]
+        if len(domains) == 1:
+            kwds['domain'] = domains[0]
+        if info['list']:
+            return VarList(**kwds)
+        if index:
+            kwds['dense'] = info['dense']
+        return Var(*index, **kwds)
+
+    def _load_var(self, cid, info, comp, keys):
+        if info['list']:
+            for _ in keys:
+                comp.add()
+        elif comp.is_indexed() and not info['dense']:
+            for k in keys:
+                comp._getitem_when_not_present(k)
+        if comp.is_indexed():
+            datas = list(comp._data.values())
+        else:
+            datas = [comp[k] for k in keys]
+        prefix = 'c%d.' % cid
+        values = self._column(info['value'])
+        lbs = self._column(info['lb'])
+        ubs = self._column(info['ub'])
+        fixed = self.array(prefix + 'fixed').tolist()
+        stale = self.array(prefix + 'stale').tolist()
+        for v, val, lb, ub, fx, st in zip(datas, values, lbs, ubs, fixed, stale):
+            v._value = val
+            v._lb = lb
+            v._ub = ub
+            v._fixed = fx
+            v.stale = st
+        if len(info['domains']) > 1:
+            domains = [self._set(d) for d in info['domains']]
+            for v, i in zip(datas, self.array(prefix + 'domain').tolist()):
+                v._domain = domains[i]
+        for bound in ('lb', 'ub'):
+            if info.get(bound + '_expr', False):
+                self.deferred.append((cid, bound + '_expr', None))
+        return datas
+
+    def _build_param(self, info, index, keys, kwds):
+        kwds['mutable'] = info['mutable']
+        if info['default'] is not None:
+            kwds['default'] = self._column(info['default'])[0]
+        if info['domain'] is not None:
+            kwds['within'] = self._set(info['domain'])
+        if not index:
+            values = self._column(info['values'])
+            if values:
+                kwds['initialize'] = values[0]
+        # Note: the data for indexed Params are loaded directly into
+        # the (constructed) component by _load_param()
+        return Param(*index, **kwds)
+
+    def _load_param(self, info, comp, keys):
+        if not comp.is_indexed():
+            return [comp]
+        # Note: the values were validated when the model was saved
+        values = self._column(info['values'])
+        _data = comp._data
+        if not comp.mutable:
+            NoValue = Param.NoValue
+            _data.update((k, v) for k, v in zip(keys, values) if v is not NoValue)
+            return None
+        datas = []
+        for k, v in zip(keys, values):
+            obj = _data[k] = ParamData(comp)
+            obj._value = v
+            obj._index = k
+            datas.append(obj)
+        return datas
+
+    def _set_expressions(self, cid, field, keys, exprs):
+        comp = self.comps[cid]
+        if field != 'expr':
+            # Var bounds
+            for v, e in zip(self.datas[cid], exprs):
+                if e is not None:
+                    setattr(v, field[:2], e)
+            return
+        ctype = self.header['components'][cid]['ctype']
+        if comp.__class__ is ConstraintList:
+            datas = [comp.add(e) for e in exprs]
+        elif ctype == 'Expression':
+            datas = self.datas[cid]
+            for data, e in zip(datas, exprs):
+                data.set_value(e)
+        elif comp.is_indexed():
+            # Note: the keys were validated when the model was saved
+            datas = [comp._setitem_when_not_present(k, e) for k, e in zip(keys, exprs)]
+        else:
+            if keys:
+                comp.set_value(exprs[0])
+            datas = [comp[k] for k in keys]
+        self.datas[cid] = datas
+        if ctype in ('Constraint', 'Objective'):
+            self._set_active(cid, datas)
+        if ctype == 'Objective':
+            for o, s in zip(datas, self.array('c%d.sense' % cid).tolist()):
+                o.set_sense(ObjectiveSense(s))
+
+    def _build_nodes(self):
+        ops = self.header['ops']
+        builders = []
+        extras = []
+        for name, extra in ops:
+            if name not in _expression_builders:
+                raise ValueError(
+                    "Unknown expression type '%s' in binary model" % (name,)
+                )
+            builders.append(_expression_builders[name])
+            extras.append(extra)
+        consts = self.array('nodes.consts').tolist()
+        datas = self.datas
+        # The leaves come first in the node table
+        nodes = []
+        _append = nodes.append
+        for kind, a, b in zip(
+            self.array('leaves.kind').tolist(),
+            self.array('leaves.a').tolist(),
+            self.array('leaves.b').tolist(),
+        ):
+            if kind == _LEAF_DATA:
+                _append(datas[a][b])
+            elif kind == _LEAF_INT:
+                _append(a)
+            elif kind == _LEAF_BIGINT:
+                _append(int(self.strings[a]))
+            else:
+                _append(consts[a])
+        node_args = self.array('nodes.args').tolist()
+        start = 0
+        for op, n in zip(
+            self.array('nodes.op').tolist(), self.array('nodes.nargs').tolist()
+        ):
+            end = start + n
+            _append(builders[op]([nodes[i] for i in node_args[start:end]], extras[op]))
+            start = end
+        return nodes
@@ -0,0 +1,256 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+from io import StringIO
+
+import pyomo.common.unittest as unittest
+
+from pyomo.common.dependencies import numpy_available
+from pyomo.common.tempfiles import TempfileManager
+from pyomo.core.base.componentuid import ComponentUID
+from pyomo.environ import (
+    Binary,
+    Block,
+    ConcreteModel,
+    Constraint,
+    ConstraintList,
+    Expression,
+    ExternalFunction,
+    Integers,
+    NonNegativeReals,
+    Objective,
+    Param,
+    RangeSet,
+    Reals,
+    Set,
+    Suffix,
+    Var,
+    VarList,
+    exp,
+    log,
+    maximize,
+    value,
+)
+from pyomo.util.serialize import save_model, load_model
+
+
+def _pprint(m):
+    OUT = StringIO()
+    m.pprint(ostream=OUT)
+    return OUT.getvalue()
+
+
+@unittest.skipUnless(numpy_available, "numpy is not available")
+class TestSerialize(unittest.TestCase):
+    def setUp(self):
+        TempfileManager.push()
+
+    def tearDown(self):
+        TempfileManager.pop(remove=True)
+
+    def round_trip(self, m, mmap=False):
+        fname = TempfileManager.create_tempfile(suffix='.pbin')
+        save_model(m, fname)
+        return load_model(fname, mmap=mmap)
+
+    def build_model(self):
+        m = ConcreteModel(name='test')
+        m.I = Set(initialize=[3, 1, 2])
+        m.J = Set(initialize=['b', 'a'], ordered=Set.SortedOrder)
+        m.K = Set(initialize=[(1, 'a'), (2, 'b')], dimen=2)
+        m.U = Set(initialize=[5, 4], ordered=False)
+        m.R = RangeSet(2, 10, 2)
+        m.S = Set(m.I, initialize={1: [1.5, 'x'], 2: [], 3: [(1, 2)]}, dimen=None)
+        m.p = Param(initialize=2.5)
+        m.q = Param(m.I, initialize={1: 10, 3: 30}, mutable=True)
+        m.r = Param(m.J, initialize={'a': 'alpha', 'b': None}, default=1)
+        m.s = Param(m.I * m.J, initialize=lambda m, i, j: i * len(j), within=Integers)
+        m.x = Var(m.I, bounds=(0, 5), initialize=1)
+        m.x[2].fix(3)
+        m.y = Var(m.K, domain=Binary, dense=False)
+        m.y[1, 'a']
+        m.z = Var(bounds=(m.q[1], None))
+        m.w = VarList(domain=NonNegativeReals)
+        m.w.add()
+        m.w.add().setub(4)
+        m.w[2].domain = Reals
+        m.e = Expression(m.I, rule=lambda m, i: m.q[i] * m.x[i] ** 2)
+        m.c = Constraint(m.I, rule=lambda m, i: (0, m.e[i] + m.y[1, 'a'], i))
+        m.d = Constraint(expr=exp(m.z) + log(m.x[1]) >= 1)
+        m.c_skip = Constraint(m.I, rule=lambda m, i: Constraint.Skip)
+        m.cl = ConstraintList()
+        m.cl.add(m.w[1] + 2 * m.w[2] == m.e[2])
+        m.cl.add(m.w[1] / m.z <= m.p)
+        m.cl[1].deactivate()
+        m.o = Objective(expr=sum(m.e.values()) - m.z, sense=maximize)
+        m.b = Block(m.J)
+        m.b['a'].v = Var(initialize=7)
+        m.b['a'].c = Constraint(expr=m.b['a'].v <= m.x[3])
+        m.b['b'].deactivate()
+        return m
+
+    def test_round_trip(self):
+        m = self.build_model()
+        for mmap in (False, True):
+            m2 = self.round_trip(m, mmap)
+            self.assertIsNot(m2, m)
+            self.assertEqual(m2.name, 'test')
+            self.assertEqual(_pprint(m2), _pprint(m))
+            self.assertEqual(
+                [c.local_name for c in m2.component_objects(descend_into=True)],
+                [c.local_name for c in m.component_objects(descend_into=True)],
+            )
+
+    def test_sets(self):
+        m2 = self.round_trip(self.build_model())
+        self.assertEqual(list(m2.I), [3, 1, 2])
+        self.assertTrue(m2.I.isordered())
+        self.assertEqual(list(m2.J), ['a', 'b'])
+        m2.J.add('0')
+        self.assertEqual(list(m2.J), ['0', 'a', 'b'])
+        self.assertFalse(m2.U.isordered())
+        self.assertEqual(set(m2.U), {4, 5})
+        self.assertEqual(list(m2.K), [(1, 'a'), (2, 'b')])
+        self.assertEqual(list(m2.R), [2, 4, 6, 8, 10])
+        self.assertEqual(list(m2.S[1]), [1.5, 'x'])
+        self.assertEqual(list(m2.S[2]), [])
+        self.assertEqual(list(m2.S[3]), [(1, 2)])
+        self.assertIs(m2.x.index_set(), m2.I)
+        self.assertIs(m2.y.index_set(), m2.K)
+
+    def test_params(self):
+        m2 = self.round_trip(self.build_model())
+        self.assertEqual(m2.p.value, 2.5)
+        self.assertTrue(m2.q.mutable)
+        self.assertEqual(m2.q[1].value, 10)
+        self.assertEqual(m2.q[3].value, 30)
+        self.assertEqual(m2.r['a'], 'alpha')
+        self.assertIsNone(m2.r['b'])
+        self.assertEqual(m2.s[3, 'b'], 3)
+        self.assertIs(m2.s.domain, Integers)
+        m2.q[1] = 4
+        self.assertEqual(value(m2.z.lb), 4)
+
+    def test_vars(self):
+        m2 = self.round_trip(self.build_model())
+        self.assertEqual([v.value for v in m2.x.values()], [1, 1, 3])
+        self.assertEqual(m2.x[1].bounds, (0, 5))
+        self.assertTrue(m2.x[2].fixed)
+        self.assertFalse(m2.x[1].fixed)
+        self.assertEqual(list(m2.y), [(1, 'a')])
+        self.assertIs(m2.y[1, 'a'].domain, Binary)
+        self.assertEqual(len(m2.w), 2)
+        self.assertIs(m2.w[1].domain, NonNegativeReals)
+        self.assertIs(m2.w[2].domain, Reals)
+        self.assertEqual(m2.w[2].ub, 4)
+
+    def test_expressions(self):
+        m = self.build_model()
+        m2 = self.round_trip(m)
+        for c, c2 in zip(
+            m.component_data_objects((Constraint, Objective, Expression)),
+            m2.component_data_objects((Constraint, Objective, Expression)),
+        ):
+            self.assertEqual(str(c2.expr), str(c.expr))
+        # The expressions reference the loaded components
+        self.assertIs(m2.c[1].body.arg(0), m2.e[1])
+        self.assertIs(m2.e[1].expr.arg(1).arg(0), m2.x[1])
+        self.assertFalse(m2.cl[1].active)
+        self.assertTrue(m2.cl[2].active)
+        self.assertEqual(m2.o.sense, maximize)
+        self.assertEqual(value(m2.e[1]), value(m.e[1]))
+        self.assertEqual(len(m2.c_skip), 0)
+
+    def test_big_integers(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[2**70, 1, -(2**64)])
+        m.p = Param(m.I, initialize=lambda m, i: 3 * i, mutable=True)
+        m.x = Var(initialize=2**63)
+        m.c = Constraint(expr=m.x * 2**80 <= 2**90)
+        m2 = self.round_trip(m)
+        self.assertEqual(list(m2.I), [2**70, 1, -(2**64)])
+        self.assertEqual(m2.p[2**70].value, 3 * 2**70)
+        self.assertIs(m2.p[2**70].value.__class__, int)
+        self.assertEqual(m2.x.value, 2**63)
+        self.assertEqual(m2.c.ub, 2**90)
+        self.assertIs(m2.c.ub.__class__, int)
+        self.assertEqual(str(m2.c.expr), str(m.c.expr))
+
+    def test_shared_subexpressions(self):
+        m = ConcreteModel()
+        m.x = Var()
+        e = m.x**2 + 1
+        m.c1 = Constraint(expr=e <= 1)
+        m.c2 = Constraint(expr=e >= 0)
+        m2 = self.round_trip(m)
+        self.assertIs(m2.c1.body, m2.c2.body)
+
+    def test_blocks_and_cuids(self):
+        m = self.build_model()
+        m2 = self.round_trip(m)
+        self.assertTrue(m2.b['a'].active)
+        self.assertFalse(m2.b['b'].active)
+        objs = list(m.component_objects(descend_into=True))
+        objs.extend(
+            m.component_data_objects(
+                (Var, Constraint, Objective, Expression, Block), descend_into=True
+            )
+        )
+        for obj in objs:
+            cuid = ComponentUID(obj)
+            obj2 = cuid.find_component_on(m2)
+            self.assertIsNotNone(obj2)
+            self.assertEqual(obj2.name, obj.name)
+            self.assertEqual(ComponentUID(obj2), cuid)
+
+    def test_unsupported_component(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.dual = Suffix()
+        fname = TempfileManager.create_tempfile(suffix='.pbin')
+        with self.assertRaisesRegex(
+            ValueError,
+            "Cannot save component 'dual': components of type Suffix are "
+            "not supported",
+        ):
+            save_model(m, fname)
+
+    def test_unsupported_expression(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.f = ExternalFunction(library='unknown.so', function='f')
+        m.c = Constraint(expr=m.f(m.x) <= 0)
+        del m.f
+        fname = TempfileManager.create_tempfile(suffix='.pbin')
+        with self.assertRaisesRegex(ValueError, "Cannot save expression node"):
+            save_model(m, fname)
+
+    def test_external_reference(self):
+        m = ConcreteModel()
+        other = ConcreteModel()
+        other.x = Var()
+        m.c = Constraint(expr=other.x <= 1)
+        fname = TempfileManager.create_tempfile(suffix='.pbin')
+        with self.assertRaisesRegex(
+            ValueError, "it references 'x' .* which is not a component"
+        ):
+            save_model(m, fname)
+
+    def test_not_a_model_file(self):
+        fname = TempfileManager.create_tempfile(suffix='.pbin')
+        with open(fname, 'wb') as FILE:
+            FILE.write(b'not a model')
+        with self.assertRaisesRegex(ValueError, "not a Pyomo binary model"):
+            load_model(fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
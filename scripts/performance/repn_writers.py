@@ -0,0 +1,341 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+"""Performance tests for the pyomo.repn writers
+
+This module contains pytest-based performance tests for the LP, MPS,
+NL, GAMS, and BARON writers and the LinearStandardFormCompiler, run
+against parameterized synthetic models:
+
+  - ``dense_lp``: a dense LP (every variable in every constraint)
+  - ``network_milp``: a sparse fixed-charge network flow MILP
+  - ``named_expr_nlp``: a large NLP built from named Expressions
+  - ``deep_nlp``: an NLP with deeply nested nonlinear expression trees
+
+The tests are intended to be run through the performance driver, which
+records the results (and the git branch / SHA) in a JSON file that can
+be compared against other commits::
+
+    python scripts/performance/main.py -d <results_dir> -m performance \\
+        scripts/performance/repn_writers.py
+    python scripts/performance/compare.py <base>.json <test>.json
+
+Each test records the model construction time (``build_time``), the
+writer time (``write_time``), the size of the generated file
+(``file_size``), the peak memory allocated while writing
+(``peak_memory``, in MB; measured in a separate run of the writer), and
+the time spent in each of the phases reported by the writer through the
+``pyomo.common.timing.writer`` logger (``phase: ...``).  The model size
+can be scaled through the ``PYOMO_REPN_PERF_SCALE`` environment variable
+(default: 1).
+
+"""
+
+import gc
+import logging
+import os
+import re
+import tracemalloc
+
+import pyomo.common.unittest as unittest
+from pyomo.common.tempfiles import TempfileManager
+from pyomo.common.timing import HierarchicalTimer
+from pyomo.environ import (
+    ConcreteModel,
+    Binary,
+    Constraint,
+    Expression,
+    NonNegativeReals,
+    Objective,
+    Param,
+    RangeSet,
+    Var,
+    exp,
+    log,
+)
+from pyomo.opt import ProblemFormat
+from pyomo.repn.plugins.standard_form import LinearStandardFormCompiler
+
+SCALE = float(os.environ.get('PYOMO_REPN_PERF_SCALE', 1))
+
+
+# The file format and extension for each writer.  The format must be
+# the one that model.write() infers from the extension (otherwise
+# model.write() warns that the file name does not match the format).
+_file_formats = {
+    'lp': (ProblemFormat.cpxlp, 'lp'),
+    'mps': (ProblemFormat.mps, 'mps'),
+    'nl': (ProblemFormat.nl, 'nl'),
+    'gams': (ProblemFormat.gams, 'gms'),
+    'bar': (ProblemFormat.bar, 'bar'),
+}
+
+
+def _size(n):
+    return max(1, int(n * SCALE))
+
+
+#
+# Synthetic model generators
+#
+
+
+def dense_lp(n_vars=None, n_cons=None):
+    """A dense LP: every variable appears in every constraint"""
+    n_vars = n_vars or _size(400)
+    n_cons = n_cons or _size(400)
+    m = ConcreteModel()
+    m.I = RangeSet(n_vars)
+    m.J = RangeSet(n_cons)
+    m.x = Var(m.I, bounds=(0, 10))
+    m.c = Constraint(
+        m.J, rule=lambda m, j: sum((i * j % 7 + 1) * m.x[i] for i in m.I) <= j
+    )
+    m.obj = Objective(expr=sum(i % 5 * m.x[i] for i in m.I))
+    return m
+
+
+def network_milp(n_nodes=None, degree=4):
+    """A sparse fixed-charge network flow MILP"""
+    n_nodes = n_nodes or _size(20000)
+    m = ConcreteModel()
+    m.N = RangeSet(0, n_nodes - 1)
+    m.A = [(i, (i + k) % n_nodes) for i in m.N for k in range(1, degree + 1)]
+    m.supply = Param(m.N, initialize=lambda m, i: (i % 3) - 1)
+    m.cap = Param(m.A, initialize=lambda m, i, j: 1 + (i + j) % 5)
+    m.flow = Var(m.A, domain=NonNegativeReals)
+    m.open = Var(m.A, domain=Binary)
+
+    m.out_arcs = {i: [] for i in m.N}
+    m.in_arcs = {i: [] for i in m.N}
+    for i, j in m.A:
+        m.out_arcs[i].append((i, j))
+        m.in_arcs[j].append((i, j))
+
+    m.balance = Constraint(
+        m.N,
+        rule=lambda m, n: sum(m.flow[a] for a in m.out_arcs[n])
+        - sum(m.flow[a] for a in m.in_arcs[n])
+        == m.supply[n],
+    )
+    m.capacity = Constraint(
+        m.A, rule=lambda m, i, j: m.flow[i, j] <= m.cap[i, j] * m.open[i, j]
+    )
+    m.obj = Objective(expr=sum(m.flow[a] + 10 * m.cap[a] * m.open[a] for a in m.A))
+    return m
+
+
+def named_expr_nlp(n=None):
+    """A large NLP built on (shared) named Expressions"""
+    n = n or _size(20000)
+    m = ConcreteModel()
+    m.I = RangeSet(n)
+    m.p = Param(m.I, initialize=lambda m, i: 1 + i % 3, mutable=True)
+    m.x = Var(m.I, bounds=(0.1, 10), initialize=1)
+    m.e = Expression(m.I, rule=lambda m, i: m.p[i] * m.x[i] ** 2 + log(m.x[i % n + 1]))
+    m.c = Constraint(
+        m.I, rule=lambda m, i: m.e[i] * m.e[i % n + 1] + exp(m.x[i] / 10) <= 50
+    )
+    m.obj = Objective(expr=sum(m.e[i] for i in m.I))
+    return m
+
+
+def deep_nlp(n=None, depth=20):
+    """An NLP with deeply nested nonlinear expression trees"""
+    n = n or _size(2000)
+    m = ConcreteModel()
+    m.I = RangeSet(n)
+    m.x = Var(m.I, bounds=(0.1, 10), initialize=1)
+
+    def c_rule(m, i):
+        e = m.x[i]
+        for k in range(depth):
+            x = m.x[(i + k) % n + 1]
+            e = log(1 + x**2) + x * exp(e / 10)
+        return e <= 100
+
+    m.c = Constraint(m.I, rule=c_rule)
+    m.obj = Objective(expr=sum(m.x[i] ** 2 for i in m.I))
+    return m
+
+
+#
+# Test harness
+#
+
+
+class _WriterPhaseHandler(logging.Handler):
+    """Collect the per-phase timing reported by the writers
+
+    The writers report the time spent in each phase through the
+    ``pyomo.common.timing.writer`` logger.  This handler accumulates
+    those (delta) times by the phase name.
+
+    """
+
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.phases = {}
+
+    def emit(self, record):
+        try:
+            fmt, data = record.msg.fmt, record.msg.data
+        except AttributeError:
+            return
+        if not fmt.startswith('[+'):
+            # Only record the deltas (not the cumulative times)
+            return
+        # Drop the formatted arguments from the message (e.g.,
+        # 'Constraint %s' or 'Categorized model variables: %s nnz')
+        name = 'phase: ' + re.split('[:%]', str(data[-1]))[0].strip()
+        self.phases[name] = self.phases.get(name, 0) + data[0]
+
+
+class WriterPerformanceBase(object):
+    """Common driver for the writer performance tests
+
+    Derived classes must define a ``build_model`` method returning the
+    model to write.
+
+    """
+
+    def setUp(self):
+        TempfileManager.push()
+        self.timer = HierarchicalTimer()
+        if getattr(self, 'testdata', None) is None:
+            # Not running under the performance driver
+            self.testdata = {}
+
+    def tearDown(self):
+        TempfileManager.pop(remove=True)
+
+    def _build(self):
+        self.timer.start('build')
+        model = self.build_model()
+        self.timer.stop('build')
+        self.testdata['build_time'] = self.timer.get_total_time('build')
+        return model
+
+    def run_writer(self, writer):
+        model = self._build()
+        fmt, ext = _file_formats[writer]
+        fname = TempfileManager.create_tempfile(suffix='.' + ext)
+        self._record_phases(lambda: model.write(fname, format=fmt))
+        self.testdata['file_size'] = os.path.getsize(fname)
+        self._record_memory(lambda: model.write(fname, format=fmt))
+
+    def run_standard_form(self):
+        model = self._build()
+        self._record_phases(lambda: LinearStandardFormCompiler().write(model))
+        self._record_memory(lambda: LinearStandardFormCompiler().write(model))
+
+    def _record_phases(self, write):
+        timing_logger = logging.getLogger('pyomo.common.timing.writer')
+        handler = _WriterPhaseHandler()
+        level = timing_logger.level
+        timing_logger.setLevel(logging.DEBUG)
+        timing_logger.addHandler(handler)
+        gc.collect()
+        try:
+            self.timer.start('write')
+            write()
+            self.timer.stop('write')
+        finally:
+            timing_logger.removeHandler(handler)
+            timing_logger.setLevel(level)
+        self.testdata['write_time'] = self.timer.get_total_time('write')
+        self.testdata.update(handler.phases)
+
+    def _record_memory(self, write):
+        gc.collect()
+        tracemalloc.start()
+        try:
+            write()
+            self.testdata['peak_memory'] = tracemalloc.get_traced_memory()[1] / 2**20
+        finally:
+            tracemalloc.stop()
+
+
+@unittest.pytest.mark.performance
+class TestDenseLP(WriterPerformanceBase, unittest.TestCase):
+    def build_model(self):
+        return dense_lp()
+
+    def test_lp(self):
+        self.run_writer('lp')
+
+    def test_mps(self):
+        self.run_writer('mps')
+
+    def test_nl(self):
+        self.run_writer('nl')
+
+    def test_gams(self):
+        self.run_writer('gams')
+
+    def test_baron(self):
+        self.run_writer('bar')
+
+    def test_standard_form(self):
+        self.run_standard_form()
+
+
+@unittest.pytest.mark.performance
+class TestNetworkMILP(WriterPerformanceBase, unittest.TestCase):
+    def build_model(self):
+        return network_milp()
+
+    def test_lp(self):
+        self.run_writer('lp')
+
+    def test_mps(self):
+        self.run_writer('mps')
+
+    def test_nl(self):
+        self.run_writer('nl')
+
+    def test_gams(self):
+        self.run_writer('gams')
+
+    def test_baron(self):
+        self.run_writer('bar')
+
+    def test_standard_form(self):
+        self.run_standard_form()
+
+
+@unittest.pytest.mark.performance
+class TestNamedExpressionNLP(WriterPerformanceBase, unittest.TestCase):
+    def build_model(self):
+        return named_expr_nlp()
+
+    def test_nl(self):
+        self.run_writer('nl')
+
+    def test_gams(self):
+        self.run_writer('gams')
+
+    def test_baron(self):
+        self.run_writer('bar')
+
+
+@unittest.pytest.mark.performance
+class TestDeepNLP(WriterPerformanceBase, unittest.TestCase):
+    def build_model(self):
+        return deep_nlp()
+
+    def test_nl(self):
+        self.run_writer('nl')
+
+    def test_gams(self):
+        self.run_writer('gams')
+
+    def test_baron(self):
+        self.run_writer('bar')